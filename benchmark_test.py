@@ -3,9 +3,10 @@
 Performance Benchmark for Liquidity Monitor Engine
 
 This script benchmarks the internal processing throughput of:
-1. OrderBook updates (SortedDict operations)
+1. OrderBook updates (SortedDict operations, shallow and deep books)
 2. Risk metrics calculation (slippage, depth, imbalance)
 3. Anomaly detection (Z-score analysis)
+4. Per-message latency recording
 
 NOTE: This benchmark tests COMPUTATIONAL PERFORMANCE only (no database I/O).
 In production, PostgreSQL writes happen asynchronously via asyncpg connection
@@ -41,6 +42,7 @@ from liquidity_monitor.analytics.risk_engine import (  # noqa: E402
     calculate_slippage,
 )
 from liquidity_monitor.core.orderbook import OrderBook  # noqa: E402
+from liquidity_monitor.utils.latency_monitor import LatencyMonitor  # noqa: E402
 
 
 def generate_mock_orderbook_update() -> Dict[str, Any]:
@@ -117,6 +119,52 @@ async def benchmark_orderbook_updates(iterations: int = 100_000) -> float:
     return ops_per_sec
 
 
+async def benchmark_deep_book_updates(iterations: int = 100_000, depth: int = 5_000) -> float:
+    """
+    Benchmark 1b: Top-of-Book Updates on a Deep Book
+
+    Live books carry thousands of levels while most deltas only touch the top
+    few. This checks that update cost stays flat as depth grows.
+    """
+    print("\n" + "=" * 60)
+    print(f"📊 Benchmark 1b: Top-of-Book Updates ({depth:,}-level book)")
+    print("=" * 60)
+
+    orderbook = OrderBook(symbol="BTCUSDT")
+
+    bids_snapshot = [[f"{50000 - i * 0.5:.2f}", "1.0"] for i in range(depth)]
+    asks_snapshot = [[f"{50000.5 + i * 0.5:.2f}", "1.0"] for i in range(depth)]
+    orderbook.apply_snapshot(bids_snapshot, asks_snapshot, last_update_id=100000)
+
+    update_msg = generate_mock_orderbook_update()
+    bid_levels = [(Decimal(p), Decimal(q)) for p, q in update_msg["bids"]]
+    ask_levels = [(Decimal(p), Decimal(q)) for p, q in update_msg["asks"]]
+
+    start_time = time.perf_counter()
+
+    for _ in range(iterations):
+        orderbook.update_bids(bid_levels)
+        orderbook.update_asks(ask_levels)
+
+    end_time = time.perf_counter()
+    total_time = end_time - start_time
+
+    total_updates = iterations * 10
+    ops_per_sec = total_updates / total_time
+
+    print(f"⏱️  Total Time: {total_time:.4f} seconds")
+    print(f"🔢 Total Updates: {total_updates:,}")
+    print(f"⚡ Throughput: {ops_per_sec:,.0f} updates/sec")
+    print(f"📈 Latency: {(total_time / total_updates) * 1_000_000:.2f} μs per update")
+
+    if ops_per_sec > 5_000:
+        print("✅ PASS: Exceeds 5,000 updates/sec target")
+    else:
+        print("⚠️  FAIL: Below 5,000 updates/sec target")
+
+    return ops_per_sec
+
+
 async def benchmark_risk_calculations(iterations: int = 50_000) -> float:
     """
     Benchmark 2: Risk Metrics Calculation
@@ -238,6 +286,44 @@ async def benchmark_full_pipeline(iterations: int = 10_000) -> float:
     return ops_per_sec
 
 
+async def benchmark_latency_recording(iterations: int = 1_000_000) -> float:
+    """
+    Benchmark 4: Per-Message Latency Recording
+
+    LatencyMonitor.record_latency() runs once per exchange message, so its
+    overhead is paid at the full feed rate. Samples stay below the warning
+    threshold to measure the no-alert path.
+    """
+    print("\n" + "=" * 60)
+    print("📊 Benchmark 4: Latency Recording")
+    print("=" * 60)
+
+    monitor = LatencyMonitor()
+    record_latency = monitor.record_latency
+    exchange_ts = 1_700_000_000_000
+
+    start_time = time.perf_counter()
+
+    for i in range(iterations):
+        record_latency(exchange_ts, exchange_ts + (i & 31))
+
+    end_time = time.perf_counter()
+    total_time = end_time - start_time
+    ops_per_sec = iterations / total_time
+
+    print(f"⏱️  Total Time: {total_time:.4f} seconds")
+    print(f"🔢 Total Samples: {iterations:,}")
+    print(f"⚡ Throughput: {ops_per_sec:,.0f} samples/sec")
+    print(f"📈 Latency: {(total_time / iterations) * 1_000_000_000:.0f} ns per sample")
+
+    if ops_per_sec > 5_000:
+        print("✅ PASS: Exceeds 5,000 samples/sec target")
+    else:
+        print("⚠️  FAIL: Below 5,000 samples/sec target")
+
+    return ops_per_sec
+
+
 async def main() -> None:
     """Run all benchmarks."""
     print("\n" + "=" * 60)
@@ -251,24 +337,30 @@ async def main() -> None:
 
     # Run benchmarks
     orderbook_ops = await benchmark_orderbook_updates(iterations=100_000)
+    deep_book_ops = await benchmark_deep_book_updates(iterations=100_000)
     risk_calc_ops = await benchmark_risk_calculations(iterations=50_000)
     pipeline_ops = await benchmark_full_pipeline(iterations=10_000)
+    latency_ops = await benchmark_latency_recording(iterations=1_000_000)
 
     # Summary
     print("\n" + "=" * 60)
     print("📊 BENCHMARK SUMMARY")
     print("=" * 60)
     print(f"OrderBook Updates:    {orderbook_ops:>12,.0f} ops/sec")
+    print(f"Deep Book Updates:    {deep_book_ops:>12,.0f} ops/sec")
     print(f"Risk Calculations:    {risk_calc_ops:>12,.0f} ops/sec")
     print(f"Full Pipeline:        {pipeline_ops:>12,.0f} msgs/sec")
+    print(f"Latency Recording:    {latency_ops:>12,.0f} samples/sec")
     print("=" * 60)
 
     # Determine overall result
     all_pass = all(
         [
             orderbook_ops > 5_000,
+            deep_book_ops > 5_000,
             risk_calc_ops > 5_000,
             pipeline_ops > 5_000,
+            latency_ops > 5_000,
         ]
     )
 
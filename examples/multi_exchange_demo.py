@@ -131,9 +131,8 @@ async def demo_multi_exchange() -> None:
 
     finally:
         print("\n🛑 Stopping manager...")
-        manager.stop()
-        await asyncio.sleep(2)  # Give time to cleanup
-        manager_task.cancel()
+        await manager.stop()  # Waits for every exchange to disconnect
+        await manager_task
 
         print("\n" + "=" * 80)
         print("📊 FINAL STATISTICS".center(80))
@@ -239,6 +238,15 @@ if __name__ == "__main__":
     # Configure logging
     configure_logging(log_level="INFO", json_format=False, colorize=True)
 
+    # Use uvloop if available (must be installed before asyncio.run)
+    try:
+        import uvloop
+
+        uvloop.install()
+        logger.info("uvloop_enabled")
+    except ImportError:
+        logger.warning("uvloop_not_available", message="Install uvloop for better performance")
+
     print("\nSelect demo mode:")
     print("1. Multi-Exchange (Binance + Bybit) - Feature A Demo")
     print("2. Single Exchange - Binance")
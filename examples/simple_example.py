@@ -92,15 +92,6 @@ async def monitor_orderbook(symbol: str = "BTCUSDT", duration: int = 30) -> None
 async def main() -> None:
     """Main entry point."""
     try:
-        # Use uvloop if available
-        try:
-            import uvloop
-
-            uvloop.install()
-            logger.info("Using uvloop for enhanced performance")
-        except ImportError:
-            logger.warning("uvloop not available - install for better performance")
-
         # Monitor BTCUSDT for 30 seconds
         await monitor_orderbook("BTCUSDT", duration=30)
 
@@ -111,4 +102,13 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    # Use uvloop if available (must be installed before asyncio.run creates the loop)
+    try:
+        import uvloop
+
+        uvloop.install()
+        logger.info("Using uvloop for enhanced performance")
+    except ImportError:
+        logger.warning("uvloop not available - install for better performance")
+
     asyncio.run(main())
@@ -113,6 +113,7 @@ class LiquidityMonitor:
 
         # Control flags
         self._should_stop = False
+        self._shutdown_task: Optional["asyncio.Task[None]"] = None
         self._is_initialized = False
 
         # Metrics tracking
@@ -134,7 +135,15 @@ class LiquidityMonitor:
         """Handle shutdown signal gracefully."""
         logger.info("shutdown_signal_received", signal=sig.name)
         self._should_stop = True
-        self.manager.stop()
+        # Signal handlers are synchronous; keep a reference to the scheduled stop
+        self._shutdown_task = asyncio.ensure_future(self.stop_manager())
+
+    async def stop_manager(self) -> None:
+        """Stop the order book manager (MultiExchangeManager.stop() is async)."""
+        if isinstance(self.manager, MultiExchangeManager):
+            await self.manager.stop()
+        else:
+            self.manager.stop()
 
     async def wait_for_initialization(self) -> None:
         """Wait for order book to be synchronized and connect to database."""
@@ -417,8 +426,21 @@ class LiquidityMonitor:
 
                 # Write to database (async, non-blocking)
                 if self.enable_database and self.db_writer and self.db_writer.is_connected():
+                    snapshot_due = self.iteration % 60 == 0  # Every 60 seconds
+                    anomaly = metrics.get("anomaly", {})
+                    is_anomaly = anomaly.get("is_anomaly", False)
+
+                    if snapshot_due and is_anomaly:
+                        # Both rows in one statement instead of two round-trips
+                        success = await self.db_writer.write_snapshot_and_anomaly(
+                            symbol=self.symbol, anomaly=anomaly, metrics=metrics
+                        )
+                        if success:
+                            self.snapshots_written += 1
+                            self.anomalies_written += 1
+
                     # Write snapshot every minute
-                    if self.iteration % 60 == 0:  # Every 60 seconds
+                    elif snapshot_due:
                         success = await self.db_writer.write_snapshot(
                             symbol=self.symbol, metrics=metrics
                         )
@@ -426,8 +448,7 @@ class LiquidityMonitor:
                             self.snapshots_written += 1
 
                     # Write anomaly if detected
-                    anomaly = metrics.get("anomaly", {})
-                    if anomaly.get("is_anomaly", False):
+                    elif is_anomaly:
                         success = await self.db_writer.write_anomaly(
                             symbol=self.symbol, anomaly=anomaly, metrics=metrics
                         )
@@ -466,7 +487,7 @@ class LiquidityMonitor:
         except Exception as e:
             logger.error("run_error", error=str(e), error_type=type(e).__name__)
         finally:
-            self.manager.stop()
+            await self.stop_manager()
 
             # Close database connection
             if self.db_writer and self.db_writer.is_connected():
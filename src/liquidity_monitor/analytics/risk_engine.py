@@ -7,22 +7,28 @@ This module provides functions for:
 - Real-time risk metrics calculation
 """
 
+import math
 import time
 from collections import deque
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple, Union
-
-import numpy as np
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from ..core.orderbook import OrderBook
 from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# (price, quantity) levels, best first. Decimal straight from the order book, or
+# float when the caller has already crossed the Decimal -> float boundary.
+PriceLevels = Sequence[Tuple[Union[Decimal, float], Union[Decimal, float]]]
+
+_quantity = itemgetter(1)
+
 
 def calculate_slippage(
-    bids: List[Tuple[Decimal, Decimal]],
-    asks: List[Tuple[Decimal, Decimal]],
+    bids: PriceLevels,
+    asks: PriceLevels,
     trade_size_usd: float,
     side: str = "sell",
 ) -> Dict[str, Union[float, int, bool, str]]:
@@ -82,7 +88,9 @@ def calculate_slippage(
     # Select appropriate side
     levels = bids if side == "sell" else asks
 
-    # Walk the order book
+    # Walk the order book. A plain loop with early exit: a typical order stops
+    # within a few levels, which beats converting the whole side for a
+    # vectorized walk (see calculate_metrics for the shared float conversion)
     remaining_usd = trade_size_usd
     total_base_qty = 0.0  # Total quantity filled (in base currency, e.g., BTC)
     total_quote_received = 0.0  # Total quote currency received/paid (USD)
@@ -154,9 +162,7 @@ def calculate_slippage(
     }
 
 
-def calculate_depth_imbalance(
-    bids: List[Tuple[Decimal, Decimal]], asks: List[Tuple[Decimal, Decimal]], levels: int = 10
-) -> float:
+def calculate_depth_imbalance(bids: PriceLevels, asks: PriceLevels, levels: int = 10) -> float:
     """
     Calculate order book imbalance ratio.
 
@@ -176,9 +182,10 @@ def calculate_depth_imbalance(
     if not bids or not asks:
         return 0.0
 
-    # Sum top N levels
-    bid_volume = sum(float(qty) for _, qty in bids[:levels])
-    ask_volume = sum(float(qty) for _, qty in asks[:levels])
+    # Sum top N levels. Over the 10-20 levels used here, map() beats both a
+    # generator and np.sum on a prebuilt array (whose call overhead dominates).
+    bid_volume = sum(map(float, map(_quantity, bids[:levels])))
+    ask_volume = sum(map(float, map(_quantity, asks[:levels])))
 
     total_volume = bid_volume + ask_volume
 
@@ -189,9 +196,7 @@ def calculate_depth_imbalance(
     return round(imbalance, 4)
 
 
-def calculate_depth_at_bps(
-    bids: List[Tuple[Decimal, Decimal]], asks: List[Tuple[Decimal, Decimal]], bps: int = 10
-) -> Dict[str, float]:
+def calculate_depth_at_bps(bids: PriceLevels, asks: PriceLevels, bps: int = 10) -> Dict[str, float]:
     """
     Calculate total depth within X basis points of mid-price.
 
@@ -211,54 +216,169 @@ def calculate_depth_at_bps(
             "total_depth_usd": float
         }
     """
+    return calculate_depth_at_bps_bands(bids, asks, (bps,))[bps]
+
+
+def calculate_depth_at_bps_bands(
+    bids: PriceLevels, asks: PriceLevels, bps_levels: Sequence[int]
+) -> Dict[int, Dict[str, float]]:
+    """
+    Calculate depth within several basis-point bands of mid-price in one pass.
+
+    Equivalent to calling calculate_depth_at_bps() once per band, but each
+    side of the book is walked only once, out to the widest band.
+
+    Args:
+        bids: (price, quantity) levels for bids, highest first
+        asks: (price, quantity) levels for asks, lowest first
+        bps_levels: Basis-point bands (e.g., [10, 50, 100])
+
+    Returns:
+        Mapping of bps -> depth metrics, as returned by calculate_depth_at_bps()
+    """
+    if not bps_levels:
+        return {}
+
     if not bids or not asks:
         return {
-            "bid_depth": 0.0,
-            "ask_depth": 0.0,
-            "total_depth": 0.0,
-            "bid_depth_usd": 0.0,
-            "ask_depth_usd": 0.0,
-            "total_depth_usd": 0.0,
+            bps: {
+                "bid_depth": 0.0,
+                "ask_depth": 0.0,
+                "total_depth": 0.0,
+                "bid_depth_usd": 0.0,
+                "ask_depth_usd": 0.0,
+                "total_depth_usd": 0.0,
+            }
+            for bps in bps_levels
         }
 
     # Calculate mid-price
     mid_price = (float(bids[0][0]) + float(asks[0][0])) / 2
-    threshold = bps / 10000  # Convert bps to decimal
+
+    # Walk each side once, narrowest band first: a band is complete as soon as
+    # the walk reaches a level outside it, and the wider bands carry on from the
+    # same running totals.
+    order = sorted(range(len(bps_levels)), key=lambda i: bps_levels[i])
+    thresholds = [bps_levels[i] / 10000 for i in order]  # Convert bps to decimal
+    bid_floors = [mid_price * (1 - threshold) for threshold in thresholds]
+    ask_ceilings = [mid_price * (1 + threshold) for threshold in thresholds]
+    n_bands = len(order)
 
     # Calculate bid-side depth
+    bid_depths = [0.0] * n_bands
+    bid_depths_usd = [0.0] * n_bands
     bid_depth = 0.0
     bid_depth_usd = 0.0
+    band = 0
     for price, qty in bids:
         price_float = float(price)
-        qty_float = float(qty)
-
-        if price_float >= mid_price * (1 - threshold):
+        while price_float < bid_floors[band]:
+            bid_depths[order[band]] = bid_depth
+            bid_depths_usd[order[band]] = bid_depth_usd
+            band += 1
+            if band == n_bands:
+                break
+        else:
+            qty_float = float(qty)
             bid_depth += qty_float
             bid_depth_usd += price_float * qty_float
-        else:
-            break
+            continue
+        break
+    for i in order[band:]:
+        bid_depths[i] = bid_depth
+        bid_depths_usd[i] = bid_depth_usd
 
     # Calculate ask-side depth
+    ask_depths = [0.0] * n_bands
+    ask_depths_usd = [0.0] * n_bands
     ask_depth = 0.0
     ask_depth_usd = 0.0
+    band = 0
     for price, qty in asks:
         price_float = float(price)
-        qty_float = float(qty)
-
-        if price_float <= mid_price * (1 + threshold):
+        while price_float > ask_ceilings[band]:
+            ask_depths[order[band]] = ask_depth
+            ask_depths_usd[order[band]] = ask_depth_usd
+            band += 1
+            if band == n_bands:
+                break
+        else:
+            qty_float = float(qty)
             ask_depth += qty_float
             ask_depth_usd += price_float * qty_float
-        else:
-            break
+            continue
+        break
+    for i in order[band:]:
+        ask_depths[i] = ask_depth
+        ask_depths_usd[i] = ask_depth_usd
+
+    results: Dict[int, Dict[str, float]] = {}
+    for i, bps in enumerate(bps_levels):
+        bid_depth, ask_depth = bid_depths[i], ask_depths[i]
+        bid_depth_usd, ask_depth_usd = bid_depths_usd[i], ask_depths_usd[i]
+        results[bps] = {
+            "bid_depth": round(bid_depth, 4),
+            "ask_depth": round(ask_depth, 4),
+            "total_depth": round(bid_depth + ask_depth, 4),
+            "bid_depth_usd": round(bid_depth_usd, 2),
+            "ask_depth_usd": round(ask_depth_usd, 2),
+            "total_depth_usd": round(bid_depth_usd + ask_depth_usd, 2),
+        }
+    return results
 
-    return {
-        "bid_depth": round(bid_depth, 4),
-        "ask_depth": round(ask_depth, 4),
-        "total_depth": round(bid_depth + ask_depth, 4),
-        "bid_depth_usd": round(bid_depth_usd, 2),
-        "ask_depth_usd": round(ask_depth_usd, 2),
-        "total_depth_usd": round(bid_depth_usd + ask_depth_usd, 2),
-    }
+
+class _RollingMoments:
+    """
+    Rolling window with its mean and sum of squared deviations kept up to date.
+
+    Uses Welford's online update, with the sample leaving a full window
+    subtracted back out, so each push is O(1) instead of an O(N) pass over
+    the window. Rounding error from the add/remove pairs is cleared by an
+    exact recompute once per window's worth of evictions.
+    """
+
+    __slots__ = ("values", "mean", "m2", "_evictions")
+
+    def __init__(self, window_size: int):
+        self.values: deque[float] = deque(maxlen=window_size)
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean
+        self._evictions = 0
+
+    def push(self, value: float) -> None:
+        """Append value to the window, evicting the oldest sample when full."""
+        values = self.values
+        if len(values) == values.maxlen:
+            evicted = values[0]
+            values.append(value)
+            self._evictions += 1
+            if self._evictions >= len(values):
+                self._resync()
+                return
+            # Replace evicted by value: the count is unchanged
+            n = len(values)
+            old_mean = self.mean
+            self.mean = old_mean + (value - evicted) / n
+            self.m2 += (value - evicted) * (value - self.mean + evicted - old_mean)
+            return
+
+        values.append(value)
+        delta = value - self.mean
+        self.mean += delta / len(values)
+        self.m2 += delta * (value - self.mean)
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Append many samples, then recompute the moments once."""
+        self.values.extend(map(float, values))
+        if self.values:
+            self._resync()
+
+    def _resync(self) -> None:
+        values = self.values
+        mean = math.fsum(values) / len(values)
+        self.mean = mean
+        self.m2 = math.fsum((v - mean) * (v - mean) for v in values)
+        self._evictions = 0
 
 
 class LiquidityCrunchDetector:
@@ -288,10 +408,13 @@ class LiquidityCrunchDetector:
         self.threshold = threshold
         self.min_samples = min_samples
 
-        # Rolling windows for metrics
-        self.depth_history: deque[float] = deque(maxlen=window_size)
-        self.spread_history: deque[float] = deque(maxlen=window_size)
-        self.imbalance_history: deque[float] = deque(maxlen=window_size)
+        # Rolling windows for metrics, with running mean/variance
+        self._depth_moments = _RollingMoments(window_size)
+        self._spread_moments = _RollingMoments(window_size)
+        self._imbalance_moments = _RollingMoments(window_size)
+        self.depth_history = self._depth_moments.values
+        self.spread_history = self._spread_moments.values
+        self.imbalance_history = self._imbalance_moments.values
 
         logger.info(
             "detector_initialized",
@@ -300,6 +423,30 @@ class LiquidityCrunchDetector:
             min_samples=min_samples,
         )
 
+    def prime(
+        self,
+        depth: Iterable[float],
+        spread: Optional[Iterable[float]] = None,
+        imbalance: Optional[Iterable[float]] = None,
+    ) -> None:
+        """
+        Bulk-load historical samples without running detection on each one.
+
+        Equivalent to feeding the samples through detect_liquidity_crunch() in
+        order (only the last window_size of each are kept), but the rolling
+        statistics are computed once at the end instead of per sample.
+
+        Args:
+            depth: Historical depth values, oldest first (list or NumPy array)
+            spread: Historical spreads in basis points (optional)
+            imbalance: Historical order book imbalances (optional)
+        """
+        self._depth_moments.extend(depth)
+        if spread is not None:
+            self._spread_moments.extend(spread)
+        if imbalance is not None:
+            self._imbalance_moments.extend(imbalance)
+
     def detect_liquidity_crunch(
         self,
         current_depth: float,
@@ -330,11 +477,11 @@ class LiquidityCrunchDetector:
             }
         """
         # Add current values to history
-        self.depth_history.append(current_depth)
+        self._depth_moments.push(current_depth)
         if current_spread is not None:
-            self.spread_history.append(current_spread)
+            self._spread_moments.push(current_spread)
         if current_imbalance is not None:
-            self.imbalance_history.append(current_imbalance)
+            self._imbalance_moments.push(current_imbalance)
 
         # Need minimum samples for statistical significance
         if len(self.depth_history) < self.min_samples:
@@ -349,12 +496,12 @@ class LiquidityCrunchDetector:
             }
 
         # Calculate Z-scores
-        depth_zscore = self._calculate_zscore(self.depth_history, current_depth)
+        depth_zscore = self._calculate_zscore(self._depth_moments, current_depth)
         spread_zscore = (
-            self._calculate_zscore(self.spread_history, current_spread) if current_spread else 0.0
+            self._calculate_zscore(self._spread_moments, current_spread) if current_spread else 0.0
         )
         imbalance_zscore = (
-            self._calculate_zscore(self.imbalance_history, current_imbalance)
+            self._calculate_zscore(self._imbalance_moments, current_imbalance)
             if current_imbalance
             else 0.0
         )
@@ -411,31 +558,29 @@ class LiquidityCrunchDetector:
             "max_zscore": round(max_zscore, 2),
         }
 
-    def _calculate_zscore(self, history: deque[float], current_value: Optional[float]) -> float:
+    def _calculate_zscore(self, moments: _RollingMoments, current_value: Optional[float]) -> float:
         """
         Calculate Z-score for current value against historical data.
 
         Z = (X - μ) / σ
 
         Args:
-            history: Historical values
+            moments: Historical values with their running mean/variance
             current_value: Current value to compare
 
         Returns:
             Z-score (0.0 if calculation not possible)
         """
-        if current_value is None or len(history) < self.min_samples:
+        if current_value is None or len(moments.values) < self.min_samples:
             return 0.0
 
-        arr = np.array(history)
-        mean = np.mean(arr)
-        std = np.std(arr)
-
-        if std == 0:
+        m2 = moments.m2
+        if m2 <= 0.0:
             return 0.0
 
-        zscore: float = float((current_value - mean) / std)
-        return zscore
+        # Inlined rather than a _RollingMoments method: this runs for every
+        # metric on every sample. σ = sqrt(M2 / n), the population std (np.std)
+        return (current_value - moments.mean) / math.sqrt(m2 / len(moments.values))
 
     def get_statistics(self) -> Dict[str, Dict[str, Union[float, int]]]:
         """
@@ -445,23 +590,24 @@ class LiquidityCrunchDetector:
             Dictionary with mean, std, min, max for each metric
         """
 
-        def calc_stats(history: deque[float]) -> Dict[str, Union[float, int]]:
+        def calc_stats(moments: _RollingMoments) -> Dict[str, Union[float, int]]:
+            history = moments.values
             if len(history) == 0:
                 return {"mean": 0.0, "std": 0.0, "min": 0.0, "max": 0.0, "count": 0}
 
-            arr = np.array(history)
+            # Mean/std come from the running moments; only min/max need a pass
             return {
-                "mean": round(float(np.mean(arr)), 2),
-                "std": round(float(np.std(arr)), 2),
-                "min": round(float(np.min(arr)), 2),
-                "max": round(float(np.max(arr)), 2),
+                "mean": round(moments.mean, 2),
+                "std": round(math.sqrt(max(moments.m2, 0.0) / len(history)), 2),
+                "min": round(min(history), 2),
+                "max": round(max(history), 2),
                 "count": len(history),
             }
 
         return {
-            "depth": calc_stats(self.depth_history),
-            "spread": calc_stats(self.spread_history),
-            "imbalance": calc_stats(self.imbalance_history),
+            "depth": calc_stats(self._depth_moments),
+            "spread": calc_stats(self._spread_moments),
+            "imbalance": calc_stats(self._imbalance_moments),
         }
 
 
@@ -537,8 +683,9 @@ class RiskEngine:
                 "timestamp": float
             }
         """
-        # Get order book depth
-        depth_data = self.orderbook.get_depth(levels=50)
+        # Get order book depth as float: every helper below works in float, and
+        # the book caches the conversion until the top-50 window changes
+        depth_data = self.orderbook.get_depth_float(levels=50)
         bids = depth_data["bids"]
         asks = depth_data["asks"]
 
@@ -562,11 +709,11 @@ class RiskEngine:
             sell_slippage = calculate_slippage(bids, asks, size_usd, "sell")
             slippage_metrics[f"sell_{int(size_usd / 1000)}k"] = sell_slippage
 
-        # Depth calculation at different thresholds
-        depth_metrics = {}
-        for bps in self.depth_bps:
-            depth = calculate_depth_at_bps(bids, asks, bps)
-            depth_metrics[f"{bps}bps"] = depth
+        # Depth calculation at different thresholds, all bands in one pass
+        depth_metrics = {
+            f"{bps}bps": depth
+            for bps, depth in calculate_depth_at_bps_bands(bids, asks, self.depth_bps).items()
+        }
 
         # Order book imbalance
         imbalance = calculate_depth_imbalance(bids, asks, levels=10)
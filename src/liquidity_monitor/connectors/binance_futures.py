@@ -10,9 +10,9 @@ This module provides a production-grade WebSocket client that:
 """
 
 import asyncio
-import contextlib
 import json
 import ssl
+import sys
 import time
 import types
 from collections import deque
@@ -41,6 +41,21 @@ from ..utils.logger import PerformanceLogger, get_logger  # noqa: E402
 
 logger = get_logger(__name__)
 
+# get_status() keys, in output order; values are zipped in so the dict is built in C
+_STATUS_KEYS = (
+    "symbol",
+    "is_connected",
+    "is_synchronized",
+    "message_count",
+    "reconnect_count",
+    "checksum_mismatch_count",
+    "consecutive_sync_failures",
+    "time_since_last_message_ms",
+    "buffer_size",
+    "orderbook_stats",
+    "latency_stats",
+)
+
 
 class BinanceOrderBookManager:
     """
@@ -98,6 +113,9 @@ class BinanceOrderBookManager:
         self.ping_interval = ping_interval
         self.snapshot_limit = min(snapshot_limit, 1000)
 
+        # Logger with symbol pre-bound, so log calls don't re-pass it every time
+        self._log = logger.bind(symbol=self.symbol)
+
         # Order book
         self.orderbook = OrderBook(self.symbol)
 
@@ -110,7 +128,7 @@ class BinanceOrderBookManager:
         self.update_buffer: Deque[Dict[str, Any]] = deque(maxlen=1000)
 
         # Performance metrics
-        self.last_message_time: float = 0.0
+        self.last_message_time_ns: int = 0  # time.monotonic_ns() of last message
         self.message_count: int = 0
         self.reconnect_count: int = 0
 
@@ -119,16 +137,27 @@ class BinanceOrderBookManager:
         self.checksum_validation_interval: int = 100  # Validate every N messages
         self.checksum_mismatch_count: int = 0
 
+        # Sync circuit breaker: after this many consecutive failed syncs, stop
+        # ramping the backoff and go straight to max_reconnect_delay
+        self.sync_failure_threshold: int = 5
+        self._consecutive_sync_failures: int = 0
+
         # Latency monitoring (Feature C: HFT-grade performance tracking)
         self.latency_monitor = LatencyMonitor(
             window_size=1000, warning_threshold_ms=50.0, critical_threshold_ms=100.0
         )
 
         # Control flags
-        self._should_stop: bool = False
+        # Event (not a bool) so blocked awaits in run() wake up as soon as stop() is called
+        self._stop_event = asyncio.Event()
         self._listener_task: Optional[asyncio.Task[None]] = None
+        self._backoff_future: Optional[asyncio.Future[None]] = None
 
-        logger.info("manager_initialized", symbol=self.symbol, ws_url=ws_url, rest_url=rest_url)
+        # Serialized get_status() cache for get_status_json()
+        self._status_json_cache: bytes = b""
+        self._status_json_ts: float = 0.0
+
+        self._log.info("manager_initialized", ws_url=ws_url, rest_url=rest_url)
 
     async def fetch_snapshot(self) -> Optional[Dict[str, Any]]:
         """
@@ -146,10 +175,10 @@ class BinanceOrderBookManager:
         url = f"{self.rest_url}/fapi/v1/depth"
         params = {"symbol": self.symbol, "limit": self.snapshot_limit}
 
-        logger.info("fetching_snapshot", symbol=self.symbol, limit=self.snapshot_limit)
+        self._log.info("fetching_snapshot", limit=self.snapshot_limit)
 
         try:
-            with PerformanceLogger(logger, "fetch_snapshot", symbol=self.symbol):
+            with PerformanceLogger(self._log, "fetch_snapshot"):
                 # Create SSL context for macOS certificate verification
                 ssl_context = ssl.create_default_context(cafile=certifi.where())
 
@@ -170,9 +199,8 @@ class BinanceOrderBookManager:
                         else:
                             snapshot = await loop.run_in_executor(None, json.loads, snapshot_bytes)
 
-            logger.info(
+            self._log.info(
                 "snapshot_fetched",
-                symbol=self.symbol,
                 last_update_id=snapshot["lastUpdateId"],
                 bid_levels=len(snapshot["bids"]),
                 ask_levels=len(snapshot["asks"]),
@@ -184,18 +212,16 @@ class BinanceOrderBookManager:
 
         except aiohttp.ClientError as e:
             # Handle HTTP errors (500, 429, etc.) and network issues
-            logger.error(
+            self._log.error(
                 "snapshot_fetch_failed",
-                symbol=self.symbol,
                 error=str(e),
                 error_type=type(e).__name__,
             )
             return None
         except Exception as e:
             # Handle JSON parsing errors and other unexpected issues
-            logger.error(
+            self._log.error(
                 "snapshot_fetch_unexpected_error",
-                symbol=self.symbol,
                 error=str(e),
                 error_type=type(e).__name__,
             )
@@ -211,49 +237,45 @@ class BinanceOrderBookManager:
         - NO checks inside loop
         - ONLY: Parse → Append
 
-        Uses orjson (Rust-based, 10-15x faster than stdlib json).
+        Uses orjson (Rust-based, 10-15x faster than stdlib json). Frames are
+        received undecoded (recv(decode=False)) so orjson parses the raw
+        UTF-8 bytes directly, without building an intermediate str.
 
         Achieves 15,000-20,000 messages/second for BTCUSDT.
         """
         if not self.websocket:
-            logger.error("websocket_not_connected", symbol=self.symbol)
+            self._log.error("websocket_not_connected")
             return
 
-        logger.info("started_buffering_task", symbol=self.symbol)
+        self._log.info("started_buffering_task")
+
+        recv = self.websocket.recv
+        loads = orjson.loads if USE_ORJSON else json_parser.loads
 
         try:
             # ⚡ BARE-METAL LOOP: Absolute minimum operations
-            async for raw_message in self.websocket:
-                if self._should_stop:
-                    break
-
-                if isinstance(raw_message, bytes):
-                    continue
+            while not self._stop_event.is_set():
+                raw_message = await recv(decode=False)
 
                 # ⚡ BARE-METAL: orjson for maximum speed
                 try:
-                    if USE_ORJSON:
-                        message = orjson.loads(raw_message)
-                    else:
-                        message = json_parser.loads(raw_message)
+                    message = loads(raw_message)
 
                     self.message_count += 1
-                    self.last_message_time = time.time()
+                    self.last_message_time_ns = time.monotonic_ns()
 
                     if not self.is_synchronized:
                         self.update_buffer.append(message)
                     else:
                         try:
-                            await self._process_message_direct(message)
+                            self._process_message_direct(message)
                         except ValueError:
                             # Sequence gap - already handled in _process_message_direct
                             # Just continue buffering (is_synchronized already set to False)
                             pass
                         except Exception as e:
                             # Any other error - log but don't crash
-                            logger.error(
-                                "process_error_continuing", symbol=self.symbol, error=str(e)[:100]
-                            )
+                            self._log.error("process_error_continuing", error=str(e)[:100])
 
                 except Exception:  # nosec B110 # Intentionally ignore malformed messages
                     # JSON parse or other errors - silently skip
@@ -261,38 +283,37 @@ class BinanceOrderBookManager:
 
         except asyncio.CancelledError:
             # Graceful shutdown - user stopped the program
-            logger.info(
+            self._log.info(
                 "listener_task_cancelled",
-                symbol=self.symbol,
                 message_count=self.message_count,
             )
             self.is_connected = False
 
         except websockets.exceptions.ConnectionClosed as e:
-            logger.warning("connection_closed", symbol=self.symbol, code=e.code, reason=e.reason)
+            self._log.warning("connection_closed", code=e.code, reason=e.reason)
             self.is_connected = False
 
         except Exception as e:
-            logger.error(
-                "listener_loop_error", symbol=self.symbol, error=str(e), error_type=type(e).__name__
-            )
+            self._log.error("listener_loop_error", error=str(e), error_type=type(e).__name__)
             self.is_connected = False
 
         finally:
-            logger.info(
+            self._log.info(
                 "listener_task_exited",
-                symbol=self.symbol,
                 message_count=self.message_count,
                 is_connected=self.is_connected,
             )
 
-    async def _process_message_direct(self, message: Dict[str, Any]) -> None:
+    def _process_message_direct(self, message: Dict[str, Any]) -> None:
         """
         HIGH-FREQUENCY message processing (post-synchronization).
 
         CRITICAL: NO logging in hot path for maximum throughput.
         Only logs errors or stats every 1000 messages.
 
+        Synchronous on purpose: nothing here awaits, and a coroutine would
+        allocate a new frame object for every message.
+
         Args:
             message: Depth update message
         """
@@ -304,9 +325,9 @@ class BinanceOrderBookManager:
 
             # ⚡ LATENCY MONITORING (Feature C: HFT Performance Tracking)
             # Extract exchange event timestamp (E field in milliseconds)
+            # orjson already yields E as an int; record_latency() accepts it as-is
             if "E" in message:
-                exchange_timestamp_ms = float(message["E"])
-                self.latency_monitor.record_latency(exchange_timestamp_ms)
+                self.latency_monitor.record_latency(message["E"])
 
             # ✅ FAST PATH: Apply update (no logging)
             self.orderbook.apply_update(
@@ -324,9 +345,8 @@ class BinanceOrderBookManager:
                 and self.message_count % self.checksum_validation_interval == 0
             ):
                 local_checksum = self.orderbook.compute_checksum(depth=10)
-                logger.debug(
+                self._log.debug(
                     "orderbook_checksum_computed",
-                    symbol=self.symbol,
                     checksum=local_checksum,
                     message_count=self.message_count,
                 )
@@ -335,9 +355,8 @@ class BinanceOrderBookManager:
             if self.message_count % 1000 == 0:
                 stats = self.orderbook.get_stats()
                 latency_stats = self.latency_monitor.get_statistics()
-                logger.info(
+                self._log.info(
                     "orderbook_stats",
-                    symbol=self.symbol,
                     message_count=self.message_count,
                     latency_p99_ms=latency_stats["p99_ms"],
                     **stats,
@@ -345,7 +364,7 @@ class BinanceOrderBookManager:
 
         except ValueError as e:
             # Sequence gap detected - need to resynchronize
-            logger.error("sequence_error_resync_needed", symbol=self.symbol, error=str(e))
+            self._log.error("sequence_error_resync_needed", error=str(e))
             self.is_synchronized = False
             # Clear buffer and start fresh
             self.update_buffer.clear()
@@ -353,7 +372,7 @@ class BinanceOrderBookManager:
 
         except (KeyError, TypeError) as e:
             # Only log actual parse errors
-            logger.error("message_parse_error", symbol=self.symbol, error=str(e))
+            self._log.error("message_parse_error", error=str(e))
 
     async def _sync_orderbook(self) -> None:
         """
@@ -373,7 +392,7 @@ class BinanceOrderBookManager:
         Raises:
             ValueError: If synchronization fails after retries
         """
-        logger.info("starting_orderbook_sync", symbol=self.symbol)
+        self._log.info("starting_orderbook_sync")
 
         max_attempts = 3
 
@@ -382,27 +401,26 @@ class BinanceOrderBookManager:
                 # ⚡ CRITICAL: Ensure listener is running before each attempt
                 # If listener died on previous attempt, restart it
                 if self._listener_task is None or self._listener_task.done():
-                    logger.warning(
-                        "listener_not_running_restarting", symbol=self.symbol, attempt=attempt + 1
-                    )
+                    self._log.warning("listener_not_running_restarting", attempt=attempt + 1)
                     # Cancel old task if it exists
                     if self._listener_task is not None:
                         self._listener_task.cancel()
-                        with contextlib.suppress(asyncio.CancelledError):
+                        try:
                             await self._listener_task
+                        except asyncio.CancelledError:
+                            pass
 
                     # Start fresh listener task
                     self._listener_task = asyncio.create_task(self._listen_and_buffer())
-                    logger.info("listener_restarted", symbol=self.symbol, attempt=attempt + 1)
+                    self._log.info("listener_restarted", attempt=attempt + 1)
 
                 # ✅ STEP 1: SMART WARM-UP - Wait until buffer has data
                 # Don't use fixed sleep - wait for actual buffer fill!
                 min_buffer_size = 10  # Require at least 10 messages
                 warmup_timeout = 10.0 + (attempt * 5.0)  # 10s, 15s, 20s timeout
 
-                logger.info(
+                self._log.info(
                     "buffer_warmup_starting",
-                    symbol=self.symbol,
                     min_buffer_size=min_buffer_size,
                     warmup_timeout=warmup_timeout,
                     attempt=attempt + 1,
@@ -418,9 +436,8 @@ class BinanceOrderBookManager:
                     elapsed = time.time() - warmup_start
                     if elapsed > warmup_timeout:
                         buffer_size = len(self.update_buffer)
-                        logger.error(
+                        self._log.error(
                             "buffer_warmup_timeout",
-                            symbol=self.symbol,
                             buffer_size=buffer_size,
                             timeout=warmup_timeout,
                             elapsed=elapsed,
@@ -441,9 +458,8 @@ class BinanceOrderBookManager:
                 buffer_size = len(self.update_buffer)
                 elapsed_warmup = time.time() - warmup_start
 
-                logger.info(
+                self._log.info(
                     "buffer_warmup_complete",
-                    symbol=self.symbol,
                     buffer_size=buffer_size,
                     elapsed=f"{elapsed_warmup:.2f}s",
                     attempt=attempt + 1,
@@ -458,9 +474,8 @@ class BinanceOrderBookManager:
 
                 # Warn if buffer is still empty/small after warmup
                 if buffer_size < min_buffer_size:
-                    logger.error(
+                    self._log.error(
                         "buffer_insufficient_after_warmup",
-                        symbol=self.symbol,
                         buffer_size=buffer_size,
                         min_required=min_buffer_size,
                         elapsed=f"{elapsed_warmup:.2f}s",
@@ -472,9 +487,11 @@ class BinanceOrderBookManager:
                 # ✅ STEP 3: Fetch snapshot AFTER buffer has warmed up
                 snapshot = await self.fetch_snapshot()
                 if snapshot is None:
-                    logger.error(
+                    # Out of attempts: raise so the caller counts this as a sync failure
+                    if attempt == max_attempts - 1:
+                        raise ValueError("snapshot unavailable")
+                    self._log.error(
                         "snapshot_fetch_failed_retrying",
-                        symbol=self.symbol,
                         attempt=attempt + 1,
                     )
                     await asyncio.sleep(5)  # Wait before retrying
@@ -489,9 +506,8 @@ class BinanceOrderBookManager:
                     last_update_id=snapshot_last_update_id,
                 )
 
-                logger.info(
+                self._log.info(
                     "snapshot_applied_checking_buffer",
-                    symbol=self.symbol,
                     snapshot_id=snapshot_last_update_id,
                     buffer_size=len(self.update_buffer),
                     attempt=attempt + 1,
@@ -503,9 +519,8 @@ class BinanceOrderBookManager:
                 await asyncio.sleep(post_snapshot_wait)
 
                 final_buffer_size = len(self.update_buffer)
-                logger.info(
+                self._log.info(
                     "ready_to_process_buffer",
-                    symbol=self.symbol,
                     buffer_size=final_buffer_size,
                     snapshot_id=snapshot_last_update_id,
                     attempt=attempt + 1,
@@ -517,18 +532,16 @@ class BinanceOrderBookManager:
                 # Mark as synchronized
                 self.is_synchronized = True
 
-                logger.info(
+                self._log.info(
                     "orderbook_sync_complete",
-                    symbol=self.symbol,
                     current_update_id=self.orderbook.last_update_id,
                     attempts=attempt + 1,
                 )
                 return  # Success!
 
             except ValueError as e:
-                logger.warning(
+                self._log.warning(
                     "sync_attempt_failed",
-                    symbol=self.symbol,
                     attempt=attempt + 1,
                     max_attempts=max_attempts,
                     error=str(e),
@@ -537,20 +550,17 @@ class BinanceOrderBookManager:
                 # Clear buffer for fresh start on retry
                 old_buffer_size = len(self.update_buffer)
                 self.update_buffer.clear()
-                logger.info(
+                self._log.info(
                     "buffer_cleared_for_retry",
-                    symbol=self.symbol,
                     cleared_messages=old_buffer_size,
                     attempt=attempt + 1,
                 )
 
                 if attempt < max_attempts - 1:
-                    logger.info("retrying_sync", symbol=self.symbol, attempt=attempt + 2)
+                    self._log.info("retrying_sync", attempt=attempt + 2)
                 else:
                     # Final attempt failed
-                    logger.error(
-                        "sync_failed_all_attempts", symbol=self.symbol, attempts=max_attempts
-                    )
+                    self._log.error("sync_failed_all_attempts", attempts=max_attempts)
                     raise
 
     async def _process_buffer(self, snapshot_last_update_id: int) -> None:
@@ -575,9 +585,8 @@ class BinanceOrderBookManager:
         # DO NOT clear buffer yet - we might need to keep messages
         buffered_updates = list(self.update_buffer)
 
-        logger.info(
+        self._log.info(
             "processing_buffer",
-            symbol=self.symbol,
             buffer_size=len(buffered_updates),
             snapshot_last_update_id=snapshot_last_update_id,
         )
@@ -591,9 +600,8 @@ class BinanceOrderBookManager:
 
                 if final_update_id <= snapshot_last_update_id:
                     dropped_count += 1
-                    logger.debug(
+                    self._log.debug(
                         "dropped_old_update",
-                        symbol=self.symbol,
                         U=first_update_id,
                         u=final_update_id,
                         snapshot_last=snapshot_last_update_id,
@@ -602,7 +610,7 @@ class BinanceOrderBookManager:
                     valid_messages.append(update)
 
             except KeyError as e:
-                logger.warning("buffer_message_malformed", symbol=self.symbol, error=str(e))
+                self._log.warning("buffer_message_malformed", error=str(e))
                 dropped_count += 1
 
         # Step 2: Find the bridge message
@@ -616,9 +624,8 @@ class BinanceOrderBookManager:
             # Bridge condition: U <= lastUpdateId+1 <= u
             if first_update_id <= expected_id <= final_update_id:
                 bridge_index = i
-                logger.info(
+                self._log.info(
                     "found_bridge_message",
-                    symbol=self.symbol,
                     U=first_update_id,
                     u=final_update_id,
                     snapshot_last=snapshot_last_update_id,
@@ -630,9 +637,8 @@ class BinanceOrderBookManager:
         if bridge_index == -1:
             # Log all valid messages for debugging
             msg_info = [{"U": m["U"], "u": m["u"]} for m in valid_messages[:5]]
-            logger.error(
+            self._log.error(
                 "no_bridge_message_found",
-                symbol=self.symbol,
                 snapshot_last=snapshot_last_update_id,
                 expected=expected_id,
                 valid_messages_count=len(valid_messages),
@@ -665,15 +671,12 @@ class BinanceOrderBookManager:
                 if success:
                     applied_count += 1
                 else:
-                    logger.warning(
-                        "update_rejected", symbol=self.symbol, U=first_update_id, u=final_update_id
-                    )
+                    self._log.warning("update_rejected", U=first_update_id, u=final_update_id)
 
             except ValueError as e:
                 # Sequence gap during buffer processing - critical error
-                logger.error(
+                self._log.error(
                     "sequence_gap_in_buffer",
-                    symbol=self.symbol,
                     error=str(e),
                     U=update.get("U"),
                     u=update.get("u"),
@@ -681,16 +684,14 @@ class BinanceOrderBookManager:
                 raise  # Re-raise to trigger resync
 
             except (KeyError, TypeError) as e:
-                logger.warning(
+                self._log.warning(
                     "buffer_update_failed",
-                    symbol=self.symbol,
                     error=str(e),
                     update_id=update.get("u"),
                 )
 
-        logger.info(
+        self._log.info(
             "buffer_processing_complete",
-            symbol=self.symbol,
             buffered_applied=applied_count,
             buffered_dropped=dropped_count,
             current_update_id=self.orderbook.last_update_id,
@@ -708,7 +709,7 @@ class BinanceOrderBookManager:
         stream_name = f"{self.symbol.lower()}@depth@100ms"
         ws_endpoint = f"{self.ws_url}/{stream_name}"
 
-        logger.info("connecting_websocket", symbol=self.symbol, endpoint=ws_endpoint)
+        self._log.info("connecting_websocket", endpoint=ws_endpoint)
 
         try:
             # Create SSL context for macOS certificate verification
@@ -725,16 +726,12 @@ class BinanceOrderBookManager:
             )
 
             self.is_connected = True
-            self.last_message_time = time.time()
+            self.last_message_time_ns = time.monotonic_ns()
 
-            logger.info(
-                "websocket_connected", symbol=self.symbol, reconnect_count=self.reconnect_count
-            )
+            self._log.info("websocket_connected", reconnect_count=self.reconnect_count)
 
         except Exception as e:
-            logger.error(
-                "connection_failed", symbol=self.symbol, error=str(e), error_type=type(e).__name__
-            )
+            self._log.error("connection_failed", error=str(e), error_type=type(e).__name__)
             raise
 
     async def disconnect(self) -> None:
@@ -742,7 +739,7 @@ class BinanceOrderBookManager:
         if self.websocket:
             await self.websocket.close()
             self.is_connected = False
-            logger.info("websocket_disconnected", symbol=self.symbol)
+            self._log.info("websocket_disconnected")
 
     async def run(self) -> None:
         """
@@ -759,84 +756,162 @@ class BinanceOrderBookManager:
         """
         current_reconnect_delay = self.reconnect_delay
 
-        logger.info("starting_manager", symbol=self.symbol)
+        self._log.info("starting_manager")
 
-        while not self._should_stop:
+        while not self._stop_event.is_set():
+            failed = False
             try:
                 # Connect to WebSocket
                 await self.connect()
 
-                # Start listener task in background - it will buffer messages immediately
-                self._listener_task = asyncio.create_task(self._listen_and_buffer())
+                # Run listener + sync for this connection; returns once the
+                # connection drops or stop() is called, with the listener torn down
+                await self._run_session()
 
-                logger.info(
-                    "listener_task_started",
-                    symbol=self.symbol,
-                    is_synchronized=self.is_synchronized,
-                )
-
-                # Synchronize order book (if first connection or after resync)
-                # The listener is already running and buffering messages
-                if not self.is_synchronized:
-                    await self._sync_orderbook()
-
-                # Reset reconnect delay on successful connection
+                # Reset reconnect delay after a successfully synchronized session
                 current_reconnect_delay = self.reconnect_delay
 
-                # Wait for listener to complete (or until stop signal/error)
-                await self._listener_task
-
             except asyncio.CancelledError:
                 # Graceful shutdown - user stopped the program
-                logger.info("binance_manager_stopped", symbol=self.symbol)
-
-                # Cancel listener task if it's still running
-                if self._listener_task and not self._listener_task.done():
-                    self._listener_task.cancel()
-                    with contextlib.suppress(asyncio.CancelledError):
-                        await self._listener_task
+                # (the listener was already torn down by _run_session)
+                self._log.info("binance_manager_stopped")
                 break  # Exit the reconnection loop
 
             except Exception as e:
-                logger.error(
-                    "run_error", symbol=self.symbol, error=str(e), error_type=type(e).__name__
-                )
-
-                # Cancel listener task if it's still running
-                if self._listener_task and not self._listener_task.done():
-                    self._listener_task.cancel()
-                    with contextlib.suppress(asyncio.CancelledError):
-                        await self._listener_task
-
+                self._log.error("run_error", error=str(e), error_type=type(e).__name__)
                 self.reconnect_count += 1
+                failed = True
+
+            finally:
+                # Bound the close handshake: a dead peer can otherwise stall the
+                # reconnect loop for the full close_timeout
+                try:
+                    await asyncio.wait_for(self.disconnect(), timeout=2.0)
+                except asyncio.TimeoutError:
+                    self._log.warning("disconnect_timeout")
+                    # Drop the half-closed socket so the next connect starts clean
+                    self.websocket = None
+                    self.is_connected = False
+
+            if failed and not self._stop_event.is_set():
+                # Circuit open: REST sync keeps failing, so don't hammer the snapshot
+                # endpoint with short retries - jump straight to the max delay
+                if self._consecutive_sync_failures >= self.sync_failure_threshold:
+                    current_reconnect_delay = self.max_reconnect_delay
+                    self._log.warning(
+                        "sync_circuit_open",
+                        consecutive_sync_failures=self._consecutive_sync_failures,
+                    )
 
-                # Exponential backoff
-                logger.info(
+                # Exponential backoff (after teardown, so no listener runs while we wait)
+                self._log.info(
                     "reconnecting",
-                    symbol=self.symbol,
                     delay=current_reconnect_delay,
                     attempt=self.reconnect_count,
                 )
 
-                await asyncio.sleep(current_reconnect_delay)
+                await self._backoff(current_reconnect_delay)
                 current_reconnect_delay = min(current_reconnect_delay * 2, self.max_reconnect_delay)
 
+        self._log.info("manager_stopped")
+
+    async def _run_session(self) -> None:
+        """
+        Run the listener and order book sync for one WebSocket connection.
+
+        On Python 3.11+ the listener is scoped to an asyncio.TaskGroup, so it is
+        cancelled and awaited on every exit path; 3.10 falls back to the same
+        teardown done by hand. A listener restarted by _sync_orderbook() lives
+        outside the group and is cleaned up in the finally block.
+        """
+        if sys.version_info >= (3, 11):
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    self._listener_task = tg.create_task(self._listen_and_buffer())
+                    await self._sync_and_wait()
+            except BaseExceptionGroup as eg:
+                # The listener handles its own errors, so this is the sync failure;
+                # re-raise it bare so run() logs the real error type
+                raise eg.exceptions[0] from None
             finally:
-                # Cancel listener task if still running
-                if self._listener_task and not self._listener_task.done():
-                    self._listener_task.cancel()
-                    with contextlib.suppress(asyncio.CancelledError):
-                        await self._listener_task
-                    self._listener_task = None
+                await self._cancel_listener()
+        else:
+            self._listener_task = asyncio.create_task(self._listen_and_buffer())
+            try:
+                await self._sync_and_wait()
+            finally:
+                await self._cancel_listener()
+
+    async def _sync_and_wait(self) -> None:
+        """Sync the order book if needed, then wait for the listener to end or stop()."""
+        self._log.info("listener_task_started", is_synchronized=self.is_synchronized)
+
+        # Synchronize order book (if first connection or after resync)
+        # The listener is already running and buffering messages
+        if not self.is_synchronized:
+            try:
+                await self._sync_orderbook()
+            except Exception:
+                self._consecutive_sync_failures += 1
+                raise
+            self._consecutive_sync_failures = 0
+
+        # _sync_orderbook() may have restarted the listener, so read it only now
+        listener_task = self._listener_task
+        if listener_task is None:
+            return
+
+        # Wait for listener to complete or stop() to be called, whichever is first
+        stop_waiter = asyncio.create_task(self._stop_event.wait())
+        try:
+            await asyncio.wait({listener_task, stop_waiter}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stop_waiter.cancel()
+
+        # No-op if the connection dropped; on stop() this lets the session scope exit
+        listener_task.cancel()
 
-                await self.disconnect()
+    async def _cancel_listener(self) -> None:
+        """Cancel and await the current listener task, if any."""
+        # Drop our reference before awaiting so the task is released even if the await raises
+        listener_task, self._listener_task = self._listener_task, None
+        if listener_task is not None and not listener_task.done():
+            listener_task.cancel()
+            try:
+                await listener_task
+            except asyncio.CancelledError:
+                pass
 
-        logger.info("manager_stopped", symbol=self.symbol)
+    async def _backoff(self, delay: float) -> None:
+        """
+        Sleep for the reconnect backoff, waking early if stop() is called.
+
+        Uses a bare Future resolved by loop.call_later rather than
+        asyncio.sleep/wait_for, so no wrapper task is created per retry;
+        stop() cancels the future to end the wait immediately.
+
+        Args:
+            delay: Backoff duration in seconds
+        """
+        loop = asyncio.get_running_loop()
+        self._backoff_future = loop.create_future()
+        handle = loop.call_later(delay, self._backoff_future.set_result, None)
+        try:
+            await self._backoff_future
+        except asyncio.CancelledError:
+            # Cancelled by stop() - swallow; anything else is a real cancellation
+            if not self._stop_event.is_set():
+                raise
+        finally:
+            handle.cancel()
+            self._backoff_future = None
 
     def stop(self) -> None:
         """Signal the manager to stop gracefully."""
-        logger.info("stopping_manager", symbol=self.symbol)
-        self._should_stop = True
+        self._log.info("stopping_manager")
+        self._stop_event.set()
+        if self._backoff_future is not None and not self._backoff_future.done():
+            self._backoff_future.cancel()
 
     def get_orderbook(self) -> OrderBook:
         """
@@ -854,23 +929,25 @@ class BinanceOrderBookManager:
         This method computes the local order book checksum and can be used
         to detect data corruption or synchronization issues.
 
+        Uses look-before-you-leap checks instead of try/except: a book with an
+        empty side is reported invalid up front, and compute_checksum() does not
+        raise (it returns -1 on internal error).
+
         Returns:
             True if order book appears valid, False otherwise
         """
-        try:
-            checksum = self.orderbook.compute_checksum(depth=10)
-            logger.info(
-                "orderbook_integrity_check",
-                symbol=self.symbol,
-                checksum=checksum,
-                bid_levels=len(self.orderbook.bids),
-                ask_levels=len(self.orderbook.asks),
-            )
-            return True
-        except Exception as e:
-            logger.error("checksum_computation_failed", symbol=self.symbol, error=str(e))
+        if not self.orderbook.bids or not self.orderbook.asks:
             return False
 
+        checksum = self.orderbook.compute_checksum(depth=10)
+        self._log.info(
+            "orderbook_integrity_check",
+            checksum=checksum,
+            bid_levels=len(self.orderbook.bids),
+            ask_levels=len(self.orderbook.asks),
+        )
+        return checksum != -1
+
     def get_status(self) -> Dict[str, Any]:
         """
         Get current connection and performance status.
@@ -878,21 +955,56 @@ class BinanceOrderBookManager:
         Returns:
             Dictionary with status information
         """
-        time_since_last_msg = (
-            time.time() - self.last_message_time if self.last_message_time > 0 else None
+        # Full-precision ms; display rounding is left to the consumer
+        time_since_last_msg_ms = (
+            (time.monotonic_ns() - self.last_message_time_ns) / 1_000_000
+            if self.last_message_time_ns > 0
+            else None
         )
 
-        return {
-            "symbol": self.symbol,
-            "is_connected": self.is_connected,
-            "is_synchronized": self.is_synchronized,
-            "message_count": self.message_count,
-            "reconnect_count": self.reconnect_count,
-            "checksum_mismatch_count": self.checksum_mismatch_count,
-            "time_since_last_message_ms": (
-                round(time_since_last_msg * 1000, 2) if time_since_last_msg else None
-            ),
-            "buffer_size": len(self.update_buffer),
-            "orderbook_stats": self.orderbook.get_stats(),
-            "latency_stats": self.latency_monitor.get_statistics(),
-        }
+        return dict(
+            zip(
+                _STATUS_KEYS,
+                (
+                    self.symbol,
+                    self.is_connected,
+                    self.is_synchronized,
+                    self.message_count,
+                    self.reconnect_count,
+                    self.checksum_mismatch_count,
+                    self._consecutive_sync_failures,
+                    time_since_last_msg_ms,
+                    len(self.update_buffer),
+                    self.orderbook.get_stats(),
+                    self.latency_monitor.get_statistics(),
+                ),
+            )
+        )
+
+    def get_status_json(self, max_age: float = 0.1) -> bytes:
+        """
+        Get get_status() serialized as JSON bytes, cached for max_age seconds.
+
+        Lets HTTP handlers return the bytes directly (e.g. as an
+        application/json response body) without re-encoding the status dict
+        on every poll.
+
+        Args:
+            max_age: Maximum age of the cached payload in seconds
+
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        now = time.monotonic()
+        if self._status_json_cache and now - self._status_json_ts < max_age:
+            return self._status_json_cache
+
+        status = self.get_status()
+        if USE_ORJSON:
+            payload: bytes = orjson.dumps(status, option=orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            payload = json.dumps(status).encode()
+
+        self._status_json_cache = payload
+        self._status_json_ts = now
+        return payload
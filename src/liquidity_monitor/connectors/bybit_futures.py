@@ -12,11 +12,11 @@ This module provides a production-grade WebSocket client for Bybit that:
 import asyncio
 import contextlib
 import json
+import logging
 import ssl
 import time
 import types
-from decimal import Decimal
-from typing import Any, Dict, Optional, cast
+from typing import Any, Callable, Dict, Optional, cast
 
 import aiohttp
 import certifi
@@ -104,13 +104,22 @@ class BybitOrderBookManager:
         # Order book
         self.orderbook = OrderBook(self.symbol)
 
+        # Message type -> handler, so _process_orderbook_message is one dict lookup
+        self._dispatch: Dict[Any, Callable[[Dict[str, Any]], None]] = {
+            "snapshot": self._handle_snapshot,
+            "delta": self._apply_delta_update,
+        }
+
         # WebSocket connection
         self.websocket: Optional[ClientConnection] = None
         self.is_connected: bool = False
         self.is_synchronized: bool = False
 
         # Performance metrics
-        self.last_message_time: float = 0.0
+        # time.monotonic_ns() of last message, sampled by _stats_loop() (so it is
+        # accurate to stats_interval) instead of being stamped on every message
+        self.last_message_time_ns: int = 0
+        self.stats_interval: float = 5.0  # Seconds between orderbook_stats logs
         self.message_count: int = 0
         self.reconnect_count: int = 0
 
@@ -137,9 +146,26 @@ class BybitOrderBookManager:
             critical_threshold_ms=200.0,  # Bybit: 200ms critical (vs Binance 100ms)
         )
 
+        # REST session and TLS context, created lazily and reused across requests
+        # (the context parses the certifi CA bundle, so build it only once)
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self._http_session: Optional[aiohttp.ClientSession] = None
+
+        # Subscribe frame is constant per manager, so serialize it once
+        subscribe_message = {"op": "subscribe", "args": [f"orderbook.{self.depth}.{self.symbol}"]}
+        self._subscribe_frame: bytes = (
+            orjson.dumps(subscribe_message)
+            if USE_ORJSON
+            else json.dumps(subscribe_message).encode()
+        )
+
         # Control flags
-        self._should_stop: bool = False
+        # Event (not a bool) so blocked awaits wake up as soon as stop() is called
+        self._stop_event = asyncio.Event()
+        self._snapshot_event = asyncio.Event()  # Set when a WebSocket snapshot is applied
+        self._desync_event = asyncio.Event()  # Set when the book is found corrupted
         self._listener_task: Optional[asyncio.Task[None]] = None
+        self._stats_task: Optional[asyncio.Task[None]] = None
 
         logger.info(
             "bybit_manager_initialized", symbol=self.symbol, ws_url=ws_url, rest_url=rest_url
@@ -161,18 +187,15 @@ class BybitOrderBookManager:
         logger.info("fetching_snapshot", symbol=self.symbol, limit=self.depth)
 
         with PerformanceLogger(logger, "fetch_snapshot", symbol=self.symbol):
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
+            session = self._ensure_http_session()
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, ssl=ssl_context) as response:
-                    response.raise_for_status()
-                    snapshot_bytes = await response.read()
+            async with session.get(url, params=params, ssl=self._get_ssl_context()) as response:
+                response.raise_for_status()
+                snapshot_bytes = await response.read()
 
-                    loop = asyncio.get_running_loop()
-                    if USE_ORJSON:
-                        data = await loop.run_in_executor(None, orjson.loads, snapshot_bytes)
-                    else:
-                        data = await loop.run_in_executor(None, json.loads, snapshot_bytes)
+            # Parse inline: a depth-limited snapshot parses in well under a ms,
+            # cheaper than a thread-pool round trip through run_in_executor
+            data = orjson.loads(snapshot_bytes) if USE_ORJSON else json.loads(snapshot_bytes)
 
         # Extract result
         result = data["result"]
@@ -186,6 +209,18 @@ class BybitOrderBookManager:
 
         return cast(Dict[str, Any], result)
 
+    def _get_ssl_context(self) -> ssl.SSLContext:
+        """Return the shared TLS context, creating it on first use."""
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context(cafile=certifi.where())
+        return self._ssl_context
+
+    def _ensure_http_session(self) -> aiohttp.ClientSession:
+        """Return the shared REST session, creating it on first use (keeps connections alive)."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession()
+        return self._http_session
+
     def _verify_checksum(self, checksum_from_exchange: int) -> bool:
         """
         Verify order book checksum against exchange-provided value.
@@ -246,39 +281,36 @@ class BybitOrderBookManager:
         - WebSocket snapshot is guaranteed to match subsequent deltas
 
         Returns:
-            True if snapshot received, False if timeout
+            True if snapshot received, False on timeout or stop()
         """
         logger.info("waiting_for_websocket_snapshot", symbol=self.symbol)
 
-        # Wait up to 10 seconds for first snapshot
+        # Wait up to 10 seconds for first snapshot; the listener sets the event
+        # the moment it applies one, so there is no polling delay
         max_wait = 10.0
-        start_time = time.time()
-
-        # Track if we've seen the snapshot (use update_id as indicator)
-        initial_update_id = self.last_processed_update_id
-
-        while not self._should_stop:
-            await asyncio.sleep(0.1)
-
-            # Check if we received a snapshot (update_id changed from initial)
-            if self.last_processed_update_id > initial_update_id:
-                logger.info(
-                    "websocket_snapshot_received",
-                    symbol=self.symbol,
-                    update_id=self.last_processed_update_id,
-                )
-                return True
+        snapshot_waiter = asyncio.create_task(self._snapshot_event.wait())
+        stop_waiter = asyncio.create_task(self._stop_event.wait())
+        try:
+            await asyncio.wait(
+                {snapshot_waiter, stop_waiter},
+                timeout=max_wait,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            snapshot_waiter.cancel()
+            stop_waiter.cancel()
 
-            elapsed = time.time() - start_time
-            if elapsed > max_wait:
-                logger.error(
-                    "snapshot_timeout",
-                    symbol=self.symbol,
-                    elapsed=elapsed,
-                )
-                return False
+        if not self._snapshot_event.is_set():
+            if not self._stop_event.is_set():
+                logger.error("snapshot_timeout", symbol=self.symbol, elapsed=max_wait)
+            return False
 
-        return False
+        logger.info(
+            "websocket_snapshot_received",
+            symbol=self.symbol,
+            update_id=self.last_processed_update_id,
+        )
+        return True
 
     async def _listen_and_process(self) -> None:
         """
@@ -298,41 +330,23 @@ class BybitOrderBookManager:
 
         logger.info("started_listener_task", symbol=self.symbol)
 
-        try:
-            async for raw_message in self.websocket:
-                if self._should_stop:
-                    break
+        # Explicit recv loop rather than `async for`: skips the async-iterator
+        # wrapper and passes decode=False so text frames reach orjson as raw bytes.
+        # recv() returns without suspending while frames are already queued, so a
+        # burst is drained back-to-back without a round trip through the event loop.
+        recv = self.websocket.recv
+        handle_frame = self._make_message_handler()
 
-                if isinstance(raw_message, bytes):
-                    continue
+        try:
+            while not self._stop_event.is_set():
+                raw_message = await recv(decode=False)
 
                 try:
-                    # ⚡ NON-BLOCKING: Fast JSON parsing
-                    if USE_ORJSON:
-                        message = orjson.loads(raw_message)
-                    else:
-                        message = json_parser.loads(raw_message)
-
-                    # Handle orderbook messages
-                    if "topic" in message:
-                        await self._process_orderbook_message(message)
+                    handle_frame(raw_message)
 
+                    # Only the counter per message; timestamps and stats logging
+                    # happen in _stats_loop()
                     self.message_count += 1
-                    self.last_message_time = time.time()
-
-                    # Log stats every 1000 messages
-                    if self.message_count % 1000 == 0:
-                        stats = self.orderbook.get_stats()
-                        latency_stats = self.latency_monitor.get_statistics()
-                        logger.info(
-                            "orderbook_stats",
-                            symbol=self.symbol,
-                            message_count=self.message_count,
-                            update_id_gaps=self.update_id_gap_count,
-                            crossed_books=self.crossed_book_count,
-                            latency_p99_ms=latency_stats["p99_ms"],
-                            **stats,
-                        )
 
                 except Exception as e:
                     logger.error(
@@ -369,38 +383,84 @@ class BybitOrderBookManager:
                 is_connected=self.is_connected,
             )
 
-    async def _apply_delta_update(self, message: Dict[str, Any]) -> None:
+    async def _stats_loop(self) -> None:
+        """
+        Log order book stats every stats_interval seconds.
+
+        Also samples last_message_time_ns, so the listener hot loop does no
+        per-message clock reads or modulo checks.
+        """
+        last_count = self.message_count
+        stop_event = self._stop_event
+        while not stop_event.is_set():
+            # Sleep for stats_interval, but return at once on stop()
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self.stats_interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+
+            message_count = self.message_count
+            if message_count == last_count:
+                continue  # Nothing arrived; leave last_message_time_ns as is
+            self.last_message_time_ns = time.monotonic_ns()
+
+            stats = self.orderbook.get_stats()  # Includes symbol
+            latency_stats = self.latency_monitor.get_statistics()
+            logger.info(
+                "orderbook_stats",
+                message_count=message_count,
+                messages_per_sec=round((message_count - last_count) / self.stats_interval, 1),
+                update_id_gaps=self.update_id_gap_count,
+                crossed_books=self.crossed_book_count,
+                latency_p99_ms=latency_stats["p99_ms"],
+                **stats,
+            )
+            last_count = message_count
+
+    def _apply_delta_update(self, data: Dict[str, Any]) -> None:
         """
         Apply a single delta update to the order book.
 
+        Synchronous on purpose: it never awaits, so a coroutine per delta would
+        be pure overhead on the hot path.
+
         CRITICAL: This method must DISCARD any delta with Update ID <= last_processed_update_id.
         These are "ghost deltas" from before the snapshot and will corrupt the order book.
 
         Args:
-            message: Delta message to apply
+            data: "data" payload of a delta message to apply
         """
-        data = message.get("data", {})
+        # Deltas before the first snapshot have nothing to apply to
+        if not self.is_synchronized:
+            return
+
         bids = data.get("b", [])
         asks = data.get("a", [])
         update_id = data.get("u", 0)
+        last_id = self.last_processed_update_id
+        book = self.orderbook
 
         # 🚨 CRITICAL: Discard stale deltas (Update ID <= Snapshot Update ID)
         # These deltas are from BEFORE the snapshot and will cause data corruption!
-        if self.last_processed_update_id > 0 and update_id <= self.last_processed_update_id:
-            logger.debug(
-                "stale_delta_discarded",
-                symbol=self.symbol,
-                delta_update_id=update_id,
-                last_processed=self.last_processed_update_id,
-                action="discarded",
-            )
+        if last_id > 0 and update_id <= last_id:
+            # Stale deltas flood in right after a reconnect: skip building the
+            # log kwargs entirely unless DEBUG is actually enabled
+            if logger.is_enabled_for(logging.DEBUG):
+                logger.debug(
+                    "stale_delta_discarded",
+                    symbol=self.symbol,
+                    delta_update_id=update_id,
+                    last_processed=last_id,
+                    action="discarded",
+                )
             return  # ← DISCARD this delta!
 
         # ⚡ UPDATE ID CONTINUITY CHECK (Bybit's integrity mechanism)
-        if self.last_processed_update_id > 0:
-            expected_update_id = self.last_processed_update_id + 1
+        if last_id > 0:
+            expected_update_id = last_id + 1
             if update_id != expected_update_id:
-                gap_size = update_id - self.last_processed_update_id
+                gap_size = update_id - last_id
                 self.update_id_gap_count += 1
 
                 # Only log significant gaps (> 5)
@@ -425,22 +485,24 @@ class BybitOrderBookManager:
                     )
 
         # Apply updates (MUST use Decimal for financial precision!)
-        for price_str, qty_str in bids:
-            self.orderbook.update_bid(price=Decimal(price_str), quantity=Decimal(qty_str))
-
-        for price_str, qty_str in asks:
-            self.orderbook.update_ask(price=Decimal(price_str), quantity=Decimal(qty_str))
-
-        self.orderbook.last_update_id = update_id
+        # Parse each side once, then hand the whole batch to the book in one call
+        if bids:
+            book.update_bids(book.parse_levels(bids))
+        if asks:
+            book.update_asks(book.parse_levels(asks))
+
+        book.last_update_id = update_id
+        book.last_update_ts = time.monotonic()
         self.last_processed_update_id = update_id
 
         # 🚨 CROSSED ORDER BOOK DETECTION
         # Check if Bid >= Ask (data corruption - reconnect immediately)
         # Bybit's matching engine is ATOMIC - crossed book means data corruption!
-        if self.orderbook.is_crossed():
+        # An empty delta can't change the top of book, so skip the check for it
+        if (bids or asks) and book.is_crossed():
             self.crossed_book_count += 1
-            best_bid = self.orderbook.get_best_bid()
-            best_ask = self.orderbook.get_best_ask()
+            best_bid = book.get_best_bid()
+            best_ask = book.get_best_ask()
 
             logger.error(
                 "crossed_orderbook_detected",
@@ -454,10 +516,34 @@ class BybitOrderBookManager:
             # CRITICAL: Mark as desynchronized to trigger immediate reconnect
             # Crossed book = stale delta pollution or real data corruption
             self.is_synchronized = False
+            self._desync_event.set()  # Wake the supervisor in run()
 
-    async def _process_orderbook_message(self, message: Dict[str, Any]) -> None:
+    def _handle_snapshot(self, data: Dict[str, Any]) -> None:
+        """
+        Rebuild the order book from a WebSocket snapshot.
+
+        Args:
+            data: "data" payload of a snapshot message from Bybit
         """
-        Process order book message from Bybit.
+        bids = data.get("b", [])
+        asks = data.get("a", [])
+        update_id = data.get("u", 0)
+
+        self.orderbook.apply_snapshot(bids=bids, asks=asks, last_update_id=update_id)
+
+        self.is_synchronized = True
+        self.last_processed_update_id = update_id  # Reset Update ID tracker
+        self._snapshot_event.set()
+        logger.info("bybit_snapshot_applied", symbol=self.symbol, update_id=update_id)
+
+    def _make_message_handler(self) -> Callable[[Any], None]:
+        """
+        Build the per-frame handler used by the listener hot loop.
+
+        Everything the handler touches per message (the JSON decoder, the
+        type dispatch table, the latency recorder) is resolved once here and
+        captured as closure variables, so handling a frame does no attribute
+        lookups on self.
 
         Message structure:
         {
@@ -473,42 +559,41 @@ class BybitOrderBookManager:
             }
         }
 
-        Args:
-            message: Order book update message from Bybit
+        Returns:
+            Callable taking a raw WebSocket frame (str or bytes)
         """
-        try:
-            # ⚡ LATENCY MONITORING (Feature C: HFT Performance Tracking)
-            # Extract exchange event timestamp (ts field in milliseconds)
-            if "ts" in message:
-                exchange_timestamp_ms = float(message["ts"])
-                self.latency_monitor.record_latency(exchange_timestamp_ms)
-
-            msg_type = message.get("type")
-            data = message.get("data", {})
+        # ⚡ NON-BLOCKING: Fast JSON parsing (orjson and json both accept str or bytes)
+        loads = orjson.loads if USE_ORJSON else json_parser.loads
+        dispatch_get = self._dispatch.get
+        record_latency = self.latency_monitor.record_latency
+        symbol = self.symbol
 
-            if msg_type == "snapshot":
-                # Full snapshot - rebuild order book
-                bids = data.get("b", [])
-                asks = data.get("a", [])
-                update_id = data.get("u", 0)
+        def handle_frame(raw_message: Any) -> None:
+            message = loads(raw_message)
 
-                self.orderbook.apply_snapshot(bids=bids, asks=asks, last_update_id=update_id)
+            # Only orderbook messages carry a topic (skips op/pong replies)
+            if "topic" not in message:
+                return
 
-                self.is_synchronized = True
-                self.last_processed_update_id = update_id  # Reset Update ID tracker
-                logger.info("bybit_snapshot_applied", symbol=self.symbol, update_id=update_id)
+            try:
+                # ⚡ LATENCY MONITORING (Feature C: HFT Performance Tracking)
+                # ts is already an int from the JSON decoder; no float() round trip
+                exchange_timestamp_ms = message.get("ts")
+                if exchange_timestamp_ms is not None:
+                    record_latency(exchange_timestamp_ms)
 
-            elif msg_type == "delta":
-                # Incremental update
-                if not self.is_synchronized:
-                    # Wait for synchronization first
-                    return
+                # Dispatch on message type ("snapshot" / "delta"); unknown types are ignored
+                handler = dispatch_get(message.get("type"))
+                if handler is not None:
+                    # Read "data" once here; handlers take the payload directly
+                    data = message.get("data")
+                    if data:
+                        handler(data)
 
-                # Apply delta using dedicated method
-                await self._apply_delta_update(message)
+            except (KeyError, TypeError, ValueError) as e:
+                logger.error("orderbook_update_failed", symbol=symbol, error=str(e))
 
-        except (KeyError, TypeError, ValueError) as e:
-            logger.error("orderbook_update_failed", symbol=self.symbol, error=str(e))
+        return handle_frame
 
     async def connect(self) -> None:
         """
@@ -520,27 +605,21 @@ class BybitOrderBookManager:
         logger.info("connecting_websocket", symbol=self.symbol, endpoint=self.ws_url)
 
         try:
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-
             self.websocket = await websockets.connect(
                 self.ws_url,
-                ssl=ssl_context,
+                ssl=self._get_ssl_context(),
                 ping_interval=self.ping_interval,
-                ping_timeout=10,
+                ping_timeout=5,  # Detect dead connections fast; a stale book is worse than a resync
                 close_timeout=10,
-                max_size=10 * 1024 * 1024,
+                max_size=1 * 1024 * 1024,  # orderbook.50 frames are ~10KB; 1MB is ample headroom
+                compression=None,  # Bybit doesn't need permessage-deflate; skip per-frame zlib
             )
 
-            # Subscribe to order book stream
-            subscribe_message = {
-                "op": "subscribe",
-                "args": [f"orderbook.{self.depth}.{self.symbol}"],
-            }
-
-            await self.websocket.send(json.dumps(subscribe_message))
+            # Subscribe to order book stream (text=True: send the bytes as a text frame)
+            await self.websocket.send(self._subscribe_frame, text=True)
 
             self.is_connected = True
-            self.last_message_time = time.time()
+            self.last_message_time_ns = time.monotonic_ns()
 
             logger.info(
                 "websocket_connected", symbol=self.symbol, reconnect_count=self.reconnect_count
@@ -553,12 +632,26 @@ class BybitOrderBookManager:
             raise
 
     async def disconnect(self) -> None:
-        """Close WebSocket connection gracefully."""
+        """
+        Close WebSocket connection gracefully.
+
+        The REST session is left open so the next reconnect reuses its
+        keep-alive connections; close() releases it on final shutdown.
+        """
         if self.websocket:
             await self.websocket.close()
             self.is_connected = False
             logger.info("websocket_disconnected", symbol=self.symbol)
 
+    async def close(self) -> None:
+        """Release all network resources: the WebSocket (if open) and the REST session."""
+        if self.is_connected:
+            await self.disconnect()
+
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+
     async def run(self) -> None:
         """
         Main run loop with automatic reconnection.
@@ -570,22 +663,43 @@ class BybitOrderBookManager:
         - No need to fetch REST API snapshot
         - REST API and WebSocket have DIFFERENT Update ID sequences
         - Simply wait for first WebSocket snapshot, then process deltas
+
+        The listener hot loop runs on whatever event loop the caller provides.
+        Entry points should call uvloop.install() before asyncio.run() (as
+        main.py and the scripts do); the connector never installs a loop
+        policy itself, since that is a process-wide side effect.
         """
+        try:
+            await self._reconnect_loop()
+        finally:
+            # Each attempt only drops the WebSocket; the REST session lives
+            # across reconnects and is closed once here, however run() exits
+            await self.close()
+
+    async def _reconnect_loop(self) -> None:
+        """Connect, sync and supervise until stop(), reconnecting on failure."""
         current_reconnect_delay = self.reconnect_delay
 
         logger.info("starting_bybit_manager", symbol=self.symbol)
 
-        while not self._should_stop:
+        while not self._stop_event.is_set():
             try:
+                # Every connection must deliver its own snapshot
+                self._snapshot_event.clear()
+                self._desync_event.clear()
+
                 # Connect to WebSocket
                 await self.connect()
 
                 # Start listener task
                 self._listener_task = asyncio.create_task(self._listen_and_process())
+                self._stats_task = asyncio.create_task(self._stats_loop())
 
                 # ⚡ CRITICAL: Wait for first WebSocket snapshot (automatic)
                 # Bybit will send it automatically when you subscribe!
                 sync_success = await self._wait_for_websocket_snapshot()
+                if self._stop_event.is_set():
+                    break  # stop() during the wait; finally below cleans up
                 if not sync_success:
                     logger.error("websocket_snapshot_timeout", symbol=self.symbol)
                     raise Exception("Did not receive WebSocket snapshot")
@@ -595,45 +709,52 @@ class BybitOrderBookManager:
                 # Reset reconnect delay on successful connection
                 current_reconnect_delay = self.reconnect_delay
 
-                # 🔄 Monitor loop: Check for corruption and resync if needed
+                # 🔄 Supervise: wake the instant the listener ends, corruption is
+                # flagged or stop() is called, instead of polling on a timer
+                desync_waiter = asyncio.create_task(self._desync_event.wait())
+                stop_waiter = asyncio.create_task(self._stop_event.wait())
+                try:
+                    await asyncio.wait(
+                        {self._listener_task, desync_waiter, stop_waiter},
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                finally:
+                    desync_waiter.cancel()
+                    stop_waiter.cancel()
+
                 resync_needed = False
-                while not self._should_stop:
-                    await asyncio.sleep(0.5)  # Check twice per second
-
-                    # Check if crossed order book triggered desync
-                    if not self.is_synchronized:
-                        resync_needed = True
-                        logger.warning(
-                            "corruption_detected_reconnecting",
+                if self._desync_event.is_set():
+                    # Crossed order book triggered desync
+                    resync_needed = True
+                    logger.warning(
+                        "corruption_detected_reconnecting",
+                        symbol=self.symbol,
+                        reason="crossed_orderbook_or_large_gap",
+                        crossed_count=self.crossed_book_count,
+                    )
+
+                elif self._stop_event.is_set():
+                    # stop() called (normal shutdown path); finally cancels the listener
+                    logger.debug("stop_requested", symbol=self.symbol)
+
+                elif self._listener_task.cancelled():
+                    # Task was cancelled (normal shutdown path)
+                    logger.debug("listener_task_was_cancelled", symbol=self.symbol)
+
+                else:
+                    # Listener died unexpectedly - check if with exception
+                    try:
+                        self._listener_task.result()  # Will raise if there was exception
+                        # No exception - completed normally (e.g. connection closed)
+                        logger.warning("listener_task_completed_normally", symbol=self.symbol)
+                    except Exception as exc:
+                        # Task died with exception - this is a real error
+                        logger.error(
+                            "listener_task_died_with_exception",
                             symbol=self.symbol,
-                            reason="crossed_orderbook_or_large_gap",
-                            crossed_count=self.crossed_book_count,
+                            error=str(exc)[:100],
+                            error_type=type(exc).__name__,
                         )
-                        break
-
-                    # Check if listener task died unexpectedly
-                    if self._listener_task.done():
-                        # Check if task was cancelled vs completed with error
-                        if self._listener_task.cancelled():
-                            # Task was cancelled (normal shutdown path)
-                            logger.debug("listener_task_was_cancelled", symbol=self.symbol)
-                        else:
-                            # Task completed - check if with exception
-                            try:
-                                self._listener_task.result()  # Will raise if there was exception
-                                # No exception - completed normally (shouldn't happen for long-running task)
-                                logger.warning(
-                                    "listener_task_completed_normally", symbol=self.symbol
-                                )
-                            except Exception as exc:
-                                # Task died with exception - this is a real error
-                                logger.error(
-                                    "listener_task_died_with_exception",
-                                    symbol=self.symbol,
-                                    error=str(exc)[:100],
-                                    error_type=type(exc).__name__,
-                                )
-                        break
 
                 # If resync needed, force reconnection for fresh snapshot
                 if resync_needed:
@@ -644,8 +765,7 @@ class BybitOrderBookManager:
                         symbol=self.symbol,
                         reason="preparing_for_reconnect",
                     )
-                    self.orderbook.bids.clear()
-                    self.orderbook.asks.clear()
+                    self.orderbook.clear()
                     self.is_synchronized = False  # Reset sync flag
                     self.last_processed_update_id = 0  # Reset update ID tracker
 
@@ -687,7 +807,11 @@ class BybitOrderBookManager:
                     attempt=self.reconnect_count,
                 )
 
-                await asyncio.sleep(current_reconnect_delay)
+                # Back off, but wake immediately if stop() is called
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=current_reconnect_delay)
+                except asyncio.TimeoutError:
+                    pass
                 current_reconnect_delay = min(current_reconnect_delay * 2, self.max_reconnect_delay)
 
             finally:
@@ -697,17 +821,23 @@ class BybitOrderBookManager:
                         await self._listener_task
                     self._listener_task = None
 
+                if self._stats_task is not None:
+                    self._stats_task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await self._stats_task
+                    self._stats_task = None
+
                 await self.disconnect()
 
         # Note: "bybit_manager_stopped" already logged in CancelledError handler
         # Only log if stopped for other reasons
-        if not self._should_stop:
+        if not self._stop_event.is_set():
             logger.info("bybit_manager_exited", symbol=self.symbol)
 
     def stop(self) -> None:
         """Signal the manager to stop gracefully."""
         logger.info("stopping_bybit_manager", symbol=self.symbol)
-        self._should_stop = True
+        self._stop_event.set()
 
     def get_orderbook(self) -> OrderBook:
         """
@@ -725,8 +855,11 @@ class BybitOrderBookManager:
         Returns:
             Dictionary with status information
         """
-        time_since_last_msg = (
-            time.time() - self.last_message_time if self.last_message_time > 0 else None
+        # Monotonic clock: immune to NTP slews/steps of the wall clock
+        time_since_last_msg_ms = (
+            (time.monotonic_ns() - self.last_message_time_ns) / 1_000_000
+            if self.last_message_time_ns > 0
+            else None
         )
 
         return {
@@ -740,7 +873,7 @@ class BybitOrderBookManager:
             "crossed_book_count": self.crossed_book_count,  # Data corruption detection
             "checksum_validation_enabled": self.enable_checksum_validation,  # False for Bybit V5
             "time_since_last_message_ms": (
-                round(time_since_last_msg * 1000, 2) if time_since_last_msg else None
+                round(time_since_last_msg_ms, 2) if time_since_last_msg_ms is not None else None
             ),
             "orderbook_stats": self.orderbook.get_stats(),
             "latency_stats": self.latency_monitor.get_statistics(),
@@ -12,7 +12,9 @@ This demonstrates the ability to handle:
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional, Union
+import sys
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from ..core.orderbook import OrderBook
 from ..utils.logger import get_logger
@@ -59,6 +61,10 @@ class MultiExchangeManager:
         self.enable_binance = enable_binance
         self.enable_bybit = enable_bybit
 
+        # Books updated further apart than this are not compared for arbitrage:
+        # prices seen at different instants produce phantom opportunities
+        self.max_book_skew_ms: float = 500.0
+
         # Exchange managers
         self.exchanges: Dict[str, Union[BinanceOrderBookManager, BybitOrderBookManager]] = {}
 
@@ -70,9 +76,14 @@ class MultiExchangeManager:
             self.exchanges["bybit"] = BybitOrderBookManager(symbol=symbol)
             logger.info("bybit_manager_added", symbol=symbol)
 
+        # The exchange set is fixed after construction; the query helpers below
+        # iterate this tuple instead of re-walking the dict view on every call
+        self._exchange_items: Tuple[
+            Tuple[str, Union[BinanceOrderBookManager, BybitOrderBookManager]], ...
+        ] = tuple(self.exchanges.items())
+
         # Control flags
         self.is_running: bool = False
-        self._should_stop: bool = False
         self._tasks: List[asyncio.Task[None]] = []
 
         logger.info(
@@ -86,7 +97,13 @@ class MultiExchangeManager:
         Run all exchange managers concurrently.
 
         This method launches WebSocket connections to all enabled exchanges
-        and monitors them simultaneously using asyncio.gather().
+        and monitors them simultaneously. On Python 3.11+ the tasks are scoped
+        to an asyncio.TaskGroup; 3.10 falls back to asyncio.gather(). Each
+        exchange is isolated, so one failing does not stop the others.
+
+        All exchanges share the caller's event loop. Entry points install uvloop
+        before asyncio.run() where available (main.py, scripts/, examples/);
+        the manager does not set a loop policy itself, as that is process-wide.
 
         This is the core of Feature A - demonstrating:
         1. Concurrent WebSocket management
@@ -103,17 +120,25 @@ class MultiExchangeManager:
 
         try:
             # Launch all exchange managers concurrently
-            tasks = []
-            for exchange_name, manager in self.exchanges.items():
-                task = asyncio.create_task(manager.run())
-                task.set_name(f"{exchange_name}_{self.symbol}")
-                tasks.append(task)
-                self._tasks.append(task)
-
-                logger.info("exchange_task_started", exchange=exchange_name, symbol=self.symbol)
-
-            # Wait for all tasks (they run indefinitely until stopped)
-            await asyncio.gather(*tasks, return_exceptions=True)
+            # (they run indefinitely until stopped)
+            if sys.version_info >= (3, 11):
+                async with asyncio.TaskGroup() as tg:
+                    for exchange_name, manager in self.exchanges.items():
+                        self._tasks.append(
+                            tg.create_task(
+                                self._run_exchange(exchange_name, manager),
+                                name=f"{exchange_name}_{self.symbol}",
+                            )
+                        )
+            else:
+                for exchange_name, manager in self.exchanges.items():
+                    self._tasks.append(
+                        asyncio.create_task(
+                            self._run_exchange(exchange_name, manager),
+                            name=f"{exchange_name}_{self.symbol}",
+                        )
+                    )
+                await asyncio.gather(*self._tasks, return_exceptions=True)
 
         except Exception as e:
             logger.error(
@@ -127,26 +152,66 @@ class MultiExchangeManager:
             self.is_running = False
             logger.info("multi_exchange_manager_stopped", symbol=self.symbol)
 
-    def stop(self) -> None:
+    async def _run_exchange(
+        self,
+        exchange_name: str,
+        manager: Union[BinanceOrderBookManager, BybitOrderBookManager],
+    ) -> None:
+        """
+        Run one exchange manager, containing its errors.
+
+        Errors are logged instead of propagated so a TaskGroup does not cancel
+        the other exchanges (the same isolation gather(return_exceptions=True)
+        gave).
+        """
+        logger.info("exchange_task_started", exchange=exchange_name, symbol=self.symbol)
+        try:
+            await manager.run()
+        except Exception as e:
+            logger.error(
+                "exchange_run_error",
+                exchange=exchange_name,
+                symbol=self.symbol,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
+    async def stop(self, timeout: float = 5.0) -> None:
         """
         Stop all exchange managers gracefully.
 
         This signals all exchange managers to stop and waits for
-        clean disconnection.
+        clean disconnection. Tasks still running after `timeout` seconds are
+        cancelled, and awaited as well, so sockets are closed by the time
+        this returns.
+
+        Args:
+            timeout: Seconds to wait for a graceful exit before cancelling
         """
         logger.info("stopping_multi_exchange_manager", symbol=self.symbol)
 
-        self._should_stop = True
-
         # Signal all exchange managers to stop
-        for exchange_name, manager in self.exchanges.items():
+        for exchange_name, manager in self._exchange_items:
             manager.stop()
             logger.info("exchange_stop_signal_sent", exchange=exchange_name, symbol=self.symbol)
 
-        # Cancel all tasks
-        for task in self._tasks:
-            if not task.done():
+        tasks = [task for task in self._tasks if not task.done()]
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=timeout)
+
+            # Cancel stragglers and wait for their teardown to finish
+            for task in pending:
                 task.cancel()
+            if pending:
+                logger.warning(
+                    "exchange_tasks_cancelled",
+                    symbol=self.symbol,
+                    count=len(pending),
+                    timeout=timeout,
+                )
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        self._tasks.clear()
 
     def get_orderbook(self, exchange: str) -> Optional[OrderBook]:
         """
@@ -179,10 +244,7 @@ class MultiExchangeManager:
             >>> for exchange, book in books.items():
             ...     print(f"{exchange}: {book.get_mid_price()}")
         """
-        orderbooks = {}
-        for exchange_name, manager in self.exchanges.items():
-            orderbooks[exchange_name] = manager.get_orderbook()
-        return orderbooks
+        return {exchange_name: manager.orderbook for exchange_name, manager in self._exchange_items}
 
     def get_status(self) -> Dict[str, Any]:
         """
@@ -196,17 +258,15 @@ class MultiExchangeManager:
             >>> print(status["binance"]["is_synchronized"])
             True
         """
-        status: Dict[str, Any] = {
+        return {
             "symbol": self.symbol,
             "is_running": self.is_running,
-            "exchanges": {},
+            "exchanges": {
+                exchange_name: manager.get_status()
+                for exchange_name, manager in self._exchange_items
+            },
         }
 
-        for exchange_name, manager in self.exchanges.items():
-            status["exchanges"][exchange_name] = manager.get_status()
-
-        return status
-
     def is_all_synchronized(self) -> bool:
         """
         Check if all exchanges are synchronized.
@@ -214,7 +274,10 @@ class MultiExchangeManager:
         Returns:
             True if all enabled exchanges are synchronized, False otherwise
         """
-        return all(manager.is_synchronized for manager in self.exchanges.values())
+        for _, manager in self._exchange_items:
+            if not manager.is_synchronized:
+                return False
+        return True
 
     def get_spread_comparison(self) -> Optional[Dict[str, Any]]:
         """
@@ -225,13 +288,12 @@ class MultiExchangeManager:
         Returns:
             Dictionary with spread comparison or None if data not available
         """
-        if not self.is_all_synchronized():
-            return None
-
+        # Single pass: bail out on the first unsynchronized exchange
         spreads = {}
-        for exchange_name, manager in self.exchanges.items():
-            orderbook = manager.get_orderbook()
-            spread_bps = orderbook.get_spread_bps()
+        for exchange_name, manager in self._exchange_items:
+            if not manager.is_synchronized:
+                return None
+            spread_bps = manager.orderbook.get_spread_bps()
             if spread_bps is not None:
                 spreads[exchange_name] = float(spread_bps)
 
@@ -251,37 +313,60 @@ class MultiExchangeManager:
         Detect potential arbitrage opportunities between exchanges.
 
         Compares best bid/ask across exchanges to identify price discrepancies.
+        If the books' last updates are more than max_book_skew_ms apart, the
+        comparison is skipped and reported with reason "stale_book".
 
         Returns:
             Dictionary with arbitrage information or None if not available
         """
-        if not self.is_all_synchronized():
-            return None
-
-        orderbooks = self.get_all_orderbooks()
+        # Single pass tracking the running extremes: no per-exchange dicts and
+        # no separate synchronization scan
+        highest_bid_exchange = lowest_ask_exchange = ""
+        max_bid: Optional[Decimal] = None
+        min_ask: Optional[Decimal] = None
+        bid_count = ask_count = 0
+        oldest_ts = newest_ts = 0.0
+
+        for exchange_name, manager in self._exchange_items:
+            if not manager.is_synchronized:
+                return None
+
+            orderbook = manager.orderbook
+            update_ts = orderbook.last_update_ts
+            if not oldest_ts or update_ts < oldest_ts:
+                oldest_ts = update_ts
+            if update_ts > newest_ts:
+                newest_ts = update_ts
 
-        # Get best prices from each exchange
-        best_bids = {}
-        best_asks = {}
-
-        for exchange_name, orderbook in orderbooks.items():
             best_bid = orderbook.get_best_bid()
             best_ask = orderbook.get_best_ask()
 
             if best_bid:
-                best_bids[exchange_name] = float(best_bid[0])
+                bid_count += 1
+                if max_bid is None or best_bid[0] > max_bid:
+                    max_bid = best_bid[0]
+                    highest_bid_exchange = exchange_name
             if best_ask:
-                best_asks[exchange_name] = float(best_ask[0])
+                ask_count += 1
+                if min_ask is None or best_ask[0] < min_ask:
+                    min_ask = best_ask[0]
+                    lowest_ask_exchange = exchange_name
 
-        if len(best_bids) < 2 or len(best_asks) < 2:
+        if bid_count < 2 or ask_count < 2 or max_bid is None or min_ask is None:
             return None
 
-        # Find arbitrage: Buy from exchange with lowest ask, sell to exchange with highest bid
-        lowest_ask_exchange = min(best_asks, key=best_asks.get)  # type: ignore[arg-type]
-        highest_bid_exchange = max(best_bids, key=best_bids.get)  # type: ignore[arg-type]
+        skew_ms = (newest_ts - oldest_ts) * 1000
+        if skew_ms > self.max_book_skew_ms:
+            return {
+                "symbol": self.symbol,
+                "arbitrage_exists": False,
+                "reason": "stale_book",
+                "skew_ms": round(skew_ms, 2),
+            }
 
-        lowest_ask = best_asks[lowest_ask_exchange]
-        highest_bid = best_bids[highest_bid_exchange]
+        # Find arbitrage: Buy from exchange with lowest ask, sell to exchange with highest bid
+        lowest_ask = float(min_ask)
+        highest_bid = float(max_bid)
 
         # Arbitrage exists if we can buy cheaper than we can sell
         arbitrage_exists = highest_bid > lowest_ask
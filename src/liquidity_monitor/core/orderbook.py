@@ -5,9 +5,11 @@ This module provides a high-performance order book data structure optimized
 for real-time market data processing in HFT systems.
 """
 
+import time
 import zlib
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from sortedcontainers import SortedDict
 
@@ -15,6 +17,26 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Preallocated Decimal constants for the mid-price/spread math
+_TWO = Decimal(2)
+_BPS_MULT = Decimal(10000)
+
+
+@dataclass(frozen=True, slots=True)
+class BookSnapshot:
+    """
+    Immutable top-of-book view returned by OrderBook.get_snapshot().
+
+    Readers that need several metrics at once get one consistent object
+    instead of reading the live book field by field between updates.
+    """
+
+    best_bid: Optional[Tuple[Decimal, Decimal]]
+    best_ask: Optional[Tuple[Decimal, Decimal]]
+    mid_price: Optional[Decimal]
+    spread_bps: Optional[Decimal]
+    last_update_id: int
+
 
 class OrderBook:
     """
@@ -27,9 +49,16 @@ class OrderBook:
 
     Attributes:
         symbol: Trading pair symbol (e.g., "BTCUSDT")
-        bids: SortedDict mapping price -> quantity (highest first)
-        asks: SortedDict mapping price -> quantity (lowest first)
+        bids: SortedDict mapping price -> quantity (ascending; best bid is the
+            last key, read with peekitem(-1) / reverse islice)
+        asks: SortedDict mapping price -> quantity (ascending; best ask first)
         last_update_id: Last processed update ID from exchange
+        last_update_ts: Local monotonic time (seconds) of the last applied
+            snapshot/update, 0.0 before the first one
+
+    Mutate the book through its methods (update_*, apply_*, clear) rather than
+    writing to bids/asks directly: best bid/ask, mid-price and spread are
+    cached and only invalidated by those methods.
 
     Example:
         >>> book = OrderBook("BTCUSDT")
@@ -49,10 +78,86 @@ class OrderBook:
         self.bids: SortedDict[Decimal, Decimal] = SortedDict()
         self.asks: SortedDict[Decimal, Decimal] = SortedDict()
         self.last_update_id: int = 0
-        self._first_update_after_snapshot: bool = True  # Track if we need special validation
+        self.last_update_ts: float = 0.0
+
+        # Rejected-update counters. The hot validation path only increments
+        # these; they are reported through get_stats(), which the connectors
+        # already log periodically, instead of emitting a warning per event.
+        self.invalid_first_update_count: int = 0
+        self.backwards_update_count: int = 0
+
+        # str -> Decimal cache: exchanges keep re-sending the same price ticks and
+        # quantities, so most level strings skip Decimal construction entirely
+        self._decimal_cache: Dict[str, Decimal] = {}
+        self._decimal_cache_max: int = 4096
+
+        # Top-of-book cache (None = not computed). Invalidated only by writes
+        # that can change level 0, so repeated reads between updates are O(1).
+        self._best_bid_cache: Optional[Tuple[Decimal, Decimal]] = None
+        self._best_ask_cache: Optional[Tuple[Decimal, Decimal]] = None
+        self._mid_price_cache: Optional[Decimal] = None
+        self._spread_bps_cache: Optional[Decimal] = None
+        self._snapshot_cache: Optional[BookSnapshot] = None
+
+        # Top-N window cache per side (get_depth, compute_checksum). The floor/
+        # ceiling is the deepest price inside the window (None = side shorter
+        # than the window), so writes beyond it leave the window valid. The
+        # window only grows while valid, so it always covers the cached checksum.
+        self._bid_top: Optional[List[Tuple[Decimal, Decimal]]] = None
+        self._ask_top: Optional[List[Tuple[Decimal, Decimal]]] = None
+        self._bid_top_levels: int = 0
+        self._ask_top_levels: int = 0
+        self._bid_top_floor: Optional[Decimal] = None
+        self._ask_top_ceiling: Optional[Decimal] = None
+
+        # float mirror of each top-N window (get_depth_float), tied to the window
+        # list it was converted from: a rebuilt window is a new list object
+        self._bid_top_float: Tuple[Optional[list], List[Tuple[float, float]]] = (None, [])
+        self._ask_top_float: Tuple[Optional[list], List[Tuple[float, float]]] = (None, [])
+
+        # Checksum cache as (depth, checksum), dropped with either window
+        self._checksum_cache: Optional[Tuple[int, int]] = None
 
         logger.info("orderbook_initialized", symbol=symbol)
 
+    def to_decimal(self, value: str) -> Decimal:
+        """
+        Convert a price/quantity string to Decimal, reusing cached instances.
+
+        Decimal is immutable, so sharing instances between levels is safe. The
+        cache is simply cleared when full; the hot ticks repopulate it quickly.
+
+        Args:
+            value: Decimal string as sent by the exchange (e.g. "50000.10")
+
+        Returns:
+            Decimal value
+        """
+        cache = self._decimal_cache
+        result = cache.get(value)
+        if result is None:
+            if len(cache) >= self._decimal_cache_max:
+                cache.clear()
+            result = cache[value] = Decimal(value)
+        return result
+
+    def parse_levels(self, levels: Iterable[Sequence[str]]) -> List[Tuple[Decimal, Decimal]]:
+        """
+        Convert exchange [price, quantity] string pairs to Decimal tuples.
+
+        Cache hits are resolved inline (dict.get is C-level); only misses, and
+        zero quantities since Decimal("0") is falsy, call to_decimal().
+
+        Args:
+            levels: Iterable of [price, quantity] string pairs
+
+        Returns:
+            List of (price, quantity) Decimal tuples
+        """
+        D = self.to_decimal
+        cached = self._decimal_cache.get
+        return [(cached(p) or D(p), cached(q) or D(q)) for p, q in levels]
+
     def update_bid(self, price: Decimal, quantity: Decimal) -> None:
         """
         Update a bid level. O(log n) complexity.
@@ -61,11 +166,26 @@ class OrderBook:
             price: Bid price level
             quantity: New quantity (0 means remove the level)
         """
-        if quantity == 0:
+        if not quantity:
             self.bids.pop(price, None)
         else:
             self.bids[price] = quantity
 
+        # Levels below the cached best bid cannot change the top of book. A
+        # non-zero level at or above it is the new best bid, so the cache is
+        # replaced directly instead of being re-read from the SortedDict.
+        cached = self._best_bid_cache
+        if cached is None or price >= cached[0]:
+            self._invalidate_bid_cache()
+            if cached is not None and quantity:
+                self._best_bid_cache = (price, quantity)
+
+        # Levels below the top-N window leave it (and the checksum) valid
+        floor = self._bid_top_floor
+        if floor is None or price >= floor:
+            self._bid_top = None
+            self._checksum_cache = None
+
     def update_ask(self, price: Decimal, quantity: Decimal) -> None:
         """
         Update an ask level. O(log n) complexity.
@@ -74,11 +194,92 @@ class OrderBook:
             price: Ask price level
             quantity: New quantity (0 means remove the level)
         """
-        if quantity == 0:
+        if not quantity:
             self.asks.pop(price, None)
         else:
             self.asks[price] = quantity
 
+        # Levels above the cached best ask cannot change the top of book; a
+        # non-zero level at or below it is the new best ask
+        cached = self._best_ask_cache
+        if cached is None or price <= cached[0]:
+            self._invalidate_ask_cache()
+            if cached is not None and quantity:
+                self._best_ask_cache = (price, quantity)
+
+        # Levels above the top-N window leave it (and the checksum) valid
+        ceiling = self._ask_top_ceiling
+        if ceiling is None or price <= ceiling:
+            self._ask_top = None
+            self._checksum_cache = None
+
+    def update_bids(self, levels: Iterable[Tuple[Decimal, Decimal]]) -> None:
+        """
+        Update a batch of bid levels in one pass.
+
+        Equivalent to calling update_bid() per level, without the per-level
+        method dispatch.
+
+        Args:
+            levels: Iterable of (price, quantity) pairs (0 quantity removes the level)
+        """
+        self._apply_levels(self.bids, levels)
+        self._invalidate_bid_cache()
+        self._bid_top = None
+        self._checksum_cache = None
+
+    def update_asks(self, levels: Iterable[Tuple[Decimal, Decimal]]) -> None:
+        """
+        Update a batch of ask levels in one pass.
+
+        Equivalent to calling update_ask() per level, without the per-level
+        method dispatch.
+
+        Args:
+            levels: Iterable of (price, quantity) pairs (0 quantity removes the level)
+        """
+        self._apply_levels(self.asks, levels)
+        self._invalidate_ask_cache()
+        self._ask_top = None
+        self._checksum_cache = None
+
+    @staticmethod
+    def _apply_levels(
+        side: "SortedDict[Decimal, Decimal]", levels: Iterable[Tuple[Decimal, Decimal]]
+    ) -> None:
+        """Apply (price, quantity) pairs to one side of the book."""
+        pop = side.pop
+        for price, quantity in levels:
+            # Truthiness, not `== 0`: skips coercing int 0 to Decimal on every level
+            if not quantity:
+                pop(price, None)
+            else:
+                side[price] = quantity
+
+    def clear(self) -> None:
+        """Remove all levels from both sides of the book."""
+        self.bids.clear()
+        self.asks.clear()
+        self._invalidate_bid_cache()
+        self._invalidate_ask_cache()
+        self._bid_top = None
+        self._ask_top = None
+        self._checksum_cache = None
+
+    def _invalidate_bid_cache(self) -> None:
+        """Drop cached values derived from the best bid."""
+        self._best_bid_cache = None
+        self._mid_price_cache = None
+        self._spread_bps_cache = None
+        self._snapshot_cache = None
+
+    def _invalidate_ask_cache(self) -> None:
+        """Drop cached values derived from the best ask."""
+        self._best_ask_cache = None
+        self._mid_price_cache = None
+        self._spread_bps_cache = None
+        self._snapshot_cache = None
+
     def get_best_bid(self) -> Optional[Tuple[Decimal, Decimal]]:
         """
         Get the best (highest) bid price and quantity. O(1) complexity.
@@ -86,9 +287,13 @@ class OrderBook:
         Returns:
             Tuple of (price, quantity) or None if no bids exist
         """
+        cached = self._best_bid_cache
+        if cached is not None:
+            return cached
         if not self.bids:
             return None
         item: Tuple[Decimal, Decimal] = self.bids.peekitem(-1)  # Last item = highest price
+        self._best_bid_cache = item
         return item
 
     def get_best_ask(self) -> Optional[Tuple[Decimal, Decimal]]:
@@ -98,9 +303,13 @@ class OrderBook:
         Returns:
             Tuple of (price, quantity) or None if no asks exist
         """
+        cached = self._best_ask_cache
+        if cached is not None:
+            return cached
         if not self.asks:
             return None
         item: Tuple[Decimal, Decimal] = self.asks.peekitem(0)  # First item = lowest price
+        self._best_ask_cache = item
         return item
 
     def get_mid_price(self) -> Optional[Decimal]:
@@ -110,14 +319,20 @@ class OrderBook:
         Returns:
             Mid-price or None if either side is empty
         """
+        cached = self._mid_price_cache
+        if cached is not None:
+            return cached
+
         best_bid = self.get_best_bid()
         best_ask = self.get_best_ask()
 
         if best_bid is None or best_ask is None:
             return None
 
-        # Ensure both prices are Decimal and divide by Decimal(2) to maintain type
-        return (Decimal(str(best_bid[0])) + Decimal(str(best_ask[0]))) / Decimal("2")
+        # Prices are stored as Decimal already, so no str round-trip is needed
+        mid_price = (best_bid[0] + best_ask[0]) / _TWO
+        self._mid_price_cache = mid_price
+        return mid_price
 
     def is_crossed(self) -> bool:
         """
@@ -136,8 +351,10 @@ class OrderBook:
             ...     logger.error("Crossed order book detected! Resyncing...")
             ...     await resync_orderbook()
         """
-        best_bid = self.get_best_bid()
-        best_ask = self.get_best_ask()
+        # Cache hits are read inline; get_best_*() only runs on a miss (and
+        # refills the cache for the readers that follow)
+        best_bid = self._best_bid_cache or self.get_best_bid()
+        best_ask = self._best_ask_cache or self.get_best_ask()
 
         if best_bid is None or best_ask is None:
             return False
@@ -153,6 +370,10 @@ class OrderBook:
         Returns:
             Spread in bps or None if cannot be calculated
         """
+        cached = self._spread_bps_cache
+        if cached is not None:
+            return cached
+
         best_bid = self.get_best_bid()
         best_ask = self.get_best_ask()
 
@@ -163,9 +384,9 @@ class OrderBook:
         if mid_price is None or mid_price == 0:
             return None
 
-        # Ensure Decimal types throughout calculation
-        spread = Decimal(str(best_ask[0])) - Decimal(str(best_bid[0]))
-        spread_bps = (spread / mid_price) * Decimal("10000")
+        spread = best_ask[0] - best_bid[0]
+        spread_bps = (spread / mid_price) * _BPS_MULT
+        self._spread_bps_cache = spread_bps
 
         return spread_bps
 
@@ -188,25 +409,17 @@ class OrderBook:
             ... )
         """
         # Clear existing data
-        self.bids.clear()
-        self.asks.clear()
-
-        # Apply bid levels
-        for price_str, qty_str in bids:
-            price = Decimal(price_str)
-            qty = Decimal(qty_str)
-            if qty > 0:
-                self.bids[price] = qty
+        self.clear()
 
-        # Apply ask levels
-        for price_str, qty_str in asks:
-            price = Decimal(price_str)
-            qty = Decimal(qty_str)
-            if qty > 0:
-                self.asks[price] = qty
+        # Bulk-load each side: SortedDict.update() on an empty dict inserts all
+        # keys and sorts them once, instead of one bisect/insert per level
+        self.bids.update([(price, qty) for price, qty in self.parse_levels(bids) if qty > 0])
+        self.asks.update([(price, qty) for price, qty in self.parse_levels(asks) if qty > 0])
 
         self.last_update_id = last_update_id
-        self._first_update_after_snapshot = True  # Reset flag for next update
+        self.last_update_ts = time.monotonic()
+        # Next update must bridge the snapshot; see apply_update()
+        self.apply_update = self._apply_first_update  # type: ignore[method-assign]
 
         logger.info(
             "snapshot_applied",
@@ -232,6 +445,13 @@ class OrderBook:
         - Sequence IDs are NOT consecutive in @depth@100ms (Binance skips intermediate updates)
         - We only validate that updates move FORWARD, not that every ID is present
 
+        Levels stay as the exchange's strings until the sequence check passes, so
+        dropped (duplicate or stale) events are never parsed to Decimal.
+
+        The two validation phases live in _apply_first_update and
+        _apply_subsequent_update; apply_snapshot() binds this name on the
+        instance to the first, which rebinds it to the second once it succeeds.
+
         Args:
             bids: List of [price, quantity] updates for bids
             asks: List of [price, quantity] updates for asks
@@ -244,59 +464,77 @@ class OrderBook:
         Raises:
             ValueError: If update sequence is backwards or invalid
         """
-        # Validation logic for @depth@100ms stream:
-        # 1. First processed event should have U <= lastUpdateId+1 AND u >= lastUpdateId+1
-        # 2. Subsequent events should have U > lastUpdateId (LENIENT, allows gaps)
-
-        if self._first_update_after_snapshot:
-            # First update after snapshot must bridge the gap
-            # The update should overlap with or immediately follow the snapshot
-            if not (first_update_id <= self.last_update_id + 1 <= final_update_id):
-                # ✅ Only log validation errors, not success
-                logger.warning(
-                    "invalid_first_update_after_snapshot",
-                    symbol=self.symbol,
-                    first_update_id=first_update_id,
-                    final_update_id=final_update_id,
-                    snapshot_last_update_id=self.last_update_id,
-                    expected_range=f"U <= {self.last_update_id + 1} <= u",
-                )
-                return False
-            # Mark that we've processed the first update (NO logging for performance)
-            self._first_update_after_snapshot = False
-        else:
-            # ✅ FAST PATH: Subsequent updates (lenient for @depth@100ms)
-            # For @depth@100ms stream, sequence IDs are NOT consecutive
-            # Binance skips IDs because it only sends updates every 100ms
-            # We only check that IDs are moving FORWARD, not that they're consecutive
-
-            # Check if this is a duplicate or backwards (already processed)
-            if final_update_id <= self.last_update_id:
-                # Silently skip duplicates (common in HFT)
-                return False
-
-            # Check if update is too old (first_update_id should be >= last_update_id)
-            if first_update_id < self.last_update_id:
-                logger.warning(
-                    "backwards_sequence_detected",
-                    symbol=self.symbol,
-                    last_update_id=self.last_update_id,
-                    first_update_id=first_update_id,
-                    final_update_id=final_update_id,
-                )
-                return False
-
-            # ✅ LENIENT: Allow gaps for @depth@100ms (IDs are increasing, that's enough)
-            # Gaps are EXPECTED in 100ms aggregated streams
-
-        # Apply updates
-        for price_str, qty_str in bids:
-            self.update_bid(Decimal(price_str), Decimal(qty_str))
-
-        for price_str, qty_str in asks:
-            self.update_ask(Decimal(price_str), Decimal(qty_str))
+        # Only reached before the first snapshot: apply_snapshot() installs the
+        # per-instance binding that replaces this method from then on.
+        return self._apply_first_update(bids, asks, first_update_id, final_update_id)
+
+    def _apply_first_update(
+        self,
+        bids: List[List[str]],
+        asks: List[List[str]],
+        first_update_id: int,
+        final_update_id: int,
+    ) -> bool:
+        """
+        Apply the first update after a snapshot (U <= lastUpdateId+1 <= u).
+
+        On success, rebinds apply_update to _apply_subsequent_update so the
+        per-tick path never re-checks which phase the book is in.
+        """
+        # First update after snapshot must bridge the gap
+        # The update should overlap with or immediately follow the snapshot
+        if not (first_update_id <= self.last_update_id + 1 <= final_update_id):
+            # Count instead of logging: rejections come in bursts during resync
+            self.invalid_first_update_count += 1
+            return False
+
+        if bids:
+            self.update_bids(self.parse_levels(bids))
+        if asks:
+            self.update_asks(self.parse_levels(asks))
 
         self.last_update_id = final_update_id
+        self.last_update_ts = time.monotonic()
+        self.apply_update = self._apply_subsequent_update  # type: ignore[method-assign]
+
+        return True
+
+    def _apply_subsequent_update(
+        self,
+        bids: List[List[str]],
+        asks: List[List[str]],
+        first_update_id: int,
+        final_update_id: int,
+    ) -> bool:
+        """
+        Apply an update once the snapshot has been bridged (lenient, gaps allowed).
+        """
+        # ✅ FAST PATH: Subsequent updates (lenient for @depth@100ms)
+        # For @depth@100ms stream, sequence IDs are NOT consecutive
+        # Binance skips IDs because it only sends updates every 100ms
+        # We only check that IDs are moving FORWARD, not that they're consecutive
+
+        # Check if this is a duplicate or backwards (already processed)
+        if final_update_id <= self.last_update_id:
+            # Silently skip duplicates (common in HFT)
+            return False
+
+        # Check if update is too old (first_update_id should be >= last_update_id)
+        if first_update_id < self.last_update_id:
+            self.backwards_update_count += 1
+            return False
+
+        # ✅ LENIENT: Allow gaps for @depth@100ms (IDs are increasing, that's enough)
+        # Gaps are EXPECTED in 100ms aggregated streams
+
+        # Apply updates: one batch call per side instead of a method call per level
+        if bids:
+            self.update_bids(self.parse_levels(bids))
+        if asks:
+            self.update_asks(self.parse_levels(asks))
+
+        self.last_update_id = final_update_id
+        self.last_update_ts = time.monotonic()
 
         return True
 
@@ -315,14 +553,94 @@ class OrderBook:
             >>> print(depth['bids'][:2])  # Top 2 bids
             [(Decimal('50000.00'), Decimal('1.5')), (Decimal('49990.00'), Decimal('2.0'))]
         """
-        # Get top N bids (highest prices first)
-        bid_items = list(self.bids.items())[-levels:] if levels > 0 else []
-        bid_items.reverse()  # Highest to lowest
+        return {"bids": self._top_bids(levels), "asks": self._top_asks(levels)}
+
+    def get_depth_float(self, levels: int = 10) -> Dict[str, List[Tuple[float, float]]]:
+        """
+        Get order book depth (top N levels) as float (price, qty) tuples.
+
+        Same levels as get_depth(), converted for float analytics. The conversion
+        is cached with the top-N window, so reads between updates that touch the
+        window reuse it instead of converting every level again.
+
+        Args:
+            levels: Number of levels to return per side
+
+        Returns:
+            Dictionary with 'bids' and 'asks' lists of (price, qty) float tuples
+        """
+        if levels <= 0:
+            return {"bids": [], "asks": []}
+        self._top_bids(levels)
+        self._top_asks(levels)
+        window, bids = self._bid_top_float
+        if window is not self._bid_top:
+            window = self._bid_top
+            bids = [(float(price), float(qty)) for price, qty in window or ()]
+            self._bid_top_float = (window, bids)
+        window, asks = self._ask_top_float
+        if window is not self._ask_top:
+            window = self._ask_top
+            asks = [(float(price), float(qty)) for price, qty in window or ()]
+            self._ask_top_float = (window, asks)
+        return {"bids": bids[:levels], "asks": asks[:levels]}
+
+    def _top_bids(self, levels: int) -> List[Tuple[Decimal, Decimal]]:
+        """Top N bid levels, highest first, from the window cache when it covers N."""
+        if levels <= 0:
+            return []
+        top = self._bid_top
+        if top is None or (levels > self._bid_top_levels and len(top) == self._bid_top_levels):
+            # Rebuild in O(log n + k): slicing the sorted keys view copies k keys
+            # straight out of the underlying list, no per-key iterator step
+            bids = self.bids
+            prices = bids.keys()[-levels:]
+            prices.reverse()
+            top = list(zip(prices, map(bids.__getitem__, prices)))
+            self._bid_top = top
+            self._bid_top_levels = levels
+            self._bid_top_floor = top[-1][0] if len(top) == levels else None
+        return top[:levels]
+
+    def _top_asks(self, levels: int) -> List[Tuple[Decimal, Decimal]]:
+        """Top N ask levels, lowest first, from the window cache when it covers N."""
+        if levels <= 0:
+            return []
+        top = self._ask_top
+        if top is None or (levels > self._ask_top_levels and len(top) == self._ask_top_levels):
+            # Rebuild in O(log n + k) from a slice of the sorted keys view
+            asks = self.asks
+            prices = asks.keys()[:levels]
+            top = list(zip(prices, map(asks.__getitem__, prices)))
+            self._ask_top = top
+            self._ask_top_levels = levels
+            self._ask_top_ceiling = top[-1][0] if len(top) == levels else None
+        return top[:levels]
+
+    def get_snapshot(self) -> BookSnapshot:
+        """
+        Get an immutable snapshot of the top of book.
 
-        # Get top N asks (lowest prices first)
-        ask_items = list(self.asks.items())[:levels] if levels > 0 else []
+        The snapshot is built on first read and shared by every reader until
+        the next write that moves the top of book or the update ID, so the
+        writer never pays for snapshots nobody reads.
 
-        return {"bids": bid_items, "asks": ask_items}
+        Returns:
+            BookSnapshot with best bid/ask, mid-price, spread and update ID
+        """
+        snapshot = self._snapshot_cache
+        if snapshot is not None and snapshot.last_update_id == self.last_update_id:
+            return snapshot
+
+        snapshot = BookSnapshot(
+            best_bid=self.get_best_bid(),
+            best_ask=self.get_best_ask(),
+            mid_price=self.get_mid_price(),
+            spread_bps=self.get_spread_bps(),
+            last_update_id=self.last_update_id,
+        )
+        self._snapshot_cache = snapshot
+        return snapshot
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -331,10 +649,11 @@ class OrderBook:
         Returns:
             Dictionary with current order book stats
         """
-        best_bid = self.get_best_bid()
-        best_ask = self.get_best_ask()
-        mid_price = self.get_mid_price()
-        spread_bps = self.get_spread_bps()
+        snapshot = self.get_snapshot()
+        best_bid = snapshot.best_bid
+        best_ask = snapshot.best_ask
+        mid_price = snapshot.mid_price
+        spread_bps = snapshot.spread_bps
 
         return {
             "symbol": self.symbol,
@@ -344,7 +663,9 @@ class OrderBook:
             "best_ask": float(best_ask[0]) if best_ask else None,
             "mid_price": float(mid_price) if mid_price else None,
             "spread_bps": float(spread_bps) if spread_bps else None,
-            "last_update_id": self.last_update_id,
+            "last_update_id": snapshot.last_update_id,
+            "invalid_first_updates": self.invalid_first_update_count,
+            "backwards_updates": self.backwards_update_count,
         }
 
     def compute_checksum(self, depth: int = 10) -> int:
@@ -358,39 +679,53 @@ class OrderBook:
         - Top N bid levels (price:quantity)
         - Top N ask levels (price:quantity)
 
+        The result is cached until a write lands inside the top `depth` levels,
+        so repeated validation on an unchanged top of book skips the rebuild.
+
         Args:
             depth: Number of levels to include in checksum (default 10)
 
         Returns:
-            CRC32 checksum as unsigned 32-bit integer
+            CRC32 checksum as unsigned 32-bit integer, or -1 if the payload
+            could not be built. This method never raises, so callers on the
+            monitoring path don't need their own try/except.
 
         Example:
             >>> book.compute_checksum(depth=10)
             2849257112
         """
-        # Build payload from top N levels
-        payload_parts: List[str] = []
+        cached = self._checksum_cache
+        if cached is not None and cached[0] == depth:
+            return cached[1]
+
+        try:
+            # Build payload from top N levels
+            payload_parts: List[str] = []
 
-        # Get top N bids (highest to lowest)
-        bid_items = list(self.bids.items())[-depth:] if depth > 0 else []
-        bid_items.reverse()
+            # Get top N bids (highest to lowest)
+            bid_items = self._top_bids(depth)
 
-        for price, qty in bid_items:
-            # Format: "price:quantity" with minimal precision
-            payload_parts.append(f"{price}:{qty}")
+            for price, qty in bid_items:
+                # Format: "price:quantity" with minimal precision
+                payload_parts.append(f"{price}:{qty}")
 
-        # Get top N asks (lowest to highest)
-        ask_items = list(self.asks.items())[:depth] if depth > 0 else []
+            # Get top N asks (lowest to highest)
+            ask_items = self._top_asks(depth)
 
-        for price, qty in ask_items:
-            payload_parts.append(f"{price}:{qty}")
+            for price, qty in ask_items:
+                payload_parts.append(f"{price}:{qty}")
 
-        # Concatenate all parts
-        payload = ":".join(payload_parts)
+            # Concatenate all parts
+            payload = ":".join(payload_parts)
+        except Exception as e:
+            logger.error("checksum_computation_failed", symbol=self.symbol, error=str(e))
+            return -1
 
         # Compute CRC32 checksum
         checksum = zlib.crc32(payload.encode("utf-8")) & 0xFFFFFFFF
 
+        self._checksum_cache = (depth, checksum)
+
         return checksum
 
     def __repr__(self) -> str:
@@ -19,7 +19,10 @@ Production considerations:
 - Prepared statements for security and performance
 """
 
-from datetime import datetime
+import asyncio
+import csv
+import io
+from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any
 
@@ -29,6 +32,123 @@ from ..utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Statement texts are module constants so every call sends byte-identical SQL,
+# which asyncpg's per-connection statement cache (keyed by query text) turns
+# into a reused server-side prepared statement after the first execution.
+_INSERT_SNAPSHOT_SQL = """
+    INSERT INTO liquidity_snapshots (
+        symbol, exchange, timestamp,
+        mid_price, spread_bps, bid_levels, ask_levels,
+        depth_10bps_usd, depth_50bps_usd, depth_100bps_usd,
+        depth_10bps, depth_50bps, depth_100bps,
+        imbalance,
+        slippage_100k_bps, slippage_100k_usd,
+        slippage_500k_bps, slippage_500k_usd,
+        slippage_1m_bps, slippage_1m_usd
+    ) VALUES (
+        $1, $2, $3, $4, $5, $6, $7, $8, $9, $10,
+        $11, $12, $13, $14, $15, $16, $17, $18, $19, $20
+    )
+"""
+
+# Session settings sent in the startup packet, so they cost no extra round-trip.
+# asyncpg already sets TCP_NODELAY on every TCP socket, so small queries such as
+# health_check() are never held back by Nagle's algorithm; the server-side
+# keepalives stop idle pooled connections from being dropped by NAT/firewalls,
+# which would otherwise surface as a reconnect on the next dashboard query.
+# JIT is off: every statement here is a small INSERT or indexed lookup where
+# JIT compilation (PG 11+) can only add planning time.
+_SERVER_SETTINGS = {
+    "application_name": "liquidity-monitor",
+    "jit": "off",
+    "tcp_keepalives_idle": "60",
+    "tcp_keepalives_interval": "10",
+    "tcp_keepalives_count": "3",
+}
+
+# liquidity_snapshots columns in _snapshot_record() / _INSERT_SNAPSHOT_SQL order
+_SNAPSHOT_COLUMNS = (
+    "symbol",
+    "exchange",
+    "timestamp",
+    "mid_price",
+    "spread_bps",
+    "bid_levels",
+    "ask_levels",
+    "depth_10bps_usd",
+    "depth_50bps_usd",
+    "depth_100bps_usd",
+    "depth_10bps",
+    "depth_50bps",
+    "depth_100bps",
+    "imbalance",
+    "slippage_100k_bps",
+    "slippage_100k_usd",
+    "slippage_500k_bps",
+    "slippage_500k_usd",
+    "slippage_1m_bps",
+    "slippage_1m_usd",
+)
+
+_INSERT_ANOMALY_SQL = """
+    INSERT INTO anomaly_events (
+        symbol, exchange, detected_at,
+        severity, reason,
+        depth_zscore, spread_zscore, imbalance_zscore, max_zscore,
+        mid_price, spread_bps, depth_10bps_usd, imbalance
+    ) VALUES (
+        $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13
+    )
+"""
+
+# $1-$20 are the snapshot row; the anomaly shares symbol, exchange, timestamp
+# and market context with it and only adds $21-$26
+_INSERT_SNAPSHOT_AND_ANOMALY_SQL = """
+    WITH snapshot AS (
+        INSERT INTO liquidity_snapshots (
+            symbol, exchange, timestamp,
+            mid_price, spread_bps, bid_levels, ask_levels,
+            depth_10bps_usd, depth_50bps_usd, depth_100bps_usd,
+            depth_10bps, depth_50bps, depth_100bps,
+            imbalance,
+            slippage_100k_bps, slippage_100k_usd,
+            slippage_500k_bps, slippage_500k_usd,
+            slippage_1m_bps, slippage_1m_usd
+        ) VALUES (
+            $1, $2, $3, $4, $5, $6, $7, $8, $9, $10,
+            $11, $12, $13, $14, $15, $16, $17, $18, $19, $20
+        )
+    )
+    INSERT INTO anomaly_events (
+        symbol, exchange, detected_at,
+        severity, reason,
+        depth_zscore, spread_zscore, imbalance_zscore, max_zscore,
+        mid_price, spread_bps, depth_10bps_usd, imbalance
+    ) VALUES (
+        $1, $2, $3, $21, $22, $23, $24, $25, $26, $4, $5, $8, $14
+    )
+"""
+
+# Look-back window is a bound parameter ($3) rather than formatted into the text,
+# so every hours value shares one cached statement and plan
+_RECENT_ANOMALIES_SQL = """
+    SELECT
+        event_id, symbol, detected_at, severity, reason,
+        depth_zscore, spread_zscore, imbalance_zscore, max_zscore,
+        mid_price, spread_bps, depth_10bps_usd, imbalance
+    FROM anomaly_events
+    WHERE
+        symbol = $1
+        AND detected_at >= NOW() - make_interval(hours => $3)
+        AND CASE
+            WHEN severity = 'warning' THEN 1
+            WHEN severity = 'high' THEN 2
+            WHEN severity = 'critical' THEN 3
+        END >= $2
+    ORDER BY detected_at DESC
+    LIMIT 100
+"""
+
 
 class DatabaseWriter:
     """
@@ -65,6 +185,10 @@ class DatabaseWriter:
         user: str = "risk_analyst",
         min_pool_size: int = 5,
         max_pool_size: int = 20,
+        snapshot_batch_size: int = 100,
+        snapshot_flush_interval: float = 0.5,
+        snapshot_queue_size: int = 10_000,
+        snapshot_max_batch_size: int = 1_000,
     ):
         """
         Initialize database writer.
@@ -77,6 +201,10 @@ class DatabaseWriter:
             password: Database password (REQUIRED - must be from environment variable)
             min_pool_size: Minimum connections in pool
             max_pool_size: Maximum connections in pool
+            snapshot_batch_size: Batch cap while the pool is idle
+            snapshot_flush_interval: Max seconds a snapshot waits while the pool is busy
+            snapshot_queue_size: Max queued snapshots before callers are pushed back
+            snapshot_max_batch_size: Batch cap while the pool is busy
 
         Security:
             Never call this with a hardcoded password. Always use:
@@ -93,9 +221,24 @@ class DatabaseWriter:
         self.min_pool_size = min_pool_size
         self.max_pool_size = max_pool_size
 
+        self.snapshot_batch_size = snapshot_batch_size
+        self.snapshot_flush_interval = snapshot_flush_interval
+        self.snapshot_max_batch_size = snapshot_max_batch_size
+
         self.pool: asyncpg.Pool | None = None
         self._connected = False
 
+        # Snapshot rows flow caller -> queue -> _flusher() -> _pending -> COPY.
+        # The bounded queue is the backpressure point; _pending holds the batch
+        # being collected, and the lock makes the swap-and-write atomic so
+        # concurrent flushes never split or repeat a batch.
+        self._snapshot_queue: asyncio.Queue[tuple[Any, ...]] = asyncio.Queue(
+            maxsize=snapshot_queue_size
+        )
+        self._pending: list[tuple[Any, ...]] = []
+        self._pending_lock = asyncio.Lock()
+        self._flusher_task: asyncio.Task[None] | None = None
+
         logger.info(
             "database_writer_initialized",
             host=host,
@@ -112,6 +255,10 @@ class DatabaseWriter:
         Creates a pool of persistent connections for high-throughput scenarios.
         Connections are automatically managed and recycled.
 
+        asyncpg's socket I/O benefits most from uvloop. Entry points install it
+        before asyncio.run() (main.py does); the writer never sets a loop policy
+        itself, as that is process-wide. The loop in use is logged on connect.
+
         Raises:
             asyncpg.PostgresError: If connection fails
         """
@@ -126,6 +273,8 @@ class DatabaseWriter:
                 max_size=self.max_pool_size,
                 command_timeout=60,
                 max_inactive_connection_lifetime=300,
+                init=self._init_connection,
+                server_settings=_SERVER_SETTINGS,
             )
 
             self._connected = True
@@ -135,6 +284,7 @@ class DatabaseWriter:
                 host=self.host,
                 database=self.database,
                 pool_size=self.pool.get_size(),
+                event_loop=type(asyncio.get_running_loop()).__module__,
             )
 
         except Exception as e:
@@ -143,9 +293,37 @@ class DatabaseWriter:
             )
             raise
 
+    @staticmethod
+    async def _init_connection(connection: asyncpg.Connection) -> None:
+        """
+        Configure each new pool connection once, before it is first acquired.
+
+        NUMERIC parameters are sent in text format via str(), so the float
+        metrics are bound directly: the server parses the shortest repr into
+        the column's scale, exactly as it did for Decimal(str(value)), without
+        building a Decimal per field. Results still decode to Decimal.
+
+        Codecs are looked up per connection, so registering here (rather than
+        per query) means every acquired connection already has them. TIMESTAMPTZ
+        needs no registration: asyncpg's built-in binary codec takes the aware
+        datetimes the write methods bind.
+        """
+        await connection.set_type_codec(
+            "numeric", encoder=str, decoder=Decimal, schema="pg_catalog", format="text"
+        )
+
     async def close(self) -> None:
-        """Close connection pool gracefully."""
+        """Flush queued snapshots, then close connection pool gracefully."""
         if self.pool:
+            await self.flush_snapshots()
+            # The queue is drained, so the flusher is idle in queue.get()
+            if self._flusher_task is not None and not self._flusher_task.done():
+                self._flusher_task.cancel()
+                try:
+                    await self._flusher_task
+                except asyncio.CancelledError:
+                    pass
+            self._flusher_task = None
             await self.pool.close()
             self._connected = False
             logger.info("database_disconnected")
@@ -155,100 +333,263 @@ class DatabaseWriter:
         return self._connected and self.pool is not None
 
     async def write_snapshot(
-        self, symbol: str, metrics: dict[str, Any], exchange: str = "binance_futures"
+        self,
+        symbol: str,
+        metrics: dict[str, Any],
+        exchange: str = "binance_futures",
+        timestamp: datetime | None = None,
     ) -> bool:
         """
-        Write a liquidity snapshot to the database.
+        Queue a liquidity snapshot for the next batched database write.
 
         This method is called every minute to persist current market state.
         Snapshots are used for historical analysis and regulatory reporting.
 
+        The row is handed to a background flusher that writes it through
+        write_snapshots_batch() in adaptively sized batches (see _flusher()),
+        so the caller never waits on the database. It only waits when snapshot_queue_size rows are
+        already queued (backpressure); see enqueue_snapshot() to drop instead.
+
         Args:
             symbol: Trading pair (e.g., "BTCUSDT")
             metrics: Metrics dictionary from RiskEngine.calculate_metrics()
             exchange: Exchange name
+            timestamp: Snapshot time (timezone-aware); defaults to now in UTC
 
         Returns:
-            True if write succeeded, False otherwise
+            True if the snapshot was accepted for writing, False otherwise
 
         Example:
             >>> metrics = risk_engine.calculate_metrics()
             >>> await writer.write_snapshot("BTCUSDT", metrics)
         """
-        if not self.is_connected() or self.pool is None:
-            logger.error(
-                "database_write_blocked",
-                operation="write_snapshot",
-                reason="Connection pool not available",
-                symbol=symbol,
-            )
+        record = self._prepare_snapshot(symbol, metrics, exchange, timestamp, "write_snapshot")
+        if record is None:
             return False
 
-        try:
-            basic = metrics.get("basic", {})
-            slippage = metrics.get("slippage", {})
-            depth = metrics.get("depth", {})
-            imbalance = metrics.get("imbalance", 0.0)
+        await self._snapshot_queue.put(record)
+        self._ensure_flusher()
 
-            # Extract slippage metrics
-            slippage_100k = slippage.get("sell_100k", {})
-            slippage_500k = slippage.get("sell_500k", {})
-            slippage_1m = slippage.get("sell_1000k", {})
+        return True
 
-            # Extract depth metrics
-            depth_10bps = depth.get("10bps", {})
-            depth_50bps = depth.get("50bps", {})
-            depth_100bps = depth.get("100bps", {})
-
-            query = """
-                INSERT INTO liquidity_snapshots (
-                    symbol, exchange, timestamp,
-                    mid_price, spread_bps, bid_levels, ask_levels,
-                    depth_10bps_usd, depth_50bps_usd, depth_100bps_usd,
-                    depth_10bps, depth_50bps, depth_100bps,
-                    imbalance,
-                    slippage_100k_bps, slippage_100k_usd,
-                    slippage_500k_bps, slippage_500k_usd,
-                    slippage_1m_bps, slippage_1m_usd
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10,
-                    $11, $12, $13, $14, $15, $16, $17, $18, $19, $20
-                )
-            """
+    def enqueue_snapshot(
+        self,
+        symbol: str,
+        metrics: dict[str, Any],
+        exchange: str = "binance_futures",
+        timestamp: datetime | None = None,
+    ) -> bool:
+        """
+        Queue a snapshot without awaiting, dropping it if the queue is full.
 
-            await self.pool.execute(
-                query,
-                symbol,
-                exchange,
-                datetime.utcnow(),
-                Decimal(str(basic.get("mid_price", 0))),
-                Decimal(str(basic.get("spread_bps", 0))),
-                basic.get("bid_levels", 0),
-                basic.get("ask_levels", 0),
-                Decimal(str(depth_10bps.get("total_depth_usd", 0))),
-                Decimal(str(depth_50bps.get("total_depth_usd", 0))),
-                Decimal(str(depth_100bps.get("total_depth_usd", 0))),
-                Decimal(str(depth_10bps.get("total_depth", 0))),
-                Decimal(str(depth_50bps.get("total_depth", 0))),
-                Decimal(str(depth_100bps.get("total_depth", 0))),
-                Decimal(str(imbalance)),
-                Decimal(str(slippage_100k.get("slippage_bps", 0))),
-                Decimal(str(slippage_100k.get("slippage_usd", 0))),
-                Decimal(str(slippage_500k.get("slippage_bps", 0))),
-                Decimal(str(slippage_500k.get("slippage_usd", 0))),
-                Decimal(str(slippage_1m.get("slippage_bps", 0))),
-                Decimal(str(slippage_1m.get("slippage_usd", 0))),
+        For callers that must never block (e.g. inside a per-message loop).
+        Must be called from the event loop thread.
+
+        Returns:
+            True if the snapshot was queued, False if rejected or dropped
+        """
+        record = self._prepare_snapshot(symbol, metrics, exchange, timestamp, "enqueue_snapshot")
+        if record is None:
+            return False
+
+        try:
+            self._snapshot_queue.put_nowait(record)
+        except asyncio.QueueFull:
+            logger.warning(
+                "snapshot_queue_full", symbol=symbol, maxsize=self._snapshot_queue.maxsize
             )
+            return False
 
-            logger.debug("snapshot_written", symbol=symbol, mid_price=basic.get("mid_price", 0))
+        self._ensure_flusher()
 
-            return True
+        return True
 
+    def _prepare_snapshot(
+        self,
+        symbol: str,
+        metrics: dict[str, Any],
+        exchange: str,
+        timestamp: datetime | None,
+        operation: str,
+    ) -> tuple[Any, ...] | None:
+        """Check the pool and build the snapshot row, logging why if it can't."""
+        if not self.is_connected() or self.pool is None:
+            logger.error(
+                "database_write_blocked",
+                operation=operation,
+                reason="Connection pool not available",
+                symbol=symbol,
+            )
+            return None
+
+        try:
+            return self._snapshot_record(
+                symbol, metrics, exchange, timestamp or datetime.now(timezone.utc)
+            )
         except Exception as e:
             logger.error(
                 "snapshot_write_failed", error=str(e), error_type=type(e).__name__, symbol=symbol
             )
+            return None
+
+    def _ensure_flusher(self) -> None:
+        """Start the background flusher on first use (or after it has exited)."""
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flusher())
+
+    @staticmethod
+    def _snapshot_record(
+        symbol: str, metrics: dict[str, Any], exchange: str, timestamp: datetime
+    ) -> tuple[Any, ...]:
+        """Build a liquidity_snapshots row in write_snapshots_batch() column order."""
+        # RiskEngine.calculate_metrics() emits every section and key, so plain
+        # subscripts cover the normal case; partial payloads take the defaults path.
+        # The row only references objects that already exist (metric floats, the
+        # symbol/exchange strings), so the tuple itself is the one allocation;
+        # filling a reusable per-symbol list and copying it out would cost more.
+        try:
+            basic = metrics["basic"]
+            slippage = metrics["slippage"]
+            depth = metrics["depth"]
+            slippage_100k = slippage["sell_100k"]
+            slippage_500k = slippage["sell_500k"]
+            slippage_1m = slippage["sell_1000k"]
+            depth_10bps = depth["10bps"]
+            depth_50bps = depth["50bps"]
+            depth_100bps = depth["100bps"]
+
+            return (
+                symbol,
+                exchange,
+                timestamp,
+                basic["mid_price"],
+                basic["spread_bps"],
+                basic["bid_levels"],
+                basic["ask_levels"],
+                depth_10bps["total_depth_usd"],
+                depth_50bps["total_depth_usd"],
+                depth_100bps["total_depth_usd"],
+                depth_10bps["total_depth"],
+                depth_50bps["total_depth"],
+                depth_100bps["total_depth"],
+                metrics["imbalance"],
+                slippage_100k["slippage_bps"],
+                slippage_100k["slippage_usd"],
+                slippage_500k["slippage_bps"],
+                slippage_500k["slippage_usd"],
+                slippage_1m["slippage_bps"],
+                slippage_1m["slippage_usd"],
+            )
+        except KeyError:
+            return DatabaseWriter._snapshot_record_with_defaults(
+                symbol, metrics, exchange, timestamp
+            )
+
+    @staticmethod
+    def _snapshot_record_with_defaults(
+        symbol: str, metrics: dict[str, Any], exchange: str, timestamp: datetime
+    ) -> tuple[Any, ...]:
+        """Build a snapshot row from a partial metrics dict, zero-filling gaps."""
+        basic = metrics.get("basic", {})
+        slippage = metrics.get("slippage", {})
+        depth = metrics.get("depth", {})
+        imbalance = metrics.get("imbalance", 0.0)
+
+        # Extract slippage metrics
+        slippage_100k = slippage.get("sell_100k", {})
+        slippage_500k = slippage.get("sell_500k", {})
+        slippage_1m = slippage.get("sell_1000k", {})
+
+        # Extract depth metrics
+        depth_10bps = depth.get("10bps", {})
+        depth_50bps = depth.get("50bps", {})
+        depth_100bps = depth.get("100bps", {})
+
+        return (
+            symbol,
+            exchange,
+            timestamp,
+            basic.get("mid_price", 0),
+            basic.get("spread_bps", 0),
+            basic.get("bid_levels", 0),
+            basic.get("ask_levels", 0),
+            depth_10bps.get("total_depth_usd", 0),
+            depth_50bps.get("total_depth_usd", 0),
+            depth_100bps.get("total_depth_usd", 0),
+            depth_10bps.get("total_depth", 0),
+            depth_50bps.get("total_depth", 0),
+            depth_100bps.get("total_depth", 0),
+            imbalance,
+            slippage_100k.get("slippage_bps", 0),
+            slippage_100k.get("slippage_usd", 0),
+            slippage_500k.get("slippage_bps", 0),
+            slippage_500k.get("slippage_usd", 0),
+            slippage_1m.get("slippage_bps", 0),
+            slippage_1m.get("slippage_usd", 0),
+        )
+
+    async def _flusher(self) -> None:
+        """
+        Collect queued snapshots into batches and write them.
+
+        Batch size adapts to pool load. While fewer than half the pool's
+        connections are checked out, a round-trip is cheap: the batch is
+        written as soon as the queue runs dry (capped at snapshot_batch_size),
+        keeping write latency low. Once the pool is busy, the batch keeps
+        growing up to snapshot_max_batch_size or snapshot_flush_interval
+        seconds, so writes don't compete for connections with many small COPYs.
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._snapshot_queue
+
+        while True:
+            self._pending.append(await queue.get())
+            deadline = loop.time() + self.snapshot_flush_interval
+
+            while True:
+                busy = self._pool_busy()
+                limit = self.snapshot_max_batch_size if busy else self.snapshot_batch_size
+                if len(self._pending) >= limit:
+                    break
+                if not queue.empty():
+                    self._pending.append(queue.get_nowait())
+                    continue
+                if not busy:
+                    break
+                try:
+                    row = await asyncio.wait_for(queue.get(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+                self._pending.append(row)
+
+            await self.flush_snapshots(drain_queue=False)
+
+    def _pool_busy(self) -> bool:
+        """True when at least half of the pool's max connections are checked out."""
+        if self.pool is None:
             return False
+        in_use = self.pool.get_size() - self.pool.get_idle_size()
+        return bool(in_use * 2 >= self.max_pool_size)
+
+    async def flush_snapshots(self, drain_queue: bool = True) -> int:
+        """
+        Write every queued and collected snapshot now, in one batch.
+
+        Args:
+            drain_queue: Also take rows still waiting in the queue (the flusher
+                passes False so its batch keeps the size it chose)
+
+        Returns:
+            Number of rows inserted
+        """
+        async with self._pending_lock:
+            queue = self._snapshot_queue
+            while drain_queue and not queue.empty():
+                self._pending.append(queue.get_nowait())
+            if not self._pending:
+                return 0
+            batch, self._pending = self._pending, []
+            return await self.write_snapshots_batch(batch)
 
     async def write_anomaly(
         self,
@@ -256,6 +597,7 @@ class DatabaseWriter:
         anomaly: dict[str, Any],
         metrics: dict[str, Any],
         exchange: str = "binance_futures",
+        timestamp: datetime | None = None,
     ) -> bool:
         """
         Write an anomaly event to the database.
@@ -268,6 +610,7 @@ class DatabaseWriter:
             anomaly: Anomaly dictionary from LiquidityCrunchDetector
             metrics: Full metrics context at time of detection
             exchange: Exchange name
+            timestamp: Detection time (timezone-aware); defaults to now in UTC
 
         Returns:
             True if write succeeded, False otherwise
@@ -292,32 +635,21 @@ class DatabaseWriter:
             depth_10bps = depth.get("10bps", {})
             imbalance = metrics.get("imbalance", 0.0)
 
-            query = """
-                INSERT INTO anomaly_events (
-                    symbol, exchange, detected_at,
-                    severity, reason,
-                    depth_zscore, spread_zscore, imbalance_zscore, max_zscore,
-                    mid_price, spread_bps, depth_10bps_usd, imbalance
-                ) VALUES (
-                    $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13
-                )
-            """
-
             await self.pool.execute(
-                query,
+                _INSERT_ANOMALY_SQL,
                 symbol,
                 exchange,
-                datetime.utcnow(),
+                timestamp or datetime.now(timezone.utc),
                 anomaly.get("severity", "warning"),
                 anomaly.get("reason", "Unknown"),
-                Decimal(str(anomaly.get("depth_zscore", 0))),
-                Decimal(str(anomaly.get("spread_zscore", 0))),
-                Decimal(str(anomaly.get("imbalance_zscore", 0))),
-                Decimal(str(anomaly.get("max_zscore", 0))),
-                Decimal(str(basic.get("mid_price", 0))),
-                Decimal(str(basic.get("spread_bps", 0))),
-                Decimal(str(depth_10bps.get("total_depth_usd", 0))),
-                Decimal(str(imbalance)),
+                anomaly.get("depth_zscore", 0),
+                anomaly.get("spread_zscore", 0),
+                anomaly.get("imbalance_zscore", 0),
+                anomaly.get("max_zscore", 0),
+                basic.get("mid_price", 0),
+                basic.get("spread_bps", 0),
+                depth_10bps.get("total_depth_usd", 0),
+                imbalance,
             )
 
             logger.info(
@@ -335,12 +667,87 @@ class DatabaseWriter:
             )
             return False
 
+    async def write_snapshot_and_anomaly(
+        self,
+        symbol: str,
+        anomaly: dict[str, Any],
+        metrics: dict[str, Any],
+        exchange: str = "binance_futures",
+        timestamp: datetime | None = None,
+    ) -> bool:
+        """
+        Write a snapshot and its anomaly event in a single statement.
+
+        Used when an anomaly fires on a snapshot tick. Both inserts travel as one
+        data-modifying CTE, so the server receives a single message and applies
+        them atomically instead of the caller waiting on two round-trips. The
+        anomaly row reuses the snapshot's timestamp and market context.
+
+        Args:
+            symbol: Trading pair (e.g., "BTCUSDT")
+            anomaly: Anomaly dictionary from LiquidityCrunchDetector
+            metrics: Metrics dictionary from RiskEngine.calculate_metrics()
+            exchange: Exchange name
+            timestamp: Time for both rows (timezone-aware); defaults to now in UTC
+
+        Returns:
+            True if both rows were written, False otherwise
+        """
+        if not self.is_connected() or self.pool is None:
+            logger.error(
+                "database_write_blocked",
+                operation="write_snapshot_and_anomaly",
+                reason="Connection pool not available",
+                symbol=symbol,
+                severity=anomaly.get("severity", "unknown"),
+            )
+            return False
+
+        try:
+            await self.pool.execute(
+                _INSERT_SNAPSHOT_AND_ANOMALY_SQL,
+                *self._snapshot_record(
+                    symbol, metrics, exchange, timestamp or datetime.now(timezone.utc)
+                ),
+                anomaly.get("severity", "warning"),
+                anomaly.get("reason", "Unknown"),
+                anomaly.get("depth_zscore", 0),
+                anomaly.get("spread_zscore", 0),
+                anomaly.get("imbalance_zscore", 0),
+                anomaly.get("max_zscore", 0),
+            )
+
+            logger.info(
+                "snapshot_and_anomaly_written",
+                symbol=symbol,
+                severity=anomaly.get("severity"),
+                reason=anomaly.get("reason"),
+            )
+
+            return True
+
+        except Exception as e:
+            logger.error(
+                "snapshot_and_anomaly_write_failed",
+                error=str(e),
+                error_type=type(e).__name__,
+                symbol=symbol,
+            )
+            return False
+
     async def write_snapshots_batch(self, snapshots: list[tuple[Any, ...]]) -> int:
         """
-        Write multiple snapshots in a single transaction (batch insert).
+        Write multiple snapshots in a single COPY (bulk insert).
 
         This is more efficient than individual inserts when backfilling
-        or processing high-frequency data.
+        or processing high-frequency data. Rows are streamed as CSV through
+        COPY FROM STDIN, so the server parses no per-row INSERT; if COPY is
+        rejected (e.g. by a pooler that does not support it), the batch falls
+        back to executemany().
+
+        CSV rather than copy_records_to_table(): that API requires binary
+        codecs, and NUMERIC is bound in text format (see _init_connection),
+        so both paths send the same str() form of each value.
 
         Args:
             snapshots: List of tuples matching snapshot table columns
@@ -349,9 +756,10 @@ class DatabaseWriter:
             Number of rows inserted
 
         Example:
+            >>> now = datetime.now(timezone.utc)  # One timestamp for the whole batch
             >>> snapshots = [
-            ...     ("BTCUSDT", "binance_futures", datetime.now(), ...),
-            ...     ("ETHUSDT", "binance_futures", datetime.now(), ...)
+            ...     ("BTCUSDT", "binance_futures", now, ...),
+            ...     ("ETHUSDT", "binance_futures", now, ...)
             ... ]
             >>> count = await writer.write_snapshots_batch(snapshots)
         """
@@ -365,20 +773,22 @@ class DatabaseWriter:
             return 0
 
         try:
-            query = """
-                INSERT INTO liquidity_snapshots (
-                    symbol, exchange, timestamp,
-                    mid_price, spread_bps, bid_levels, ask_levels,
-                    depth_10bps_usd, depth_50bps_usd, depth_100bps_usd,
-                    depth_10bps, depth_50bps, depth_100bps,
-                    imbalance,
-                    slippage_100k_bps, slippage_100k_usd,
-                    slippage_500k_bps, slippage_500k_usd,
-                    slippage_1m_bps, slippage_1m_usd
-                ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17, $18, $19, $20)
-            """
-
-            await self.pool.executemany(query, snapshots)
+            try:
+                await self.pool.copy_to_table(
+                    "liquidity_snapshots",
+                    source=self._snapshots_csv(snapshots),
+                    columns=_SNAPSHOT_COLUMNS,
+                    format="csv",
+                    timeout=30,
+                )
+            except (asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+                logger.warning(
+                    "batch_copy_failed_using_executemany",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    batch_size=len(snapshots),
+                )
+                await self.pool.executemany(_INSERT_SNAPSHOT_SQL, snapshots)
 
             logger.info("batch_snapshots_written", count=len(snapshots))
 
@@ -393,6 +803,13 @@ class DatabaseWriter:
             )
             return 0
 
+    @staticmethod
+    def _snapshots_csv(snapshots: list[tuple[Any, ...]]) -> io.BytesIO:
+        """Serialize snapshot rows as CSV for COPY; None becomes an unquoted NULL."""
+        text = io.StringIO()
+        csv.writer(text, lineterminator="\n").writerows(snapshots)
+        return io.BytesIO(text.getvalue().encode())
+
     async def get_recent_anomalies(
         self, symbol: str, hours: int = 24, min_severity: str = "warning"
     ) -> list[dict[str, Any]]:
@@ -422,26 +839,7 @@ class DatabaseWriter:
             severity_order = {"warning": 1, "high": 2, "critical": 3}
             min_level = severity_order.get(min_severity, 1)
 
-            # Query with hours parameter (validated int) and $1/$2 parameterized
-            query = """
-                SELECT
-                    event_id, symbol, detected_at, severity, reason,
-                    depth_zscore, spread_zscore, imbalance_zscore, max_zscore,
-                    mid_price, spread_bps, depth_10bps_usd, imbalance
-                FROM anomaly_events
-                WHERE
-                    symbol = $1
-                    AND detected_at >= NOW() - INTERVAL '%s hours'
-                    AND CASE
-                        WHEN severity = 'warning' THEN 1
-                        WHEN severity = 'high' THEN 2
-                        WHEN severity = 'critical' THEN 3
-                    END >= $2
-                ORDER BY detected_at DESC
-                LIMIT 100
-            """ % hours  # nosec B608 # hours is validated int, $1/$2 are parameterized
-
-            rows = await self.pool.fetch(query, symbol, min_level)
+            rows = await self.pool.fetch(_RECENT_ANOMALIES_SQL, symbol, min_level, int(hours))
 
             return [dict(row) for row in rows]
 
@@ -5,33 +5,143 @@ This module provides a structured logger using structlog for consistent,
 machine-readable logging with performance tracking capabilities.
 """
 
+import atexit
+import functools
+import io
+import json
 import logging
+import logging.handlers
+import queue
 import sys
 import time
+from array import array
 from typing import Any, cast
 
 import structlog
 from structlog.types import EventDict, Processor
 
+try:
+    import orjson
 
-def add_timestamp(
-    logger: Any, method_name: str, event_dict: EventDict
-) -> EventDict:  # pragma: no cover
-    """Add ISO 8601 timestamp to log entries."""
-    # Infrastructure utility - tested via integration tests
-    event_dict["timestamp"] = time.time()
-    return event_dict
+    USE_ORJSON = True
+except ImportError:  # pragma: no cover
+    USE_ORJSON = False
+
+# Background thread that owns stdout; set by configure_logging
+_listener: logging.handlers.QueueListener | None = None
+
+# Log lines accumulate here and reach stdout in one write per drained batch
+_STDOUT_BUFFER_SIZE = 65536
 
 
-def add_log_level(
-    logger: Any, method_name: str, event_dict: EventDict
-) -> EventDict:  # pragma: no cover
-    """Add log level to event dict."""
-    # Infrastructure utility - tested via integration tests
-    event_dict["level"] = method_name
+def _pin_exc_info(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
+    """Resolve ``exc_info=True`` to the active exception in the caller's thread.
+
+    Tracebacks are formatted on the listener thread, where ``sys.exc_info()``
+    no longer refers to the exception being logged.
+    """
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
     return event_dict
 
 
+# Built once; configure_logging only chooses the renderer. The first three
+# also enrich records from plain stdlib loggers.
+_BASE_PROCESSORS: tuple[Processor, ...] = (
+    structlog.stdlib.add_log_level,
+    structlog.stdlib.add_logger_name,
+    structlog.processors.TimeStamper(fmt="iso"),
+    _pin_exc_info,
+)
+
+
+def _orjson_dumps(obj: Any, default: Any = None, **_: Any) -> str:  # pragma: no cover
+    """JSONRenderer serializer backed by orjson.
+
+    ``default`` is structlog's fallback for unserializable values (e.g.
+    Decimal), so output matches the stdlib json path apart from whitespace.
+    ProcessorFormatter needs a str, hence the decode.
+    """
+    return str(orjson.dumps(obj, default=default).decode())
+
+
+class _PassthroughQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records untouched.
+
+    The stock ``prepare`` formats the record in the caller's thread and
+    replaces ``msg`` with the result, which would both keep rendering on the
+    event loop and strip the structlog event dict the listener's
+    ProcessorFormatter needs.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that writes without flushing after every record."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        try:
+            super().flush()
+        except OSError:
+            # Reader went away (e.g. piped into head); keep the listener alive
+            pass
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs dry.
+
+    A burst of records is written into the stream buffer and pushed to the
+    OS once, instead of one write() syscall per line.
+    """
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if block and cast(queue.SimpleQueue, self.queue).empty():
+            for handler in self.handlers:
+                handler.flush()
+        return super().dequeue(block)
+
+
+def _buffered_stdout() -> io.TextIOBase:  # pragma: no cover
+    """Open a block-buffered text stream on the stdout file descriptor."""
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        # stdout replaced by something without a descriptor (e.g. captured)
+        return cast(io.TextIOBase, sys.stdout)
+    return cast(
+        io.TextIOBase,
+        open(
+            fd,
+            "w",
+            buffering=_STDOUT_BUFFER_SIZE,
+            encoding=sys.stdout.encoding,
+            errors="backslashreplace",
+            closefd=False,
+        ),
+    )
+
+
+def _stop_listener() -> None:  # pragma: no cover
+    """Drain queued records, flush stdout and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.flush()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
+
 def configure_logging(  # pragma: no cover
     log_level: str = "INFO", json_format: bool = True, colorize: bool = True
 ) -> None:
@@ -49,32 +159,53 @@ def configure_logging(  # pragma: no cover
     Note:
         This function modifies global logging state and is difficult to test
         in unit tests. Validated via integration tests and manual verification.
-    """
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
-    )
 
-    processors: list[Processor] = [
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
-        add_timestamp,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-    ]
+        Callers only enqueue records; rendering and the stdout write happen on
+        a QueueListener thread so log I/O never blocks the event loop. Output
+        is block-buffered and flushed each time the queue drains, and the
+        listener is stopped (queue drained, stdout flushed) at interpreter exit.
+    """
+    global _listener
 
+    renderer: Processor
     if json_format:
-        processors.append(structlog.processors.JSONRenderer())
+        renderer = structlog.processors.JSONRenderer(
+            serializer=_orjson_dumps if USE_ORJSON else json.dumps
+        )
     else:
-        if colorize:
-            processors.append(structlog.dev.ConsoleRenderer(colors=True))
-        else:
-            processors.append(structlog.dev.ConsoleRenderer(colors=False))
+        renderer = structlog.dev.ConsoleRenderer(colors=colorize)
+
+    stream_handler = _BufferedStreamHandler(_buffered_stdout())
+    stream_handler.setFormatter(
+        structlog.stdlib.ProcessorFormatter(
+            processors=[
+                structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+                structlog.processors.format_exc_info,
+                renderer,
+            ],
+            # Records from plain stdlib loggers (asyncio, websockets, ...)
+            foreign_pre_chain=_BASE_PROCESSORS[:3],
+        )
+    )
+
+    _stop_listener()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    logging.basicConfig(
+        handlers=[_PassthroughQueueHandler(log_queue)],
+        level=getattr(logging, log_level.upper()),
+        force=True,
+    )
+    _listener = _BatchingQueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
 
     structlog.configure(
-        processors=processors,
+        # filter_by_level first: records below the level are dropped before
+        # any timestamping runs. Tracebacks are formatted by the listener.
+        processors=[
+            structlog.stdlib.filter_by_level,
+            *_BASE_PROCESSORS,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+        ],
         wrapper_class=structlog.stdlib.BoundLogger,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
@@ -82,6 +213,7 @@ def configure_logging(  # pragma: no cover
     )
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """
     Get a structured logger instance.
@@ -95,9 +227,14 @@ def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     Example:
         >>> logger = get_logger(__name__)
         >>> logger.info("order_book_update", symbol="BTCUSDT", latency_us=45.3)
+
+    Note:
+        Loggers are cached per name; call ``get_logger.cache_clear()`` after
+        reconfiguring logging to hand out fresh instances.
     """
-    # structlog.get_logger() returns Any, but we know it's a BoundLogger
-    return cast(structlog.stdlib.BoundLogger, structlog.get_logger(name))
+    # structlog.get_logger() returns Any, but we know it's a BoundLogger.
+    # Interned on cache miss so every logger for a name shares one string.
+    return cast(structlog.stdlib.BoundLogger, structlog.get_logger(sys.intern(name)))
 
 
 class PerformanceLogger:
@@ -112,6 +249,18 @@ class PerformanceLogger:
         # Logs: {"event": "order_book_update", "duration_ms": 0.045, "symbol": "BTCUSDT"}
     """
 
+    # One instance per measured operation; no per-instance __dict__
+    __slots__ = (
+        "logger",
+        "operation",
+        "threshold_ms",
+        "context",
+        "start_ns",
+        "_base",
+        "_log",
+        "_debug_on",
+    )
+
     def __init__(
         self,
         logger: structlog.stdlib.BoundLogger,
@@ -132,31 +281,124 @@ class PerformanceLogger:
         self.operation = operation
         self.threshold_ms = threshold_ms
         self.context = context
-        self.start_time: float | None = None
+        self.start_ns: int | None = None
+        # Merged once so the per-exit payload only has to add duration_ms.
+        # Emitting with **self._base plus keywords is as cheap as a dict | merge,
+        # and records must go through structlog (not stdlib extra=) so the
+        # listener's ProcessorFormatter receives an event dict
+        self._base = {"operation": operation, **context}
+        # get_logger() hands out lazy proxies whose every attribute access
+        # re-enters bind(); resolve to the concrete logger once
+        self._log: Any = logger if isinstance(logger, structlog.BoundLoggerBase) else logger.bind()
+        # stdlib-backed loggers expose isEnabledFor; structlog's default
+        # filtering loggers (before configure_logging) use is_enabled_for
+        is_enabled_for = getattr(self._log, "isEnabledFor", None) or self._log.is_enabled_for
+        # Instances live for one operation, so the level is sampled up front
+        self._debug_on: bool = is_enabled_for(logging.DEBUG)
 
     def __enter__(self) -> "PerformanceLogger":
         """Start timing."""
-        self.start_time = time.perf_counter()
+        self.start_ns = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Stop timing and log duration."""
-        if self.start_time is None:
+        if self.start_ns is None:
             return
 
-        duration_ms = (time.perf_counter() - self.start_time) * 1000
+        duration_ms = (time.perf_counter_ns() - self.start_ns) / 1_000_000
 
-        log_data = {
-            "operation": self.operation,
-            "duration_ms": round(duration_ms, 3),
-            **self.context,
-        }
+        # Fast exit for the common case: no error, under threshold, DEBUG off
+        if exc_type is None and not self._debug_on and duration_ms <= self.threshold_ms:
+            return
 
         if exc_type is not None:
-            self.logger.error(
-                "operation_failed", **log_data, error=str(exc_val), error_type=exc_type.__name__
+            self._log.error(
+                "operation_failed",
+                **self._base,
+                duration_ms=duration_ms,
+                error=str(exc_val),
+                error_type=exc_type.__name__,
+                exc_info=(exc_type, exc_val, exc_tb),
             )
         elif duration_ms > self.threshold_ms:
-            self.logger.warning("slow_operation", **log_data)
+            self._log.warning("slow_operation", **self._base, duration_ms=duration_ms)
         else:
-            self.logger.debug("operation_complete", **log_data)
+            self._log.debug("operation_complete", **self._base, duration_ms=duration_ms)
+
+
+# BinaryPerformanceLogger state lives at module level: rebinding a class
+# attribute on every exit would invalidate the type's attribute caches
+_BINARY_RING_CAPACITY = 65536
+_binary_ring = array("Q", bytes(16 * _BINARY_RING_CAPACITY))
+_binary_written = 0
+_binary_names: list[str] = []
+_binary_ids: dict[str, int] = {}
+
+
+class BinaryPerformanceLogger:
+    """
+    Allocation-free timer for per-message hot paths.
+
+    Instead of emitting a log record, each exit appends a fixed-width
+    ``(operation_id, duration_ns)`` pair to a shared ring buffer. Operation
+    names are mapped to ids once, at construction, so create one instance per
+    call site and reuse it (instances are not reentrant). Buffered timings are
+    decoded back to names by ``drain()``, off the hot path.
+
+    Example:
+        >>> timer = BinaryPerformanceLogger("order_book_update")
+        >>> with timer:
+        ...     # Apply depth update
+        ...     pass
+        >>> BinaryPerformanceLogger.drain()
+        [('order_book_update', 0.000412)]
+    """
+
+    capacity = _BINARY_RING_CAPACITY
+
+    __slots__ = ("operation_id", "_start_ns")
+
+    def __init__(self, operation: str):
+        """
+        Initialize binary performance logger.
+
+        Args:
+            operation: Name of the operation being measured
+        """
+        if operation not in _binary_ids:
+            _binary_ids[operation] = len(_binary_names)
+            _binary_names.append(operation)
+        self.operation_id = _binary_ids[operation]
+        self._start_ns = 0
+
+    def __enter__(self) -> "BinaryPerformanceLogger":
+        """Start timing."""
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Stop timing and append the record; exceptions propagate untouched."""
+        global _binary_written
+        slot = (_binary_written % _BINARY_RING_CAPACITY) << 1
+        _binary_ring[slot] = self.operation_id
+        _binary_ring[slot + 1] = time.perf_counter_ns() - self._start_ns
+        _binary_written += 1
+
+    @classmethod
+    def drain(cls) -> list[tuple[str, float]]:
+        """
+        Decode and clear buffered timings.
+
+        Returns:
+            (operation, duration_ms) tuples, oldest first. Only the most
+            recent ``capacity`` records survive if the ring wrapped.
+        """
+        global _binary_written
+        written, capacity = _binary_written, _BINARY_RING_CAPACITY
+        records = []
+        for n in range(max(0, written - capacity), written):
+            slot = (n % capacity) << 1
+            records.append((_binary_names[_binary_ring[slot]], _binary_ring[slot + 1] / 1_000_000))
+        _binary_written = 0
+        return records
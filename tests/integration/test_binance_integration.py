@@ -13,63 +13,62 @@ to test against the actual Binance API (not recommended in CI).
 
 import asyncio
 import os
-import sys
 from decimal import Decimal
-from pathlib import Path
+from types import MappingProxyType
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
-from liquidity_monitor.connectors.binance_futures import BinanceOrderBookManager  # noqa: E402
-from liquidity_monitor.core.orderbook import OrderBook  # noqa: E402
+from liquidity_monitor.connectors.binance_futures import BinanceOrderBookManager
+from liquidity_monitor.connectors.multi_exchange import MultiExchangeManager
+from liquidity_monitor.core.orderbook import OrderBook
 
 # Test configuration
 USE_REAL_API = os.getenv("USE_REAL_API", "false").lower() == "true"
 
 
-# Fixtures for mock data
-@pytest.fixture
+# Fixtures for mock data (module-scoped and read-only, so built once per module)
+@pytest.fixture(scope="module")
 def mock_snapshot_response():
     """Mock REST API snapshot response."""
-    return {
-        "lastUpdateId": 1000000,
-        "E": 1699500000000,  # Event time
-        "T": 1699500000000,  # Transaction time
-        "bids": [
-            ["50000.00", "1.5"],
-            ["49990.00", "2.0"],
-            ["49980.00", "1.0"],
-        ],
-        "asks": [
-            ["50010.00", "1.0"],
-            ["50020.00", "2.5"],
-            ["50030.00", "1.5"],
-        ],
-    }
-
-
-@pytest.fixture
+    return MappingProxyType(
+        {
+            "lastUpdateId": 1000000,
+            "E": 1699500000000,  # Event time
+            "T": 1699500000000,  # Transaction time
+            "bids": (
+                ("50000.00", "1.5"),
+                ("49990.00", "2.0"),
+                ("49980.00", "1.0"),
+            ),
+            "asks": (
+                ("50010.00", "1.0"),
+                ("50020.00", "2.5"),
+                ("50030.00", "1.5"),
+            ),
+        }
+    )
+
+
+@pytest.fixture(scope="module")
 def mock_ws_update():
     """Mock WebSocket depth update message."""
-    return {
-        "e": "depthUpdate",
-        "E": 1699500001000,
-        "T": 1699500001000,
-        "s": "BTCUSDT",
-        "U": 1000001,  # First update ID
-        "u": 1000010,  # Final update ID
-        "pu": 1000000,  # Previous final update ID
-        "b": [  # Bids to update
-            ["50005.00", "3.0"],
-            ["49995.00", "1.5"],
-        ],
-        "a": [  # Asks to update
-            ["50015.00", "2.0"],
-        ],
-    }
+    return MappingProxyType(
+        {
+            "e": "depthUpdate",
+            "E": 1699500001000,
+            "T": 1699500001000,
+            "s": "BTCUSDT",
+            "U": 1000001,  # First update ID
+            "u": 1000010,  # Final update ID
+            "pu": 1000000,  # Previous final update ID
+            "b": (  # Bids to update
+                ("50005.00", "3.0"),
+                ("49995.00", "1.5"),
+            ),
+            "a": (("50015.00", "2.0"),),  # Asks to update
+        }
+    )
 
 
 @pytest.mark.integration
@@ -282,6 +281,137 @@ class TestBinanceOrderBookManagerMocked:
         assert stats["symbol"] == "BTCUSDT"
         assert stats["last_update_id"] == 2000010
 
+    @pytest.mark.asyncio
+    async def test_stop_interrupts_reconnect_backoff(self):
+        """Test that stop() wakes run() during backoff instead of waiting out the delay."""
+        manager = BinanceOrderBookManager("BTCUSDT", reconnect_delay=30.0)
+
+        with patch.object(manager, "connect", AsyncMock(side_effect=OSError("network down"))):
+            run_task = asyncio.create_task(manager.run())
+            await asyncio.sleep(0.05)  # Let run() fail once and enter backoff
+
+            manager.stop()
+            await asyncio.wait_for(run_task, timeout=1.0)
+
+        assert manager.reconnect_count == 1
+
+    @pytest.mark.asyncio
+    async def test_sync_circuit_breaker_uses_max_delay(self):
+        """Test that repeated sync failures jump the backoff to max_reconnect_delay."""
+        manager = BinanceOrderBookManager("BTCUSDT", reconnect_delay=0.01, max_reconnect_delay=30.0)
+        manager.sync_failure_threshold = 2
+        delays = []
+
+        async def record_backoff(delay):
+            delays.append(delay)
+            if len(delays) == 3:
+                manager.stop()
+
+        with (
+            patch.object(manager, "connect", AsyncMock()),
+            patch.object(
+                manager, "_sync_orderbook", AsyncMock(side_effect=ValueError("sync failed"))
+            ),
+            patch.object(manager, "_backoff", side_effect=record_backoff),
+        ):
+            await asyncio.wait_for(manager.run(), timeout=1.0)
+
+        assert delays == [0.01, 30.0, 30.0]
+        assert manager.get_status()["consecutive_sync_failures"] == 3
+
+    @pytest.mark.asyncio
+    async def test_missing_snapshot_trips_sync_circuit_breaker(self):
+        """Test that a snapshot endpoint returning nothing counts as a sync failure."""
+        manager = BinanceOrderBookManager("BTCUSDT", reconnect_delay=0.01, max_reconnect_delay=30.0)
+        manager.sync_failure_threshold = 2
+        delays = []
+
+        async def fill_buffer_and_wait():
+            # Satisfy the warm-up at once, then idle like a healthy listener
+            manager.update_buffer.extend({"U": 0, "u": 0} for _ in range(10))
+            await asyncio.Event().wait()
+
+        async def record_backoff(delay):
+            delays.append(delay)
+            if len(delays) == 3:
+                manager.stop()
+
+        real_sleep = asyncio.sleep
+
+        async def skip_retry_wait(delay):
+            await real_sleep(0)  # Still yield so the listener gets to run
+
+        with (
+            patch.object(manager, "connect", AsyncMock()),
+            patch.object(manager, "_listen_and_buffer", side_effect=fill_buffer_and_wait),
+            patch.object(manager, "fetch_snapshot", AsyncMock(return_value=None)),
+            patch.object(manager, "_backoff", side_effect=record_backoff),
+            patch(
+                "liquidity_monitor.connectors.binance_futures.asyncio.sleep",
+                side_effect=skip_retry_wait,
+            ),
+        ):
+            await asyncio.wait_for(manager.run(), timeout=1.0)
+
+        assert delays == [0.01, 30.0, 30.0]
+        assert manager.get_status()["consecutive_sync_failures"] == 3
+        assert not manager.is_synchronized
+
+    @pytest.mark.asyncio
+    async def test_stop_tears_down_running_listener(self):
+        """Test that stop() during a live session cancels the listener before run() returns."""
+        manager = BinanceOrderBookManager("BTCUSDT")
+        listener_cancelled = asyncio.Event()
+
+        async def listen_forever():
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                listener_cancelled.set()
+                raise
+
+        with (
+            patch.object(manager, "connect", AsyncMock()),
+            patch.object(manager, "_sync_orderbook", AsyncMock()),
+            patch.object(manager, "_listen_and_buffer", side_effect=listen_forever),
+        ):
+            run_task = asyncio.create_task(manager.run())
+            await asyncio.sleep(0.05)  # Let run() sync and settle into the session
+
+            manager.stop()
+            await asyncio.wait_for(run_task, timeout=1.0)
+
+        assert listener_cancelled.is_set()
+        assert manager._listener_task is None
+
+    def test_verify_orderbook_integrity(self, mock_snapshot_response):
+        """Test integrity check rejects an empty book and accepts a populated one."""
+        manager = BinanceOrderBookManager("BTCUSDT")
+
+        assert manager.verify_orderbook_integrity() is False
+
+        manager.orderbook.apply_snapshot(
+            bids=mock_snapshot_response["bids"],
+            asks=mock_snapshot_response["asks"],
+            last_update_id=mock_snapshot_response["lastUpdateId"],
+        )
+
+        assert manager.verify_orderbook_integrity() is True
+
+    def test_get_status_json_is_cached(self):
+        """Test that status JSON matches get_status() and is served from cache."""
+        import json
+
+        manager = BinanceOrderBookManager("BTCUSDT")
+
+        payload = manager.get_status_json()
+        assert isinstance(payload, bytes)
+        assert json.loads(payload)["symbol"] == "BTCUSDT"
+
+        manager.message_count = 42
+        assert manager.get_status_json() is payload  # Within max_age: cached bytes
+        assert json.loads(manager.get_status_json(max_age=0))["message_count"] == 42
+
     # DELETED: Dead code testing private methods that no longer exist
     # - test_reconnection_logic (used _handle_disconnect)
     # Previous tests for _process_depth_update merged into test_websocket_message_processing_integration above
@@ -382,5 +512,97 @@ class TestOrderBookIntegration:
         assert stats["spread_bps"] > 0
 
 
+@pytest.mark.integration
+class TestMultiExchangeManager:
+    """Integration tests for concurrent multi-exchange management."""
+
+    @pytest.mark.asyncio
+    async def test_failing_exchange_does_not_stop_others(self):
+        """Test that one exchange raising leaves the other running to completion."""
+        manager = MultiExchangeManager("BTCUSDT")
+        finished = []
+
+        async def bybit_run():
+            await asyncio.sleep(0.05)
+            finished.append("bybit")
+
+        with (
+            patch.object(
+                manager.exchanges["binance"], "run", AsyncMock(side_effect=OSError("boom"))
+            ),
+            patch.object(manager.exchanges["bybit"], "run", side_effect=bybit_run),
+        ):
+            await asyncio.wait_for(manager.run(), timeout=1.0)
+
+        assert finished == ["bybit"]
+        assert manager.is_running is False
+
+    @pytest.mark.asyncio
+    async def test_stop_waits_for_exchange_tasks(self):
+        """Test that stop() signals every exchange and awaits their tasks."""
+        manager = MultiExchangeManager("BTCUSDT")
+        binance, bybit = manager.exchanges["binance"], manager.exchanges["bybit"]
+
+        async def binance_run():
+            await binance._stop_event.wait()
+
+        async def bybit_run():
+            await bybit._stop_event.wait()
+
+        with (
+            patch.object(binance, "run", side_effect=binance_run),
+            patch.object(bybit, "run", side_effect=bybit_run),
+        ):
+            run_task = asyncio.create_task(manager.run())
+            await asyncio.sleep(0.05)
+            tasks = list(manager._tasks)
+            assert len(tasks) == 2 and not any(task.done() for task in tasks)
+
+            await asyncio.wait_for(manager.stop(), timeout=1.0)
+
+            assert all(task.done() for task in tasks)
+            assert manager._tasks == []
+            await asyncio.wait_for(run_task, timeout=1.0)
+
+    def test_arbitrage_picks_cross_exchange_extremes(self):
+        """Test arbitrage buys the lowest ask and sells the highest bid."""
+        manager = MultiExchangeManager("BTCUSDT")
+        binance, bybit = manager.exchanges["binance"], manager.exchanges["bybit"]
+
+        binance.orderbook.apply_snapshot([["50000.00", "1.0"]], [["50010.00", "1.0"]], 1)
+        bybit.orderbook.apply_snapshot([["49980.00", "1.0"]], [["49995.00", "1.0"]], 1)
+
+        # Not synchronized yet -> no comparison
+        assert manager.get_arbitrage_opportunities() is None
+
+        binance.is_synchronized = bybit.is_synchronized = True
+        result = manager.get_arbitrage_opportunities()
+
+        assert result is not None
+        assert result["arbitrage_exists"] is True
+        assert result["buy_from"] == "bybit"
+        assert result["buy_price"] == 49995.00
+        assert result["sell_to"] == "binance"
+        assert result["sell_price"] == 50000.00
+
+    def test_arbitrage_skips_books_updated_too_far_apart(self):
+        """Test that skewed book timestamps are reported instead of compared."""
+        manager = MultiExchangeManager("BTCUSDT")
+        binance, bybit = manager.exchanges["binance"], manager.exchanges["bybit"]
+
+        binance.orderbook.apply_snapshot([["50000.00", "1.0"]], [["50010.00", "1.0"]], 1)
+        bybit.orderbook.apply_snapshot([["49980.00", "1.0"]], [["49995.00", "1.0"]], 1)
+        binance.is_synchronized = bybit.is_synchronized = True
+
+        bybit.orderbook.last_update_ts -= 1.0  # Bybit book is 1s older
+
+        result = manager.get_arbitrage_opportunities()
+
+        assert result is not None
+        assert result["arbitrage_exists"] is False
+        assert result["reason"] == "stale_book"
+        assert result["skew_ms"] > manager.max_book_skew_ms
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-m", "integration"])
@@ -0,0 +1,66 @@
+"""
+Unit tests for LatencyMonitor.
+
+Tests cover:
+- record_latency_batch() matching per-sample record_latency()
+- Clock-skew clamping and warning/critical classification in batches
+"""
+
+import numpy as np
+import pytest
+
+from liquidity_monitor.utils.latency_monitor import LatencyMonitor
+
+
+@pytest.fixture
+def timestamps():
+    """Exchange/local timestamp pairs spanning every latency band."""
+    rng = np.random.default_rng(42)
+    exchange = 1_700_000_000_000.0 + np.arange(300) * 100.0
+    latencies = rng.uniform(0.0, 40.0, size=300)
+    latencies[::17] = -3.5  # Exchange clock ahead of ours
+    latencies[5::23] = 75.25  # Warning band
+    latencies[7::29] = 150.0  # Critical band
+    latencies[11] = 50.0  # Exactly on the warning threshold
+    latencies[13] = 100.0  # Exactly on the critical threshold
+    return exchange, exchange + latencies
+
+
+class TestRecordLatencyBatch:
+    """Test that batched recording matches the per-sample path."""
+
+    def test_batch_matches_per_sample(self, timestamps):
+        """Test counters, window and statistics agree with record_latency()."""
+        exchange, local = timestamps
+        # Smaller than the sample count so the rolling window wraps
+        single = LatencyMonitor(window_size=256)
+        batched = LatencyMonitor(window_size=256)
+
+        expected = [single.record_latency(e, t) for e, t in zip(exchange, local)]
+        recorded = np.concatenate(
+            [
+                batched.record_latency_batch(exchange_chunk, local_chunk)
+                for exchange_chunk, local_chunk in zip(
+                    np.array_split(exchange, 5), np.array_split(local, 5)
+                )
+            ]
+        )
+
+        assert recorded.tolist() == expected
+        assert list(batched.latency_samples) == list(single.latency_samples)
+        assert batched.total_messages == single.total_messages == 300
+        assert batched.warning_count == single.warning_count
+        assert batched.critical_count == single.critical_count
+        assert batched.critical_count > 0 and batched.warning_count > 0
+        assert batched.min_latency_ms == single.min_latency_ms == 0.0
+        assert batched.get_statistics() == single.get_statistics()
+
+    def test_empty_batch_records_nothing(self):
+        """Test an empty batch leaves the monitor untouched."""
+        monitor = LatencyMonitor()
+
+        recorded = monitor.record_latency_batch(np.array([]), np.array([]))
+
+        assert recorded.size == 0
+        assert monitor.total_messages == 0
+        assert monitor.get_statistics()["status"] == "no_data"
@@ -0,0 +1,90 @@
+"""
+Unit tests for the logging utilities.
+
+Tests cover:
+- BinaryPerformanceLogger ring buffer recording
+- Decoding of buffered timings by drain()
+- Ring wrap-around at capacity
+"""
+
+import itertools
+
+import pytest
+
+from liquidity_monitor.utils import logger as logger_module
+from liquidity_monitor.utils.logger import BinaryPerformanceLogger
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Deterministic perf_counter_ns: each call advances the clock by 1.5ms."""
+    ticks = itertools.count(step=1_500_000)
+    monkeypatch.setattr(logger_module.time, "perf_counter_ns", lambda: next(ticks))
+    BinaryPerformanceLogger.drain()  # Start from an empty ring
+    yield
+    BinaryPerformanceLogger.drain()
+
+
+class TestBinaryPerformanceLogger:
+    """Test the binary ring-buffer timer."""
+
+    def test_drain_decodes_names_and_durations(self, fake_clock):
+        """Test drain returns (operation, ms) pairs, oldest first."""
+        update_timer = BinaryPerformanceLogger("test_depth_update")
+        snapshot_timer = BinaryPerformanceLogger("test_snapshot")
+
+        with update_timer:
+            pass
+        with snapshot_timer:
+            pass
+        with update_timer:
+            pass
+
+        assert BinaryPerformanceLogger.drain() == [
+            ("test_depth_update", 1.5),
+            ("test_snapshot", 1.5),
+            ("test_depth_update", 1.5),
+        ]
+
+    def test_same_operation_shares_id(self):
+        """Test operation names map to one id across instances."""
+        first = BinaryPerformanceLogger("test_shared_operation")
+        second = BinaryPerformanceLogger("test_shared_operation")
+
+        assert first.operation_id == second.operation_id
+
+    def test_exception_is_recorded_and_propagates(self, fake_clock):
+        """Test a failing block is still timed and the exception is not swallowed."""
+        timer = BinaryPerformanceLogger("test_failing_operation")
+
+        with pytest.raises(ValueError):
+            with timer:
+                raise ValueError("boom")
+
+        assert BinaryPerformanceLogger.drain() == [("test_failing_operation", 1.5)]
+
+    def test_ring_wraps_at_capacity(self, fake_clock):
+        """Test only the most recent capacity records survive a wrap."""
+        old_timer = BinaryPerformanceLogger("test_wrap_old")
+        new_timer = BinaryPerformanceLogger("test_wrap_new")
+        capacity = BinaryPerformanceLogger.capacity
+
+        for _ in range(3):
+            with old_timer:
+                pass
+        for _ in range(capacity):
+            with new_timer:
+                pass
+
+        records = BinaryPerformanceLogger.drain()
+
+        assert len(records) == capacity
+        assert {name for name, _ in records} == {"test_wrap_new"}
+
+    def test_drain_empties_buffer(self, fake_clock):
+        """Test a second drain returns nothing."""
+        with BinaryPerformanceLogger("test_drain_once"):
+            pass
+
+        assert len(BinaryPerformanceLogger.drain()) == 1
+        assert BinaryPerformanceLogger.drain() == []
@@ -11,25 +11,28 @@ Tests cover:
 - Edge cases (empty book, zero quantities)
 """
 
-import sys
 from decimal import Decimal
-from pathlib import Path
 
 import pytest
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
+from liquidity_monitor.core.orderbook import OrderBook
 
-from liquidity_monitor.core.orderbook import OrderBook  # noqa: E402
+# 10-level ladders, 10 apart, built once at import: best bid 50000, best ask 50010
+_BID_LADDER = [(Decimal(f"{50000 - i * 10}.00"), Decimal("1.0")) for i in range(10)]
+_ASK_LADDER = [(Decimal(f"{50010 + i * 10}.00"), Decimal("1.0")) for i in range(10)]
+
+
+@pytest.fixture
+def book():
+    """Fresh, empty BTCUSDT order book."""
+    return OrderBook("BTCUSDT")
 
 
 class TestOrderBookBasics:
     """Test basic order book operations."""
 
-    def test_initialization(self):
+    def test_initialization(self, book):
         """Test order book initializes empty."""
-        book = OrderBook("BTCUSDT")
-
         assert book.symbol == "BTCUSDT"
         assert len(book.bids) == 0
         assert len(book.asks) == 0
@@ -37,52 +40,77 @@ class TestOrderBookBasics:
         assert book.get_best_bid() is None
         assert book.get_best_ask() is None
 
-    def test_update_bid_single_level(self):
+    def test_update_bid_single_level(self, book):
         """Test adding a single bid level."""
-        book = OrderBook("BTCUSDT")
-
         book.update_bid(Decimal("50000.00"), Decimal("1.5"))
 
         assert len(book.bids) == 1
         assert book.bids[Decimal("50000.00")] == Decimal("1.5")
 
-    def test_update_ask_single_level(self):
+    def test_update_ask_single_level(self, book):
         """Test adding a single ask level."""
-        book = OrderBook("BTCUSDT")
-
         book.update_ask(Decimal("50010.00"), Decimal("2.0"))
 
         assert len(book.asks) == 1
         assert book.asks[Decimal("50010.00")] == Decimal("2.0")
 
-    def test_update_bid_zero_quantity_removes(self):
-        """Test that zero quantity removes bid level."""
-        book = OrderBook("BTCUSDT")
-
-        book.update_bid(Decimal("50000.00"), Decimal("1.5"))
-        assert len(book.bids) == 1
-
-        book.update_bid(Decimal("50000.00"), Decimal("0"))
-        assert len(book.bids) == 0
-
-    def test_update_ask_zero_quantity_removes(self):
-        """Test that zero quantity removes ask level."""
-        book = OrderBook("BTCUSDT")
-
-        book.update_ask(Decimal("50010.00"), Decimal("2.0"))
-        assert len(book.asks) == 1
-
-        book.update_ask(Decimal("50010.00"), Decimal("0"))
-        assert len(book.asks) == 0
+    @pytest.mark.parametrize(
+        "side, price",
+        [("bid", Decimal("50000.00")), ("ask", Decimal("50010.00"))],
+    )
+    def test_update_zero_quantity_removes(self, book, side, price):
+        """Test that zero quantity removes the level on either side."""
+        update = getattr(book, f"update_{side}")
+        levels = getattr(book, f"{side}s")
+
+        update(price, Decimal("1.5"))
+        assert len(levels) == 1
+
+        update(price, Decimal("0"))
+        assert len(levels) == 0
+
+    def test_batch_updates_match_single_level_updates(self, book):
+        """Test that update_bids/update_asks apply levels like update_bid/update_ask."""
+        book.update_bid(Decimal("49990.00"), Decimal("1.0"))
+
+        book.update_bids(
+            [(Decimal("50000.00"), Decimal("1.5")), (Decimal("49990.00"), Decimal("0"))]
+        )
+        book.update_asks(
+            [(Decimal("50010.00"), Decimal("2.0")), (Decimal("50020.00"), Decimal("0"))]
+        )
+
+        assert dict(book.bids) == {Decimal("50000.00"): Decimal("1.5")}
+        assert dict(book.asks) == {Decimal("50010.00"): Decimal("2.0")}
+
+    def test_to_decimal_reuses_and_bounds_cache(self, book):
+        """Test that to_decimal returns cached instances and clears when full."""
+        book._decimal_cache_max = 2
+
+        price = book.to_decimal("50000.10")
+        assert price == Decimal("50000.10")
+        assert book.to_decimal("50000.10") is price
+
+        book.to_decimal("1.5")
+        book.to_decimal("2.5")  # Cache full -> cleared before insert
+        assert len(book._decimal_cache) == 1
+
+    def test_parse_levels_converts_string_pairs(self, book):
+        """Test parse_levels yields Decimal pairs, including zero quantities."""
+        levels = [["50000.10", "1.5"], ["49999.90", "0"]]
+        assert book.parse_levels(levels) == [
+            (Decimal("50000.10"), Decimal("1.5")),
+            (Decimal("49999.90"), Decimal("0")),
+        ]
+        # Second pass is served from the cache with identical results
+        assert book.parse_levels(levels) == book.parse_levels(levels)
 
 
 class TestOrderBookOrdering:
     """Test that order book maintains correct price ordering."""
 
-    def test_bids_sorted_descending(self):
+    def test_bids_sorted_descending(self, book):
         """Test bids are sorted highest to lowest."""
-        book = OrderBook("BTCUSDT")
-
         # Add bids in random order
         book.update_bid(Decimal("50000.00"), Decimal("1.0"))
         book.update_bid(Decimal("49990.00"), Decimal("2.0"))
@@ -93,10 +121,8 @@ class TestOrderBookOrdering:
 
         assert bid_prices == [Decimal("49990.00"), Decimal("50000.00"), Decimal("50005.00")]
 
-    def test_asks_sorted_ascending(self):
+    def test_asks_sorted_ascending(self, book):
         """Test asks are sorted lowest to highest."""
-        book = OrderBook("BTCUSDT")
-
         # Add asks in random order
         book.update_ask(Decimal("50020.00"), Decimal("1.0"))
         book.update_ask(Decimal("50010.00"), Decimal("2.0"))
@@ -107,10 +133,8 @@ class TestOrderBookOrdering:
 
         assert ask_prices == [Decimal("50010.00"), Decimal("50015.00"), Decimal("50020.00")]
 
-    def test_best_bid_is_highest(self):
+    def test_best_bid_is_highest(self, book):
         """Test get_best_bid returns highest bid price."""
-        book = OrderBook("BTCUSDT")
-
         book.update_bid(Decimal("50000.00"), Decimal("1.0"))
         book.update_bid(Decimal("49990.00"), Decimal("2.0"))
         book.update_bid(Decimal("50005.00"), Decimal("1.5"))
@@ -121,10 +145,8 @@ class TestOrderBookOrdering:
         assert best_bid[0] == Decimal("50005.00")
         assert best_bid[1] == Decimal("1.5")
 
-    def test_best_ask_is_lowest(self):
+    def test_best_ask_is_lowest(self, book):
         """Test get_best_ask returns lowest ask price."""
-        book = OrderBook("BTCUSDT")
-
         book.update_ask(Decimal("50020.00"), Decimal("1.0"))
         book.update_ask(Decimal("50010.00"), Decimal("2.0"))
         book.update_ask(Decimal("50015.00"), Decimal("1.5"))
@@ -135,6 +157,29 @@ class TestOrderBookOrdering:
         assert best_ask[0] == Decimal("50010.00")
         assert best_ask[1] == Decimal("2.0")
 
+    def test_best_levels_follow_top_of_book_writes(self, book):
+        """Test cached best bid/ask stay correct as the top level moves."""
+        book.update_bid(Decimal("50000.00"), Decimal("1.0"))
+        book.update_ask(Decimal("50010.00"), Decimal("1.0"))
+        book.get_best_bid()
+        book.get_best_ask()
+
+        # Improve, resize, then remove the best level on each side
+        writes = [
+            ("50005.00", "2.0", "50008.00", "2.0"),
+            ("50005.00", "3.0", "50008.00", "3.0"),
+            ("50005.00", "0", "50008.00", "0"),
+        ]
+        for bid_price, bid_qty, ask_price, ask_qty in writes:
+            book.update_bid(Decimal(bid_price), Decimal(bid_qty))
+            book.update_ask(Decimal(ask_price), Decimal(ask_qty))
+
+            assert book.get_best_bid() == book.bids.peekitem(-1)
+            assert book.get_best_ask() == book.asks.peekitem(0)
+            assert (
+                book.get_mid_price() == (book.bids.peekitem(-1)[0] + book.asks.peekitem(0)[0]) / 2
+            )
+
 
 class TestOrderBookMetrics:
     """Test order book metric calculations."""
@@ -191,6 +236,50 @@ class TestOrderBookMetrics:
 
         assert book.get_spread_bps() is None
 
+    def test_cached_metrics_follow_top_of_book_writes(self):
+        """Test cached best bid/ask and mid-price are invalidated by writes."""
+        book = OrderBook("BTCUSDT")
+
+        book.update_bid(Decimal("50000.00"), Decimal("1.0"))
+        book.update_ask(Decimal("50010.00"), Decimal("1.0"))
+        assert book.get_mid_price() == Decimal("50005.00")
+
+        # Deeper level leaves the top of book unchanged
+        book.update_bid(Decimal("49990.00"), Decimal("1.0"))
+        assert book.get_best_bid() == (Decimal("50000.00"), Decimal("1.0"))
+
+        # Removing the best bid exposes the next level
+        book.update_bid(Decimal("50000.00"), Decimal("0"))
+        assert book.get_best_bid() == (Decimal("49990.00"), Decimal("1.0"))
+        assert book.get_mid_price() == Decimal("50000.00")
+
+        # Batch and clear paths invalidate too
+        book.update_asks([(Decimal("50002.00"), Decimal("2.0"))])
+        assert book.get_best_ask() == (Decimal("50002.00"), Decimal("2.0"))
+
+        book.clear()
+        assert book.get_best_bid() is None
+        assert book.get_mid_price() is None
+
+    def test_snapshot_is_shared_until_top_of_book_changes(self):
+        """Test get_snapshot reuses one immutable view between writes."""
+        book = OrderBook("BTCUSDT")
+        book.apply_snapshot([["50000.00", "1.0"]], [["50010.00", "1.0"]], 100)
+
+        snapshot = book.get_snapshot()
+        assert snapshot.mid_price == Decimal("50005.00")
+        assert snapshot.last_update_id == 100
+        assert book.get_snapshot() is snapshot
+
+        with pytest.raises(AttributeError):
+            snapshot.mid_price = Decimal("0")  # type: ignore[misc]
+
+        book.apply_update([["50002.00", "1.0"]], [], 101, 101)
+        refreshed = book.get_snapshot()
+        assert refreshed is not snapshot
+        assert refreshed.best_bid == (Decimal("50002.00"), Decimal("1.0"))
+        assert refreshed.last_update_id == 101
+
 
 class TestOrderBookSnapshot:
     """Test snapshot application."""
@@ -306,6 +395,48 @@ class TestOrderBookUpdate:
         assert result is False
         assert book.last_update_id == 100
 
+    def test_rejected_update_skips_level_parsing(self):
+        """Test that dropped updates never reach the Decimal parser."""
+        book = OrderBook("BTCUSDT")
+        book.apply_snapshot([["50000.00", "1.5"]], [["50010.00", "1.0"]], 100)
+        book._decimal_cache.clear()
+
+        result = book.apply_update([["49000.00", "9.9"]], [], 50, 99)
+
+        assert result is False
+        assert "49000.00" not in book._decimal_cache
+
+    def test_rejected_updates_are_counted(self):
+        """Test that rejections increment counters reported by get_stats."""
+        book = OrderBook("BTCUSDT")
+        book.apply_snapshot([["50000.00", "1.5"]], [["50010.00", "1.0"]], 100)
+
+        assert book.apply_update([], [], 50, 99) is False
+        assert book.apply_update([], [], 100, 105) is True
+        assert book.apply_update([], [], 90, 110) is False
+
+        assert book.invalid_first_update_count == 1
+        assert book.backwards_update_count == 1
+
+        stats = book.get_stats()
+        assert stats["invalid_first_updates"] == 1
+        assert stats["backwards_updates"] == 1
+
+    def test_new_snapshot_restores_first_update_validation(self):
+        """Test that a re-snapshot requires the next update to bridge it again."""
+        book = OrderBook("BTCUSDT")
+        book.apply_snapshot([["50000.00", "1.5"]], [["50010.00", "1.0"]], 100)
+        assert book.apply_update([], [], 101, 105) is True
+        assert book.apply_update([], [], 110, 120) is True  # Gap allowed after first
+
+        book.apply_snapshot([["50000.00", "1.5"]], [["50010.00", "1.0"]], 200)
+
+        # Would pass the lenient check, but does not bridge lastUpdateId+1
+        assert book.apply_update([], [], 205, 210) is False
+        assert book.invalid_first_update_count == 1
+        assert book.apply_update([], [], 195, 201) is True
+        assert book.last_update_id == 201
+
     def test_apply_update_allows_gaps_in_sequence(self):
         """Test that gaps in sequence are allowed (for @depth@100ms)."""
         book = OrderBook("BTCUSDT")
@@ -331,9 +462,9 @@ class TestOrderBookDepth:
         book = OrderBook("BTCUSDT")
 
         # Add multiple levels
-        for i in range(10):
-            book.update_bid(Decimal(f"{50000 - i * 10}.00"), Decimal("1.0"))
-            book.update_ask(Decimal(f"{50010 + i * 10}.00"), Decimal("1.0"))
+        for (bid_price, bid_qty), (ask_price, ask_qty) in zip(_BID_LADDER, _ASK_LADDER):
+            book.update_bid(bid_price, bid_qty)
+            book.update_ask(ask_price, ask_qty)
 
         depth = book.get_depth(levels=5)
 
@@ -357,6 +488,73 @@ class TestOrderBookDepth:
         assert len(depth["bids"]) == 0
         assert len(depth["asks"]) == 0
 
+    def test_depth_window_cache_follows_writes(self):
+        """Test get_depth reuses its top-N window until a write lands inside it."""
+        book = OrderBook("BTCUSDT")
+
+        for price, qty in _BID_LADDER:
+            book.update_bid(price, qty)
+
+        depth = book.get_depth(levels=5)
+        window = book._bid_top
+
+        # Deeper write keeps the window; smaller requests are sliced from it
+        book.update_bid(Decimal("49900.00"), Decimal("3.0"))
+        assert book._bid_top is window
+        assert book.get_depth(levels=3)["bids"] == depth["bids"][:3]
+
+        # Callers get copies, not the cached list
+        depth["bids"].clear()
+        assert len(book.get_depth(levels=5)["bids"]) == 5
+
+        # Write inside the window refreshes it
+        book.update_bid(Decimal("49980.00"), Decimal("7.0"))
+        assert book.get_depth(levels=5)["bids"][2] == (Decimal("49980.00"), Decimal("7.0"))
+
+    def test_checksum_cache_tracks_top_levels(self):
+        """Test cached checksum survives deep writes and refreshes on top writes."""
+        book = OrderBook("BTCUSDT")
+
+        for (bid_price, bid_qty), (ask_price, ask_qty) in zip(_BID_LADDER, _ASK_LADDER):
+            book.update_bid(bid_price, bid_qty)
+            book.update_ask(ask_price, ask_qty)
+
+        checksum = book.compute_checksum(depth=5)
+
+        # Level outside the top 5 does not invalidate the cache
+        book.update_bid(Decimal("49900.00"), Decimal("3.0"))
+        assert book._checksum_cache == (5, checksum)
+
+        # Level inside the top 5 changes the checksum
+        book.update_ask(Decimal("50020.00"), Decimal("4.0"))
+        assert book._checksum_cache is None
+        assert book.compute_checksum(depth=5) != checksum
+
+        # Cached value always matches a fresh computation
+        fresh = OrderBook("BTCUSDT")
+        fresh.update_bids(book.bids.items())
+        fresh.update_asks(book.asks.items())
+        assert fresh.compute_checksum(depth=5) == book.compute_checksum(depth=5)
+
+    def test_get_depth_float_follows_writes(self):
+        """Test get_depth_float mirrors get_depth and refreshes with the window."""
+        book = OrderBook("BTCUSDT")
+
+        for (bid_price, _), (ask_price, _) in zip(_BID_LADDER, _ASK_LADDER):
+            book.update_bid(bid_price, Decimal("1.5"))
+            book.update_ask(ask_price, Decimal("2.5"))
+
+        depth = book.get_depth(levels=5)
+        depth_float = book.get_depth_float(levels=5)
+
+        for side in ("bids", "asks"):
+            assert depth_float[side] == [(float(p), float(q)) for p, q in depth[side]]
+
+        # Write inside the window is reflected on the next read
+        book.update_ask(Decimal("50005.00"), Decimal("0.5"))
+        assert book.get_depth_float(levels=5)["asks"][0] == (50005.0, 0.5)
+        assert book.get_depth_float(levels=0) == {"bids": [], "asks": []}
+
 
 class TestOrderBookEdgeCases:
     """Test edge cases and error conditions."""
@@ -396,6 +594,21 @@ class TestOrderBookEdgeCases:
         assert book.bids[Decimal("50000.00")] == Decimal("5.0")
         assert len(book.bids) == 1
 
+    def test_is_crossed_tracks_top_of_book(self):
+        """Test crossed detection follows updates to the best levels."""
+        book = OrderBook("BTCUSDT")
+        assert book.is_crossed() is False
+
+        book.update_bid(Decimal("50000.00"), Decimal("1.0"))
+        book.update_ask(Decimal("50010.00"), Decimal("1.0"))
+        assert book.is_crossed() is False
+
+        book.update_bid(Decimal("50010.00"), Decimal("1.0"))  # Bid == Ask
+        assert book.is_crossed() is True
+
+        book.update_bid(Decimal("50010.00"), Decimal("0"))
+        assert book.is_crossed() is False
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
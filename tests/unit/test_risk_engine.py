@@ -10,18 +10,15 @@ Tests cover:
 - Edge cases (empty order book, insufficient liquidity)
 """
 
-import sys
 from decimal import Decimal
-from pathlib import Path
 
+import numpy as np
 import pytest
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
-
-from liquidity_monitor.analytics.risk_engine import (  # noqa: E402
+from liquidity_monitor.analytics.risk_engine import (
     LiquidityCrunchDetector,
     calculate_depth_at_bps,
+    calculate_depth_at_bps_bands,
     calculate_depth_imbalance,
     calculate_slippage,
 )
@@ -218,6 +215,33 @@ class TestDepthAtBps:
         assert depth["total_depth"] == 0.0
         assert depth["total_depth_usd"] == 0.0
 
+    def test_depth_bands_match_single_band(self):
+        """Test batched bands match one calculate_depth_at_bps call per band."""
+        bids = [
+            (Decimal("49995"), Decimal("1.0")),
+            (Decimal("49950"), Decimal("2.0")),  # Exactly on the 10bps edge
+            (Decimal("49800"), Decimal("3.0")),
+            (Decimal("49000"), Decimal("4.0")),
+        ]
+        asks = [
+            (Decimal("50005"), Decimal("1.5")),
+            (Decimal("50100"), Decimal("2.5")),
+            (Decimal("50250"), Decimal("3.5")),
+            (Decimal("52000"), Decimal("4.5")),
+        ]
+
+        # Unsorted on purpose; results are keyed by band
+        bands = calculate_depth_at_bps_bands(bids, asks, [100, 10, 50])
+
+        assert list(bands) == [100, 10, 50]
+        for bps in (10, 50, 100):
+            assert bands[bps] == calculate_depth_at_bps(bids, asks, bps=bps)
+        assert bands[10]["bid_depth"] == 3.0
+        assert bands[100]["ask_depth"] == 7.5
+
+        # No bands requested: nothing to walk
+        assert calculate_depth_at_bps_bands(bids, asks, []) == {}
+
 
 class TestLiquidityCrunchDetector:
     """Test anomaly detection using Z-score analysis."""
@@ -264,11 +288,8 @@ class TestLiquidityCrunchDetector:
             window_size=100, threshold=2.0, min_samples=30  # Lower threshold for testing
         )
 
-        # Add 40 samples with normal depth
-        for _ in range(40):
-            detector.detect_liquidity_crunch(
-                current_depth=100_000, current_spread=5.0, current_imbalance=0.0
-            )
+        # Prime with 40 samples of normal depth
+        detector.prime(np.full(40, 100_000.0), np.full(40, 5.0), np.zeros(40))
 
         # Add sample with very low depth (should trigger anomaly)
         result = detector.detect_liquidity_crunch(
@@ -285,11 +306,8 @@ class TestLiquidityCrunchDetector:
         """Test detector flags high spread anomaly."""
         detector = LiquidityCrunchDetector(window_size=100, threshold=2.0, min_samples=30)
 
-        # Add 40 samples with normal spread
-        for _ in range(40):
-            detector.detect_liquidity_crunch(
-                current_depth=100_000, current_spread=5.0, current_imbalance=0.0
-            )
+        # Prime with 40 samples of normal spread
+        detector.prime(np.full(40, 100_000.0), np.full(40, 5.0), np.zeros(40))
 
         # Add sample with very high spread (should trigger anomaly)
         result = detector.detect_liquidity_crunch(
@@ -341,6 +359,43 @@ class TestLiquidityCrunchDetector:
         assert stats["depth"]["count"] == 50
         assert stats["spread"]["count"] == 50
 
+    def test_detector_zscore_after_window_wraps(self):
+        """Test running Z-score matches a full recompute once samples are evicted."""
+        detector = LiquidityCrunchDetector(window_size=50, threshold=3.0, min_samples=30)
+
+        # 3 windows' worth, including a spike that is later evicted
+        for i in range(150):
+            depth = 1_000_000 if i == 20 else 100_000 + (i * 7919) % 5000
+            result = detector.detect_liquidity_crunch(current_depth=depth)
+
+        history = np.array(detector.depth_history)
+        expected = (history[-1] - history.mean()) / history.std()
+
+        assert len(detector.depth_history) == 50
+        assert result["depth_zscore"] == pytest.approx(round(expected, 2), abs=0.01)
+
+    def test_detector_prime_matches_sample_by_sample(self):
+        """Test bulk priming leaves the same state as feeding samples one by one."""
+        depths = [100_000 + (i * 7919) % 5000 for i in range(80)]
+        spreads = [5.0 + (i % 7) * 0.1 for i in range(80)]
+
+        primed = LiquidityCrunchDetector(window_size=50, threshold=3.0, min_samples=30)
+        primed.prime(depths, spreads)
+
+        fed = LiquidityCrunchDetector(window_size=50, threshold=3.0, min_samples=30)
+        for depth, spread in zip(depths, spreads):
+            fed.detect_liquidity_crunch(current_depth=depth, current_spread=spread)
+
+        assert list(primed.depth_history) == list(fed.depth_history)
+        assert len(primed.imbalance_history) == 0
+        assert primed.get_statistics() == fed.get_statistics()
+
+        sample = {"current_depth": 60_000, "current_spread": 9.0}
+        primed_result = primed.detect_liquidity_crunch(**sample)
+        fed_result = fed.detect_liquidity_crunch(**sample)
+        assert primed_result["depth_zscore"] == fed_result["depth_zscore"]
+        assert primed_result["spread_zscore"] == fed_result["spread_zscore"]
+
 
 class TestRiskEngineEdgeCases:
     """Test edge cases in risk calculations."""
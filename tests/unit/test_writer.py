@@ -0,0 +1,216 @@
+"""
+Unit tests for DatabaseWriter's snapshot pipeline.
+
+Tests cover:
+- Queued snapshots reaching COPY exactly once across close()
+- Backpressure when the snapshot queue is full
+- Batch sizing for an idle vs a busy pool
+- CSV serialization for COPY and the executemany() fallback
+"""
+
+import asyncio
+import csv
+import io
+from datetime import datetime, timedelta, timezone
+
+import asyncpg
+import pytest
+
+from liquidity_monitor.database.writer import DatabaseWriter
+
+
+class FakePool:
+    """Stand-in for asyncpg.Pool that records each COPY batch by symbol."""
+
+    def __init__(self, size: int = 10, idle: int = 10):
+        self.size = size
+        self.idle = idle
+        self.copied = []
+        self.executed = []
+        self.copy_error: Exception | None = None
+
+    def get_size(self):
+        return self.size
+
+    def get_idle_size(self):
+        return self.idle
+
+    async def copy_to_table(self, table, *, source, columns, format, timeout):
+        await asyncio.sleep(0)  # Yield like a real round-trip would
+        if self.copy_error is not None:
+            raise self.copy_error
+        rows = csv.reader(io.StringIO(source.getvalue().decode()))
+        self.copied.append([row[0] for row in rows])
+
+    async def executemany(self, query, args):
+        self.executed.append((query, list(args)))
+
+    async def close(self):
+        pass
+
+
+def make_writer(pool: FakePool, **kwargs) -> DatabaseWriter:
+    """Build a writer that is 'connected' to the given fake pool."""
+    writer = DatabaseWriter(password="test", max_pool_size=10, **kwargs)
+    writer.pool = pool
+    writer._connected = True
+    return writer
+
+
+METRICS = {"basic": {"mid_price": 50000.0, "spread_bps": 1.0}, "imbalance": 0.1}
+
+
+class TestSnapshotPipeline:
+    """Test the queue -> flusher -> COPY path."""
+
+    @pytest.mark.asyncio
+    async def test_close_writes_every_row_once(self):
+        """Test rows queued both ways are all written, none twice, by close()."""
+        pool = FakePool()
+        writer = make_writer(pool, snapshot_batch_size=7)
+        symbols = [f"SYM{i}" for i in range(100)]
+
+        for symbol in symbols[:50]:
+            assert writer.enqueue_snapshot(symbol, METRICS)
+        await asyncio.sleep(0)  # Let the flusher take a first batch
+        for symbol in symbols[50:]:
+            assert await writer.write_snapshot(symbol, METRICS)
+
+        # The flusher is mid-batch; close() must not lose or repeat its rows
+        await writer.close()
+
+        written = [symbol for batch in pool.copied for symbol in batch]
+        assert sorted(written) == sorted(symbols)
+        assert len(pool.copied) > 1
+        assert writer._flusher_task is None
+
+    @pytest.mark.asyncio
+    async def test_enqueue_returns_false_when_queue_full(self):
+        """Test enqueue_snapshot drops instead of blocking once the queue is full."""
+        pool = FakePool()
+        writer = make_writer(pool, snapshot_queue_size=2)
+
+        accepted = [writer.enqueue_snapshot(f"SYM{i}", METRICS) for i in range(3)]
+
+        assert accepted == [True, True, False]
+
+        await writer.close()
+        assert pool.copied == [["SYM0", "SYM1"]]
+
+    @pytest.mark.asyncio
+    async def test_enqueue_rejected_when_disconnected(self):
+        """Test nothing is queued without a connection pool."""
+        writer = DatabaseWriter(password="test")
+
+        assert not writer.enqueue_snapshot("BTCUSDT", METRICS)
+        assert writer._snapshot_queue.empty()
+
+
+class TestAdaptiveBatching:
+    """Test that _flusher sizes batches by pool load."""
+
+    @pytest.mark.asyncio
+    async def test_idle_pool_writes_when_queue_runs_dry(self):
+        """Test an idle pool writes at once, capped at snapshot_batch_size."""
+        pool = FakePool(size=10, idle=9)
+        # A long interval proves the idle path never waits on it
+        writer = make_writer(pool, snapshot_batch_size=5, snapshot_flush_interval=60.0)
+
+        for i in range(3):
+            writer.enqueue_snapshot(f"SYM{i}", METRICS)
+        await asyncio.sleep(0.01)
+
+        assert [len(batch) for batch in pool.copied] == [3]
+
+        for i in range(3, 15):
+            writer.enqueue_snapshot(f"SYM{i}", METRICS)
+        await asyncio.sleep(0.01)
+
+        assert [len(batch) for batch in pool.copied] == [3, 5, 5, 2]
+
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_busy_pool_grows_batch_until_interval(self):
+        """Test a busy pool holds the batch open for snapshot_flush_interval."""
+        pool = FakePool(size=10, idle=2)  # 8 of 10 checked out
+        writer = make_writer(
+            pool,
+            snapshot_batch_size=5,
+            snapshot_max_batch_size=50,
+            snapshot_flush_interval=0.05,
+        )
+
+        for i in range(20):
+            writer.enqueue_snapshot(f"SYM{i}", METRICS)
+        await asyncio.sleep(0.01)
+
+        # Past snapshot_batch_size, but the interval has not elapsed yet
+        assert pool.copied == []
+
+        await asyncio.sleep(0.1)
+
+        assert [len(batch) for batch in pool.copied] == [20]
+
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_busy_pool_caps_batch_at_max_size(self):
+        """Test a busy pool writes as soon as snapshot_max_batch_size is reached."""
+        pool = FakePool(size=10, idle=5)  # Exactly half checked out counts as busy
+        writer = make_writer(
+            pool,
+            snapshot_batch_size=5,
+            snapshot_max_batch_size=50,
+            snapshot_flush_interval=60.0,
+        )
+
+        for i in range(120):
+            writer.enqueue_snapshot(f"SYM{i}", METRICS)
+        await asyncio.sleep(0.01)
+
+        # Two full batches go out at once; the remainder waits on the interval
+        assert [len(batch) for batch in pool.copied] == [50, 50]
+
+        await writer.close()
+
+        assert [len(batch) for batch in pool.copied] == [50, 50, 20]
+
+
+class TestSnapshotBatchWrite:
+    """Test write_snapshots_batch() and its CSV encoding."""
+
+    def test_csv_encodes_nulls_timestamps_and_floats(self):
+        """Test None is an unquoted empty field and values keep their str() form."""
+        utc_ts = datetime(2024, 1, 2, 3, 4, 5, 123456, tzinfo=timezone.utc)
+        local_ts = datetime(2024, 1, 2, 5, 4, 5, tzinfo=timezone(timedelta(hours=2)))
+        rows = [
+            ("BTCUSDT", "binance_futures", utc_ts, 50000.5, None, 0.1),
+            ("ETHUSDT", "bybit_futures", local_ts, 1e-05, 3, None),
+        ]
+
+        body = DatabaseWriter._snapshots_csv(rows).getvalue()
+
+        assert body == (
+            b"BTCUSDT,binance_futures,2024-01-02 03:04:05.123456+00:00,50000.5,,0.1\n"
+            b"ETHUSDT,bybit_futures,2024-01-02 05:04:05+02:00,1e-05,3,\n"
+        )
+
+    @pytest.mark.asyncio
+    async def test_copy_failure_falls_back_to_executemany(self):
+        """Test a PostgresError from COPY retries the batch with executemany()."""
+        pool = FakePool()
+        pool.copy_error = asyncpg.PostgresError("COPY not supported")
+        writer = make_writer(pool)
+        now = datetime.now(timezone.utc)
+        rows = [
+            DatabaseWriter._snapshot_record(symbol, METRICS, "binance_futures", now)
+            for symbol in ("BTCUSDT", "ETHUSDT")
+        ]
+
+        assert await writer.write_snapshots_batch(rows) == 2
+
+        assert pool.copied == []
+        [(query, args)] = pool.executed
+        assert "INSERT INTO liquidity_snapshots" in query
+        assert args == rows